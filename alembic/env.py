@@ -11,17 +11,10 @@ from alembic import context
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.config import get_settings
-from app.models.base import Base
-
-# Import all models so alembic can detect them
-from app.models.user_model import User
-from app.models.organization_model import Organization
-from app.models.organization_membership_model import OrganizationMembership
-from app.models.project_model import Project
-from app.models.conversation_model import Conversation
-from app.models.message_model import Message
-from app.models.document_model import Document
-from app.models.assistant_preset_model import AssistantPreset
+
+# The models package imports every model and configures the mappers once,
+# so alembic sees the complete metadata
+from app.models import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -42,6 +35,15 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip views mapped as read-only models; their DDL lives in migrations."""
+    if type_ == "table" and object.info.get("is_view"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -64,6 +66,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -87,7 +90,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,36 @@
+"""add stream chunk created_at_ms
+
+Revision ID: 0f6c2d84b7e3
+Revises: b3e9f1a06c52
+Create Date: 2026-10-16 13:05:33.182940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f6c2d84b7e3'
+down_revision: Union[str, Sequence[str], None] = 'b3e9f1a06c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'message_stream_chunks',
+        sa.Column(
+            'created_at_ms',
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text("(extract(epoch from CURRENT_TIMESTAMP) * 1000)::bigint"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('message_stream_chunks', 'created_at_ms')
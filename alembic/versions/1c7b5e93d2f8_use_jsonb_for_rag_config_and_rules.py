@@ -0,0 +1,46 @@
+"""use jsonb for rag_config and rules
+
+Revision ID: 1c7b5e93d2f8
+Revises: e85a3c1f7d20
+Create Date: 2026-10-16 14:37:51.220947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c7b5e93d2f8'
+down_revision: Union[str, Sequence[str], None] = 'e85a3c1f7d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = (
+    ('organizations', 'rag_config'),
+    ('projects', 'rag_config'),
+    ('projects', 'rules'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    op.create_index(
+        'ix_projects_rag_config', 'projects', ['rag_config'],
+        postgresql_using='gin', postgresql_ops={'rag_config': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'ix_projects_rules', 'projects', ['rules'],
+        postgresql_using='gin', postgresql_ops={'rules': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_rules', 'projects')
+    op.drop_index('ix_projects_rag_config', 'projects')
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
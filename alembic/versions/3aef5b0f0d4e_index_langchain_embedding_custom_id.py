@@ -0,0 +1,34 @@
+"""index langchain_pg_embedding custom_id
+
+Revision ID: 3aef5b0f0d4e
+Revises: 7c83d1eab175
+Create Date: 2026-10-16 09:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3aef5b0f0d4e'
+down_revision: Union[str, Sequence[str], None] = '7c83d1eab175'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The embedding table is created by PGVector itself, so it may not exist yet
+    connection = op.get_bind()
+    if connection.dialect.has_table(connection, 'langchain_pg_embedding'):
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_langchain_pg_embedding_custom_id "
+            "ON langchain_pg_embedding (custom_id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_langchain_pg_embedding_custom_id")
@@ -0,0 +1,44 @@
+"""server side uuid defaults
+
+Revision ID: 3b8d0e6f1a29
+Revises: d27b9c05e4a3
+Create Date: 2026-10-16 17:05:41.208713
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d0e6f1a29'
+down_revision: Union[str, Sequence[str], None] = 'd27b9c05e4a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UUID_KEYS = [
+    ('users', 'id'),
+    ('organizations', 'id'),
+    ('projects', 'id'),
+    ('documents', 'id'),
+    ('assistant_presets', 'id'),
+    ('conversations', 'id'),
+    ('messages', 'id'),
+    ('message_attachments', 'id'),
+    ('message_revisions', 'public_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13
+    for table, column in UUID_KEYS:
+        op.alter_column(table, column, server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in UUID_KEYS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,41 @@
+"""store assistant preset tools as bytea
+
+Revision ID: 445a80052d58
+Revises: 3aef5b0f0d4e
+Create Date: 2026-10-16 10:41:27.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '445a80052d58'
+down_revision: Union[str, Sequence[str], None] = '3aef5b0f0d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assistant_presets', sa.Column('tools_blob', sa.LargeBinary(), nullable=True))
+    op.execute("""
+        UPDATE assistant_presets
+        SET tools_blob = convert_to(tools_json::text, 'UTF8')
+        WHERE tools_json IS NOT NULL
+    """)
+    op.drop_column('assistant_presets', 'tools_json')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('assistant_presets', sa.Column('tools_json', postgresql.JSONB(), nullable=True))
+    op.execute("""
+        UPDATE assistant_presets
+        SET tools_json = convert_from(tools_blob, 'UTF8')::jsonb
+        WHERE tools_blob IS NOT NULL
+    """)
+    op.drop_column('assistant_presets', 'tools_blob')
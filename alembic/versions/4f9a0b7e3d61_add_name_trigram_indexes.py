@@ -0,0 +1,38 @@
+"""add name trigram indexes
+
+Revision ID: 4f9a0b7e3d61
+Revises: 8e2d6a41c0b9
+Create Date: 2026-10-16 15:01:40.771528
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f9a0b7e3d61'
+down_revision: Union[str, Sequence[str], None] = '8e2d6a41c0b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_organizations_name")
+    op.create_index(
+        'ix_org_name_trgm', 'organizations', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_projects_name_trgm', 'projects', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_name_trgm', 'projects')
+    op.drop_index('ix_org_name_trgm', 'organizations')
+    op.create_index('ix_organizations_name', 'organizations', ['name'])
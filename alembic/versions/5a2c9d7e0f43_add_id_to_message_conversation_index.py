@@ -0,0 +1,30 @@
+"""add id to message conversation index
+
+Revision ID: 5a2c9d7e0f43
+Revises: e4f17a2c8b90
+Create Date: 2026-10-16 18:12:37.460218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a2c9d7e0f43'
+down_revision: Union[str, Sequence[str], None] = 'e4f17a2c8b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_messages_conv_created', 'messages')
+    op.create_index('ix_messages_conv_created', 'messages', ['conversation_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_conv_created', 'messages')
+    op.create_index('ix_messages_conv_created', 'messages', ['conversation_id', 'created_at'])
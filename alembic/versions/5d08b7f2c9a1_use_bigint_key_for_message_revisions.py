@@ -0,0 +1,35 @@
+"""use bigint key for message revisions
+
+Revision ID: 5d08b7f2c9a1
+Revises: e2a7c40d9f18
+Create Date: 2026-10-16 12:31:50.448213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d08b7f2c9a1'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c40d9f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing UUIDs are kept as the public identifier
+    op.execute("ALTER TABLE message_revisions DROP CONSTRAINT message_revisions_pkey")
+    op.alter_column('message_revisions', 'id', new_column_name='public_id')
+    op.create_unique_constraint('message_revisions_public_id_key', 'message_revisions', ['public_id'])
+    op.execute("ALTER TABLE message_revisions ADD COLUMN id BIGSERIAL PRIMARY KEY")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE message_revisions DROP CONSTRAINT message_revisions_pkey")
+    op.drop_column('message_revisions', 'id')
+    op.drop_constraint('message_revisions_public_id_key', 'message_revisions', type_='unique')
+    op.alter_column('message_revisions', 'public_id', new_column_name='id')
+    op.create_primary_key('message_revisions_pkey', 'message_revisions', ['id'])
@@ -0,0 +1,67 @@
+"""batch message stream chunk deltas
+
+Revision ID: 6954d7ca87bc
+Revises: c858230befce
+Create Date: 2026-10-16 11:37:15.284906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6954d7ca87bc'
+down_revision: Union[str, Sequence[str], None] = 'c858230befce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('message_stream_chunks', sa.Column('seq_start', sa.Integer(), nullable=True))
+    op.add_column('message_stream_chunks', sa.Column('deltas', postgresql.ARRAY(sa.Text()), nullable=True))
+
+    # Existing rows become single-delta batches
+    op.execute("""
+        UPDATE message_stream_chunks
+        SET seq_start = seq, deltas = ARRAY[delta]
+    """)
+
+    op.alter_column('message_stream_chunks', 'seq_start', nullable=False)
+    op.alter_column('message_stream_chunks', 'deltas', nullable=False)
+    op.drop_constraint('uq_message_stream_chunk', 'message_stream_chunks', type_='unique')
+    op.drop_column('message_stream_chunks', 'seq')
+    op.drop_column('message_stream_chunks', 'delta')
+    op.create_unique_constraint('uq_message_stream_chunk', 'message_stream_chunks', ['message_id', 'seq_start'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_message_stream_chunk', 'message_stream_chunks', type_='unique')
+    op.create_table(
+        'message_stream_chunks_unbatched',
+        sa.Column('message_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('delta', sa.Text(), nullable=False),
+    )
+    # Expand each batch back into one row per delta
+    op.execute("""
+        INSERT INTO message_stream_chunks_unbatched (message_id, seq, delta)
+        SELECT c.message_id, c.seq_start + d.ord - 1, d.delta
+        FROM message_stream_chunks c
+        CROSS JOIN LATERAL unnest(c.deltas) WITH ORDINALITY AS d(delta, ord)
+    """)
+    op.execute("DELETE FROM message_stream_chunks")
+    op.drop_column('message_stream_chunks', 'seq_start')
+    op.drop_column('message_stream_chunks', 'deltas')
+    op.add_column('message_stream_chunks', sa.Column('seq', sa.Integer(), nullable=False))
+    op.add_column('message_stream_chunks', sa.Column('delta', sa.Text(), nullable=False))
+    op.execute("""
+        INSERT INTO message_stream_chunks (message_id, seq, delta)
+        SELECT message_id, seq, delta FROM message_stream_chunks_unbatched
+    """)
+    op.drop_table('message_stream_chunks_unbatched')
+    op.create_unique_constraint('uq_message_stream_chunk', 'message_stream_chunks', ['message_id', 'seq'])
@@ -0,0 +1,40 @@
+"""project start date not null
+
+Revision ID: 72e0c5a9d4b1
+Revises: 3b8d0e6f1a29
+Create Date: 2026-10-16 17:24:09.551370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '72e0c5a9d4b1'
+down_revision: Union[str, Sequence[str], None] = '3b8d0e6f1a29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("UPDATE projects SET start_date = created_at WHERE start_date IS NULL")
+    op.alter_column(
+        'projects',
+        'start_date',
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'projects',
+        'start_date',
+        existing_type=sa.DateTime(timezone=True),
+        nullable=True,
+    )
@@ -0,0 +1,93 @@
+"""partition message stream chunks by month
+
+Revision ID: 7a4e19c3b0d6
+Revises: 0f6c2d84b7e3
+Create Date: 2026-10-16 13:24:47.915306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4e19c3b0d6'
+down_revision: Union[str, Sequence[str], None] = '0f6c2d84b7e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table('message_stream_chunks', 'message_stream_chunks_old')
+    op.execute("ALTER TABLE message_stream_chunks_old DROP CONSTRAINT message_stream_chunks_pkey")
+    op.drop_constraint('uq_message_stream_chunk', 'message_stream_chunks_old', type_='unique')
+
+    op.execute("""
+        CREATE TABLE message_stream_chunks (
+            id BIGSERIAL NOT NULL,
+            message_id UUID NOT NULL REFERENCES messages (id) ON DELETE CASCADE,
+            seq_start INTEGER NOT NULL,
+            deltas TEXT[] NOT NULL,
+            created_at_ms BIGINT NOT NULL DEFAULT (extract(epoch from CURRENT_TIMESTAMP) * 1000)::bigint,
+            PRIMARY KEY (id, created_at_ms)
+        ) PARTITION BY RANGE (created_at_ms)
+    """)
+    op.create_index(
+        'ix_message_stream_chunks_message_seq',
+        'message_stream_chunks',
+        ['message_id', 'seq_start'],
+    )
+
+    # Creates the monthly partition containing month_start; run ahead of time
+    # (e.g. from a monthly job) so rows never land in the default partition
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_message_stream_chunk_partition(month_start date)
+        RETURNS void AS $$
+        DECLARE
+            lower_ms bigint := (extract(epoch from date_trunc('month', month_start)::timestamptz) * 1000)::bigint;
+            upper_ms bigint := (extract(epoch from (date_trunc('month', month_start) + interval '1 month')::timestamptz) * 1000)::bigint;
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF message_stream_chunks FOR VALUES FROM (%s) TO (%s)',
+                'message_stream_chunks_' || to_char(month_start, 'YYYY_MM'),
+                lower_ms,
+                upper_ms
+            );
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        SELECT create_message_stream_chunk_partition((date_trunc('month', CURRENT_DATE) + make_interval(months => n))::date)
+        FROM generate_series(-1, 2) AS n
+    """)
+    op.execute("CREATE TABLE message_stream_chunks_default PARTITION OF message_stream_chunks DEFAULT")
+
+    op.execute("""
+        INSERT INTO message_stream_chunks (message_id, seq_start, deltas, created_at_ms)
+        SELECT message_id, seq_start, deltas, created_at_ms FROM message_stream_chunks_old
+    """)
+    op.drop_table('message_stream_chunks_old')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table('message_stream_chunks', 'message_stream_chunks_partitioned')
+    op.execute("""
+        CREATE TABLE message_stream_chunks (
+            id SERIAL PRIMARY KEY,
+            message_id UUID NOT NULL REFERENCES messages (id) ON DELETE CASCADE,
+            seq_start INTEGER NOT NULL,
+            deltas TEXT[] NOT NULL,
+            created_at_ms BIGINT NOT NULL DEFAULT (extract(epoch from CURRENT_TIMESTAMP) * 1000)::bigint
+        )
+    """)
+    op.execute("""
+        INSERT INTO message_stream_chunks (message_id, seq_start, deltas, created_at_ms)
+        SELECT message_id, seq_start, deltas, created_at_ms FROM message_stream_chunks_partitioned
+        ORDER BY id
+    """)
+    # Drops every partition along with the parent
+    op.drop_table('message_stream_chunks_partitioned')
+    op.execute("DROP FUNCTION IF EXISTS create_message_stream_chunk_partition(date)")
+    op.create_unique_constraint('uq_message_stream_chunk', 'message_stream_chunks', ['message_id', 'seq_start'])
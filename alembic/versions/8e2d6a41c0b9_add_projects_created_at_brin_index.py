@@ -0,0 +1,27 @@
+"""add projects created_at brin index
+
+Revision ID: 8e2d6a41c0b9
+Revises: 1c7b5e93d2f8
+Create Date: 2026-10-16 14:49:12.083365
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2d6a41c0b9'
+down_revision: Union[str, Sequence[str], None] = '1c7b5e93d2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('brin_projects_created_at', 'projects', ['created_at'], postgresql_using='brin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('brin_projects_created_at', 'projects')
@@ -0,0 +1,53 @@
+"""use pgvector for document embeddings
+
+Revision ID: 9b1f3e6a2d47
+Revises: 6954d7ca87bc
+Create Date: 2026-10-16 11:58:42.310577
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f3e6a2d47'
+down_revision: Union[str, Sequence[str], None] = '6954d7ca87bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # Embeddings of another dimension cannot be cast; they must be regenerated
+    op.execute("""
+        UPDATE documents SET vector_embedding = NULL
+        WHERE vector_embedding IS NOT NULL AND array_length(vector_embedding, 1) <> 1536
+    """)
+    op.execute("""
+        ALTER TABLE documents
+        ALTER COLUMN vector_embedding TYPE vector(1536)
+        USING vector_embedding::real[]::vector(1536)
+    """)
+    op.create_index(
+        'ix_documents_embedding_hnsw',
+        'documents',
+        ['vector_embedding'],
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'vector_embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_documents_embedding_hnsw', 'documents')
+    op.alter_column(
+        'documents',
+        'vector_embedding',
+        type_=postgresql.ARRAY(sa.Float()),
+        postgresql_using='vector_embedding::real[]::double precision[]',
+    )
@@ -0,0 +1,33 @@
+"""add document search trigram index
+
+Revision ID: 9c41e7b2d058
+Revises: 5a2c9d7e0f43
+Create Date: 2026-10-16 18:47:09.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41e7b2d058'
+down_revision: Union[str, Sequence[str], None] = '5a2c9d7e0f43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_documents_search_trgm', 'documents',
+        [sa.text("(coalesce(title, '') || ' ' || coalesce(content, '')) gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_documents_search_trgm', 'documents')
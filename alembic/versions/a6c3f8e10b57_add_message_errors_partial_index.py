@@ -0,0 +1,33 @@
+"""add message errors partial index
+
+Revision ID: a6c3f8e10b57
+Revises: 4f9a0b7e3d61
+Create Date: 2026-10-16 15:22:09.417352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3f8e10b57'
+down_revision: Union[str, Sequence[str], None] = '4f9a0b7e3d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_messages_errors',
+        'messages',
+        ['created_at'],
+        postgresql_where=sa.text("state = 'error'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_errors', 'messages')
@@ -0,0 +1,63 @@
+"""set updated_at by trigger
+
+Revision ID: b3e9f1a06c52
+Revises: 5d08b7f2c9a1
+Create Date: 2026-10-16 12:52:19.706134
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9f1a06c52'
+down_revision: Union[str, Sequence[str], None] = '5d08b7f2c9a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UPDATED_AT_TABLES = ('conversations', 'documents', 'projects', 'organizations')
+
+CURRENT_TIMESTAMP_DEFAULTS = (
+    ('conversations', 'created_at'),
+    ('conversations', 'updated_at'),
+    ('conversation_participants', 'added_at'),
+    ('messages', 'created_at'),
+    ('message_revisions', 'created_at'),
+    ('message_attachments', 'created_at'),
+    ('documents', 'created_at'),
+    ('documents', 'updated_at'),
+    ('assistant_presets', 'created_at'),
+    ('projects', 'updated_at'),
+    ('organizations', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = CURRENT_TIMESTAMP;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in UPDATED_AT_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+        """)
+    for table, column in CURRENT_TIMESTAMP_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT CURRENT_TIMESTAMP")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in CURRENT_TIMESTAMP_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()")
+    for table in UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
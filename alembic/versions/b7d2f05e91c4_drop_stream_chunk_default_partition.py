@@ -0,0 +1,46 @@
+"""drop message stream chunk default partition
+
+Revision ID: b7d2f05e91c4
+Revises: 9c41e7b2d058
+Create Date: 2026-10-16 19:20:51.604937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f05e91c4'
+down_revision: Union[str, Sequence[str], None] = '9c41e7b2d058'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows in the default partition block creating the partition for their month,
+    # so detach it, give each of its months a real partition and move the rows over
+    op.execute("ALTER TABLE message_stream_chunks DETACH PARTITION message_stream_chunks_default")
+    op.execute("""
+        SELECT create_message_stream_chunk_partition(month_start)
+        FROM (
+            SELECT DISTINCT date_trunc('month', to_timestamp(created_at_ms / 1000.0))::date AS month_start
+            FROM message_stream_chunks_default
+            UNION
+            SELECT (date_trunc('month', CURRENT_DATE) + make_interval(months => n))::date
+            FROM generate_series(0, 2) AS n
+        ) AS months
+    """)
+    op.execute("""
+        INSERT INTO message_stream_chunks (id, message_id, seq_start, deltas, created_at_ms)
+        SELECT id, message_id, seq_start, deltas, created_at_ms FROM message_stream_chunks_default
+    """)
+    # Without a default partition a missing month fails loudly instead of silently
+    # filling a catch-all; the application creates partitions months ahead
+    op.drop_table('message_stream_chunks_default')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE TABLE message_stream_chunks_default PARTITION OF message_stream_chunks DEFAULT")
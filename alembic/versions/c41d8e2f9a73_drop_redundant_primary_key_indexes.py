@@ -0,0 +1,38 @@
+"""drop redundant primary key indexes
+
+Revision ID: c41d8e2f9a73
+Revises: 7a4e19c3b0d6
+Create Date: 2026-10-16 13:41:08.529461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8e2f9a73'
+down_revision: Union[str, Sequence[str], None] = '7a4e19c3b0d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each of these duplicated the table's primary key index
+REDUNDANT_INDEXES = (
+    ('ix_documents_id', 'documents'),
+    ('ix_users_id', 'users'),
+    ('ix_organizations_id', 'organizations'),
+    ('ix_auth_sessions_id', 'auth_sessions'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, _ in REDUNDANT_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, table in REDUNDANT_INDEXES:
+        op.create_index(index_name, table, ['id'])
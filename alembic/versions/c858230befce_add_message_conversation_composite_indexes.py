@@ -0,0 +1,37 @@
+"""add message and conversation composite indexes
+
+Revision ID: c858230befce
+Revises: 445a80052d58
+Create Date: 2026-10-16 11:08:52.640391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c858230befce'
+down_revision: Union[str, Sequence[str], None] = '445a80052d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_messages_conv_created', 'messages', ['conversation_id', 'created_at'])
+    op.create_index('ix_messages_parent_created', 'messages', ['parent_message_id', 'created_at'])
+    op.create_index(
+        'ix_conversations_active',
+        'conversations',
+        ['project_id'],
+        postgresql_where=sa.text('NOT is_archived'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_conversations_active', 'conversations')
+    op.drop_index('ix_messages_parent_created', 'messages')
+    op.drop_index('ix_messages_conv_created', 'messages')
@@ -0,0 +1,40 @@
+"""use enum for organization type
+
+Revision ID: d27b9c05e4a3
+Revises: a6c3f8e10b57
+Create Date: 2026-10-16 15:31:44.658120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27b9c05e4a3'
+down_revision: Union[str, Sequence[str], None] = 'a6c3f8e10b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE TYPE org_type AS ENUM ('country', 'company', 'department')")
+    # The varchar default 'company' cannot be cast automatically; swap it around the change
+    op.execute("ALTER TABLE organizations ALTER COLUMN type DROP DEFAULT")
+    op.execute("ALTER TABLE organizations ALTER COLUMN type TYPE org_type USING type::org_type")
+    op.execute("ALTER TABLE organizations ALTER COLUMN type SET DEFAULT 'company'::org_type")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE organizations ALTER COLUMN type DROP DEFAULT")
+    op.alter_column(
+        'organizations',
+        'type',
+        type_=sa.String(),
+        postgresql_using='type::text',
+    )
+    op.alter_column('organizations', 'type', server_default='company')
+    op.execute("DROP TYPE org_type")
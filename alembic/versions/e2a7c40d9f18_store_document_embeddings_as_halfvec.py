@@ -0,0 +1,45 @@
+"""store document embeddings as halfvec
+
+Revision ID: e2a7c40d9f18
+Revises: 9b1f3e6a2d47
+Create Date: 2026-10-16 12:14:06.871254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c40d9f18'
+down_revision: Union[str, Sequence[str], None] = '9b1f3e6a2d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild(column_type: str, ops: str) -> None:
+    op.drop_index('ix_documents_embedding_hnsw', 'documents')
+    op.execute(f"""
+        ALTER TABLE documents
+        ALTER COLUMN vector_embedding TYPE {column_type}
+        USING vector_embedding::{column_type}
+    """)
+    op.create_index(
+        'ix_documents_embedding_hnsw',
+        'documents',
+        ['vector_embedding'],
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'vector_embedding': ops},
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # halfvec requires pgvector >= 0.7
+    _rebuild('halfvec(1536)', 'halfvec_cosine_ops')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild('vector(1536)', 'vector_cosine_ops')
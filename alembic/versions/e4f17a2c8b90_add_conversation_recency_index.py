@@ -0,0 +1,32 @@
+"""add conversation recency index
+
+Revision ID: e4f17a2c8b90
+Revises: 72e0c5a9d4b1
+Create Date: 2026-10-16 17:48:26.093614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f17a2c8b90'
+down_revision: Union[str, Sequence[str], None] = '72e0c5a9d4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_conversations_recency',
+        'conversations',
+        [sa.text('coalesce(updated_at, created_at) DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_conversations_recency', 'conversations')
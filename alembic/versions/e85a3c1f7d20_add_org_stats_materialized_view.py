@@ -0,0 +1,51 @@
+"""add org_stats materialized view
+
+Revision ID: e85a3c1f7d20
+Revises: c41d8e2f9a73
+Create Date: 2026-10-16 14:02:26.604718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e85a3c1f7d20'
+down_revision: Union[str, Sequence[str], None] = 'c41d8e2f9a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Aggregate each side separately so projects x memberships never fan out
+    op.execute("""
+        CREATE MATERIALIZED VIEW org_stats AS
+        SELECT
+            o.id AS organization_id,
+            coalesce(p.project_count, 0)::int AS project_count,
+            coalesce(p.rag_project_count, 0)::int AS rag_project_count,
+            coalesce(m.member_count, 0)::int AS member_count
+        FROM organizations o
+        LEFT JOIN (
+            SELECT
+                organization_id,
+                count(*) AS project_count,
+                count(*) FILTER (WHERE rag_enabled) AS rag_project_count
+            FROM projects
+            GROUP BY organization_id
+        ) p ON p.organization_id = o.id
+        LEFT JOIN (
+            SELECT organization_id, count(*) AS member_count
+            FROM organization_memberships
+            GROUP BY organization_id
+        ) m ON m.organization_id = o.id
+    """)
+    # Required by REFRESH ... CONCURRENTLY
+    op.create_index('ix_org_stats_organization_id', 'org_stats', ['organization_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS org_stats")
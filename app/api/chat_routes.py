@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import StreamingResponse
 import time
+from datetime import datetime
 import uuid
 
 from app.schemas.chat_response import (
@@ -296,13 +297,19 @@ async def list_my_conversations(
     project_id: Optional[str] = None,
     company_id: Optional[str] = None,
     limit: int = 50,
+    after_updated_at: Optional[datetime] = None,
+    # Parsed as a UUID so a malformed cursor is a 422, not a database error
+    after_id: Optional[uuid.UUID] = None,
     current_user: str = Depends(get_current_user),
 ):
+    # Keyset cursor: the updated_at and conversation_id of the last item on the previous page
+    after = (after_updated_at, after_id) if after_updated_at and after_id else None
     result = await get_chat_service.list_user_conversations(
         current_user,
         project_id=project_id,
         company_id=company_id,
         limit=limit,
+        after=after,
     )
     return _send_status(result)
 
@@ -320,6 +327,24 @@ async def get_conversation(
     return _send_status(result)
 
 
+@router.get(
+    "/conversations/{conversation_id}/bundle",
+    summary="Get conversation with participants and messages",
+    description="Get conversation details, participants and recent messages in one call.",
+)
+async def get_conversation_bundle(
+    conversation_id: str,
+    message_limit: int = 100,
+    current_user: str = Depends(get_current_user),
+):
+    result = await get_chat_service.get_conversation_bundle(
+        conversation_id,
+        user_id=current_user,
+        message_limit=message_limit,
+    )
+    return _send_status(result)
+
+
 @router.get(
     "/conversations/{conversation_id}/messages",
     summary="List conversation messages",
@@ -331,8 +356,12 @@ async def list_conversation_messages(
     include_children: bool = False,
     include_artifacts: bool = False,
     include_usage: bool = False,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
     current_user: str = Depends(get_current_user),
 ):
+    # Keyset cursor: the created_at and message_id of the oldest message already shown
+    before = (before_created_at, before_id) if before_created_at and before_id else None
     result = await get_chat_service.get_conversation_messages(
         conversation_id,
         user_id=current_user,
@@ -340,5 +369,52 @@ async def list_conversation_messages(
         include_children=include_children,
         include_artifacts=include_artifacts,
         include_usage=include_usage,
+        before=before,
+    )
+    return _send_status(result)
+
+
+@router.get(
+    "/conversations/{conversation_id}/messages/export",
+    summary="Export conversation messages",
+    description="Stream every message in a conversation, oldest first, as newline-delimited JSON.",
+)
+async def export_conversation_messages(
+    conversation_id: str,
+    include_artifacts: bool = False,
+    include_usage: bool = False,
+    current_user: str = Depends(get_current_user),
+):
+    denied = await get_chat_service.check_conversation_access(conversation_id, current_user)
+    if denied is not None:
+        return _send_status(denied)
+    return StreamingResponse(
+        get_chat_service.stream_conversation_messages(
+            conversation_id,
+            include_artifacts=include_artifacts,
+            include_usage=include_usage,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/conversations/{conversation_id}/messages/{message_id}/thread",
+    summary="Get message thread",
+    description="Return a message with its full tree of replies.",
+)
+async def get_message_thread(
+    conversation_id: str,
+    message_id: str,
+    include_artifacts: bool = False,
+    include_usage: bool = False,
+    current_user: str = Depends(get_current_user),
+):
+    result = await get_chat_service.get_message_thread(
+        conversation_id,
+        message_id,
+        user_id=current_user,
+        include_artifacts=include_artifacts,
+        include_usage=include_usage,
     )
     return _send_status(result)
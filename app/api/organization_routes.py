@@ -127,6 +127,16 @@ async def get_children(
     return _send(result)
 
 
+@router.get("/{organization_id}/stats")
+async def get_stats(
+    organization_id: str,
+    current_user: str = Depends(get_current_user)
+):
+    """Get project and member counts (refreshed periodically)"""
+    result = await organization_service.get_stats(organization_id)
+    return _send(result)
+
+
 @router.get("/{organization_id}/members")
 async def list_members(
     organization_id: str,
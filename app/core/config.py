@@ -3,7 +3,7 @@ Application configuration and environment variables.
 """
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, List, Optional
 
 from dotenv import find_dotenv, load_dotenv
 from pydantic_settings import BaseSettings
@@ -24,6 +24,12 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     DB_HOST: str
     DB_PORT: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    ORG_STATS_REFRESH_SECONDS: int = 300  # 0 disables the org_stats refresh job
+    STREAM_CHUNK_PARTITION_CHECK_SECONDS: int = 86400  # 0 disables the partition job
+    STREAM_CHUNK_PARTITION_MONTHS_AHEAD: int = 2
 
     # OpenAI settings
     OPENAI_API_KEY: str
@@ -64,7 +70,19 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
     REDIS_CACHE_TTL: int = 3600  # 1 hour default
-    ENABLE_RESPONSE_CACHE: bool = True  # Toggle response caching
+    CONVERSATION_CACHE_TTL: int = 60  # seconds; conversation, participant and message reads
+    REDIS_ENABLED: bool = True  # Redis backs sessions and caches; off uses in-process fallbacks
+    ENABLE_RESPONSE_CACHE: bool = True  # Toggle chat response caching only
+
+    # Request logging settings
+    LOG_BODY_PATH_PREFIXES: List[str] = []  # Request bodies are only logged under these paths
+    LOG_BODY_MAX_BYTES: int = 2048
+    # path -> N: log only every Nth successful request on high-volume paths
+    LOG_SAMPLE_RATES: Dict[str, int] = {"/api/v1/chat/completions/stream": 50}
+
+    # Session settings
+    SESSION_MAX_IN_MEMORY: int = 10000  # LRU bound for the in-process session fallback
+    SESSION_CLEANUP_SECONDS: int = 600  # 0 disables the expired-session sweep
 
     # Streaming settings
     STREAM_SHOW_THINKING: bool = True  # Show "thinking" status messages during streaming
@@ -131,11 +131,8 @@ async def get_current_user_or_anonymous(
                     user_id = payload.get("sub")
                     if user_id:
                         logger.debug(f"Authenticated user: {user_id}")
-                        session = session_manager.create_authenticated_session(
-                            user_id=user_id,
-                            username="",
-                            email=""
-                        )
+                        # One session per token, reused across its requests
+                        session = await session_manager.get_or_create_token_session(token, payload)
                         request.state.session = session
                         return session.to_dict()
         except Exception as e:
@@ -144,7 +141,7 @@ async def get_current_user_or_anonymous(
     # Check for existing anonymous session cookie
     session_id = request.cookies.get("session_id")
     if session_id:
-        session = session_manager.get_session(session_id)
+        session = await session_manager.get_session(session_id)
         if session:
             logger.debug(f"Using existing session: {session_id}")
             request.state.session = session
@@ -152,7 +149,7 @@ async def get_current_user_or_anonymous(
 
     # Create new anonymous session
     logger.info("Creating new anonymous session")
-    session = session_manager.create_anonymous_session()
+    session = await session_manager.create_anonymous_session()
     request.state.session = session
     return session.to_dict()
 
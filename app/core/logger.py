@@ -2,13 +2,16 @@
 Logging configuration for the application.
 Provides structured logging with file rotation and different log levels.
 """
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-import json
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import orjson
 
 
 class JSONFormatter(logging.Formatter):
@@ -33,7 +36,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
-        return json.dumps(log_data)
+        # default=str keeps records with non-JSON extras (UUIDs, datetimes) loggable
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -62,6 +66,31 @@ class ColoredFormatter(logging.Formatter):
         return message
 
 
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records to the listener untouched.
+
+    The stock prepare() formats the message and drops exc_info so records can be
+    pickled across processes; here the queue never leaves the process, so the
+    real handlers format (and render tracebacks) on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listeners: List[QueueListener] = []
+
+
+def stop_log_listeners():
+    """Flush queued records and stop the background logging threads."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(stop_log_listeners)
+
+
 def setup_logger(
     name: str = "backend-ai",
     log_level: str = "INFO",
@@ -83,6 +112,9 @@ def setup_logger(
         enable_json_logs: Enable JSON formatted file logging
         enable_console: Enable console logging
 
+    Handler I/O runs on a QueueListener thread; the logger itself only enqueues
+    records, so logging from request handlers never blocks the event loop.
+
     Returns:
         Configured logger instance
     """
@@ -91,6 +123,7 @@ def setup_logger(
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    handlers: List[logging.Handler] = []
 
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
@@ -105,7 +138,7 @@ def setup_logger(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File Handler - JSON format (for parsing/analysis)
     if enable_json_logs:
@@ -117,7 +150,7 @@ def setup_logger(
         )
         json_handler.setLevel(logging.DEBUG)
         json_handler.setFormatter(JSONFormatter())
-        logger.addHandler(json_handler)
+        handlers.append(json_handler)
 
     # File Handler - Plain text (human-readable)
     text_file = log_path / f"{name}.log"
@@ -132,7 +165,7 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     text_handler.setFormatter(text_formatter)
-    logger.addHandler(text_handler)
+    handlers.append(text_handler)
 
     # File Handler - Error logs only
     error_file = log_path / f"{name}_errors.log"
@@ -143,7 +176,14 @@ def setup_logger(
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(text_formatter)
-    logger.addHandler(error_handler)
+    handlers.append(error_handler)
+
+    # SimpleQueue is unbounded and lock-free for producers
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(InProcessQueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
 
     logger.info(f"Logger '{name}' initialized with level {log_level}")
 
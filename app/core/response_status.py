@@ -1,8 +1,29 @@
 # app/core/response_status.py
-from fastapi.responses import JSONResponse
+from typing import Any, Optional
+
+import msgspec
+from fastapi.responses import Response
 from http import HTTPStatus
 
 
+class Envelope(msgspec.Struct, omit_defaults=True):
+    """Wire format of every ResponseStatus body."""
+    success: bool
+    message: str
+    data: Any
+    meta: Optional[Any] = None
+    error_code: Optional[str] = None
+
+
+# Encodes Envelope structs straight to bytes, without an intermediate dict
+_encoder = msgspec.json.Encoder()
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a value exactly as it would appear in a response body."""
+    return _encoder.encode(value)
+
+
 class ResponseStatus:
     def __init__(self, message, status_code=HTTPStatus.OK, data=None, error_code=None, meta=None):
         self.success = status_code < 400
@@ -13,19 +34,18 @@ class ResponseStatus:
         self.error_code = error_code
 
     def send(self):
-        payload = {
-            "success": self.success,
-            "message": self.message,
-            "data": self.data,
-        }
-
-        if self.meta:
-            payload["meta"] = self.meta
-
-        if self.error_code and not self.success:
-            payload["error_code"] = self.error_code
-
-        return JSONResponse(content=payload, status_code=self.status_code)
+        envelope = Envelope(
+            success=self.success,
+            message=self.message,
+            data=self.data,
+            meta=self.meta or None,
+            error_code=self.error_code if not self.success else None,
+        )
+        return Response(
+            content=_encoder.encode(envelope),
+            status_code=self.status_code,
+            media_type="application/json",
+        )
 
 class OK(ResponseStatus):
     def __init__(self, message="OK", data=None, meta=None):
@@ -35,74 +55,92 @@ class Created(ResponseStatus):
     def __init__(self, message="Created", data=None, meta=None):
         super().__init__(message, HTTPStatus.CREATED, data=data, meta=meta)
 
-class BadRequest(ResponseStatus):
-    def __init__(self, message="Bad Request", error_code="4000"):
-        super().__init__(message, HTTPStatus.BAD_REQUEST, error_code=error_code)
-
-class Unauthorized(ResponseStatus):
-    def __init__(self, message="Unauthorized", error_code="4001"):
-        super().__init__(message, HTTPStatus.UNAUTHORIZED, error_code=error_code)
-
-class Forbidden(ResponseStatus):
-    def __init__(self, message="Forbidden", error_code="4003"):
-        super().__init__(message, HTTPStatus.FORBIDDEN, error_code=error_code)
-
-class NotFound(ResponseStatus):
-    def __init__(self, message="Not Found", error_code="4004"):
-        super().__init__(message, HTTPStatus.NOT_FOUND, error_code=error_code)
-
-class Conflict(ResponseStatus):
-    def __init__(self, message="Conflict", error_code="4009"):
-        super().__init__(message, HTTPStatus.CONFLICT, error_code=error_code)
-
-class InternalError(ResponseStatus):
-    def __init__(self, message="Internal Server Error", error_code="5000"):
-        super().__init__(message, HTTPStatus.INTERNAL_SERVER_ERROR, error_code=error_code)
-
-class UserNotFound(ResponseStatus):
-    def __init__(self, message="User Not Found", error_code="4004"):
-        super().__init__(message, HTTPStatus.NOT_FOUND, error_code=error_code)
-        
-class InvalidCredentials(ResponseStatus):
-    def __init__(self, message="Invalid Credentials", error_code="4001"):
-        super().__init__(message, HTTPStatus.UNAUTHORIZED, error_code=error_code)
-        
-class TokenExpired(ResponseStatus):
-    def __init__(self, message="Token Expired", error_code="4011"):
-        super().__init__(message, HTTPStatus.UNAUTHORIZED, error_code=error_code)
-        
-class TokenInvalid(ResponseStatus):
-    def __init__(self, message="Token Invalid", error_code="4012"):
-        super().__init__(message, HTTPStatus.UNAUTHORIZED, error_code=error_code)
-        
-class InvalidToken(ResponseStatus):
-    def __init__(self, message="Invalid Token", error_code="4012"):
-        super().__init__(message, HTTPStatus.UNAUTHORIZED, error_code=error_code)
-
-class ServiceUnavailable(ResponseStatus):
-    def __init__(self, message="Service Unavailable", error_code="5003"):
-        super().__init__(message, HTTPStatus.SERVICE_UNAVAILABLE, error_code=error_code)
-
-class DatabaseError(ResponseStatus):
-    def __init__(self, message="Database Error", error_code="5001"):
-        super().__init__(message, HTTPStatus.INTERNAL_SERVER_ERROR, error_code=error_code)
-
-class ValidationError(ResponseStatus):
-    def __init__(self, message="Validation Error", error_code="4002"):
-        super().__init__(message, HTTPStatus.BAD_REQUEST, error_code=error_code)
-
-class UnprocessableEntity(ResponseStatus):
-    def __init__(self, message="Unprocessable Entity", error_code="4022"):
-        super().__init__(message, HTTPStatus.UNPROCESSABLE_ENTITY, error_code=error_code)
-
-class TooManyRequests(ResponseStatus):
-    def __init__(self, message="Too Many Requests", error_code="4029"):
-        super().__init__(message, HTTPStatus.TOO_MANY_REQUESTS, error_code=error_code)
-
-class MethodNotAllowed(ResponseStatus):
-    def __init__(self, message="Method Not Allowed", error_code="4005"):
-        super().__init__(message, HTTPStatus.METHOD_NOT_ALLOWED, error_code=error_code)
-        
-class ChatNotFound(ResponseStatus):
-    def __init__(self, message="Chat Not Found", error_code="4004"):
-        super().__init__(message, HTTPStatus.NOT_FOUND, error_code=error_code)
\ No newline at end of file
+class ErrorStatus(ResponseStatus):
+    """
+    Base for the error statuses generated from _ERRORS.
+
+    Subclasses only carry class attributes; the body for the default message
+    and error code is encoded once, when the class is built.
+    """
+    status: HTTPStatus
+    default_message: str
+    default_error_code: str
+    _default_body: bytes
+
+    def __init__(self, message=None, error_code=None):
+        super().__init__(
+            self.default_message if message is None else message,
+            self.status,
+            error_code=self.default_error_code if error_code is None else error_code,
+        )
+
+    def send(self):
+        if (
+            self.message == self.default_message
+            and self.error_code == self.default_error_code
+            and self.data is None
+            and not self.meta
+        ):
+            return Response(
+                content=self._default_body,
+                status_code=self.status_code,
+                media_type="application/json",
+            )
+        return super().send()
+
+
+# name -> (status, default message, default error code)
+_ERRORS: dict[str, tuple[HTTPStatus, str, str]] = {
+    "BadRequest": (HTTPStatus.BAD_REQUEST, "Bad Request", "4000"),
+    "Unauthorized": (HTTPStatus.UNAUTHORIZED, "Unauthorized", "4001"),
+    "Forbidden": (HTTPStatus.FORBIDDEN, "Forbidden", "4003"),
+    "NotFound": (HTTPStatus.NOT_FOUND, "Not Found", "4004"),
+    "Conflict": (HTTPStatus.CONFLICT, "Conflict", "4009"),
+    "InternalError": (HTTPStatus.INTERNAL_SERVER_ERROR, "Internal Server Error", "5000"),
+    "UserNotFound": (HTTPStatus.NOT_FOUND, "User Not Found", "4004"),
+    "InvalidCredentials": (HTTPStatus.UNAUTHORIZED, "Invalid Credentials", "4001"),
+    "TokenExpired": (HTTPStatus.UNAUTHORIZED, "Token Expired", "4011"),
+    "TokenInvalid": (HTTPStatus.UNAUTHORIZED, "Token Invalid", "4012"),
+    "InvalidToken": (HTTPStatus.UNAUTHORIZED, "Invalid Token", "4012"),
+    "ServiceUnavailable": (HTTPStatus.SERVICE_UNAVAILABLE, "Service Unavailable", "5003"),
+    "DatabaseError": (HTTPStatus.INTERNAL_SERVER_ERROR, "Database Error", "5001"),
+    "ValidationError": (HTTPStatus.BAD_REQUEST, "Validation Error", "4002"),
+    "UnprocessableEntity": (HTTPStatus.UNPROCESSABLE_ENTITY, "Unprocessable Entity", "4022"),
+    "TooManyRequests": (HTTPStatus.TOO_MANY_REQUESTS, "Too Many Requests", "4029"),
+    "MethodNotAllowed": (HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed", "4005"),
+    "ChatNotFound": (HTTPStatus.NOT_FOUND, "Chat Not Found", "4004"),
+}
+
+
+def _error_class(name: str) -> type[ErrorStatus]:
+    status, message, error_code = _ERRORS[name]
+    body = _encoder.encode(
+        Envelope(success=False, message=message, data=None, error_code=error_code)
+    )
+    return type(name, (ErrorStatus,), {
+        "__module__": __name__,
+        "status": status,
+        "default_message": message,
+        "default_error_code": error_code,
+        "_default_body": body,
+    })
+
+
+BadRequest = _error_class("BadRequest")
+Unauthorized = _error_class("Unauthorized")
+Forbidden = _error_class("Forbidden")
+NotFound = _error_class("NotFound")
+Conflict = _error_class("Conflict")
+InternalError = _error_class("InternalError")
+UserNotFound = _error_class("UserNotFound")
+InvalidCredentials = _error_class("InvalidCredentials")
+TokenExpired = _error_class("TokenExpired")
+TokenInvalid = _error_class("TokenInvalid")
+InvalidToken = _error_class("InvalidToken")
+ServiceUnavailable = _error_class("ServiceUnavailable")
+DatabaseError = _error_class("DatabaseError")
+ValidationError = _error_class("ValidationError")
+UnprocessableEntity = _error_class("UnprocessableEntity")
+TooManyRequests = _error_class("TooManyRequests")
+MethodNotAllowed = _error_class("MethodNotAllowed")
+ChatNotFound = _error_class("ChatNotFound")
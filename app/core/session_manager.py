@@ -2,12 +2,20 @@
 Session management for anonymous and authenticated users.
 Handles session creation, validation, and tracking.
 """
-import uuid
+import hashlib
+import heapq
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from secrets import token_hex
+
+import orjson
+
+from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.services.cache_service import CacheService, get_cache_service
 
 logger = get_logger("session_manager")
 
@@ -32,8 +40,8 @@ class UserSession:
             if not self.is_authenticated:
                 self.expires_at = time.time() + (24 * 60 * 60)
             else:
-                # Authenticated sessions don't expire (managed by JWT)
-                self.expires_at = time.time() + (365 * 24 * 60 * 60)
+                # Authenticated sessions live as long as an access token
+                self.expires_at = time.time() + get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     def is_expired(self) -> bool:
         """Check if session is expired"""
@@ -43,6 +51,11 @@ class UserSession:
         """Increment request counter"""
         self.request_count += 1
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserSession":
+        """Rebuild a session from its dictionary form"""
+        return cls(**data)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -58,69 +71,200 @@ class UserSession:
 
 
 class SessionManager:
-    """Manages user sessions (both anonymous and authenticated)"""
+    """
+    Manages user sessions (both anonymous and authenticated).
 
-    def __init__(self):
-        self._sessions: Dict[str, UserSession] = {}
+    Sessions live in Redis as ``session:{sid}`` keys with a native TTL so they are
+    shared across workers and survive restarts. When the cache is disabled or
+    unreachable, an in-process store is used instead.
+    """
+
+    KEY_PREFIX = "session:"
+    INDEX_AUTH = "session:index:auth"
+    INDEX_ANON = "session:index:anon"
+
+    def __init__(self, cache_service: Optional[CacheService] = None, max_sessions: Optional[int] = None):
+        self._cache = cache_service or get_cache_service()
+        self._max_sessions = max_sessions or get_settings().SESSION_MAX_IN_MEMORY
+        # In-process fallback store, kept in LRU order (least recently used first)
+        self._sessions: "OrderedDict[str, UserSession]" = OrderedDict()
+        # Min-heap of (expires_at, session_id) so cleanup only touches expired entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._auth_count = 0
+        self._anon_count = 0
         logger.info("SessionManager initialized")
 
-    def create_anonymous_session(self) -> UserSession:
+    def _index_key(self, is_authenticated: bool) -> str:
+        return self.INDEX_AUTH if is_authenticated else self.INDEX_ANON
+
+    def _decrement_count(self, session: UserSession):
+        if session.is_authenticated:
+            self._auth_count -= 1
+        else:
+            self._anon_count -= 1
+
+    def _track_session(self, session: UserSession):
+        """Register a new session in the store, expiry heap and counters"""
+        previous = self._sessions.pop(session.session_id, None)
+        if previous is not None:
+            self._decrement_count(previous)
+        self._sessions[session.session_id] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.session_id))
+        if session.is_authenticated:
+            self._auth_count += 1
+        else:
+            self._anon_count += 1
+
+        if len(self._sessions) > self._max_sessions:
+            evicted_id, evicted = self._sessions.popitem(last=False)
+            self._decrement_count(evicted)
+            logger.debug("Evicted least recently used session: %s", evicted_id)
+            # Evicted ids leave stale heap entries; rebuild once they dominate the heap
+            if len(self._expiry_heap) > 2 * self._max_sessions:
+                self._expiry_heap = [(s.expires_at, sid) for sid, s in self._sessions.items()]
+                heapq.heapify(self._expiry_heap)
+
+    async def _store_session(self, session: UserSession):
+        """Persist a session to Redis, or to the in-process store as fallback"""
+        if not self._cache.is_available:
+            self._track_session(session)
+            return
+
+        ttl = max(1, int(session.expires_at - time.time()))
+        body = orjson.dumps(session.to_dict()).decode()
+        stored = await self._cache.set(f"{self.KEY_PREFIX}{session.session_id}", body, ttl=ttl)
+        if not stored:
+            self._track_session(session)
+            return
+        # Sorted by expiry so counts can ignore sessions Redis has already expired.
+        # Members whose key has expired are trimmed on every write, so the index
+        # never holds more than the live sessions
+        index_key = self._index_key(session.is_authenticated)
+        await self._cache.zremrangebyscore(index_key, "-inf", time.time())
+        await self._cache.zadd(index_key, {session.session_id: session.expires_at})
+
+    async def create_anonymous_session(self) -> UserSession:
         """Create a new anonymous session"""
-        session_id = f"anon_{uuid.uuid4().hex}"
+        session_id = f"anon_{token_hex(16)}"
         session = UserSession(
             session_id=session_id,
             is_authenticated=False
         )
-        self._sessions[session_id] = session
-        logger.info(f"Created anonymous session: {session_id}")
+        await self._store_session(session)
+        logger.info("Created anonymous session: %s", session_id)
         return session
 
-    def create_authenticated_session(self, user_id: str, username: str, email: str) -> UserSession:
+    async def create_authenticated_session(
+        self,
+        user_id: str,
+        username: str,
+        email: str,
+        *,
+        session_id: Optional[str] = None,
+        expires_at: Optional[float] = None,
+    ) -> UserSession:
         """Create a new authenticated session"""
-        session_id = f"auth_{uuid.uuid4().hex}"
         session = UserSession(
-            session_id=session_id,
+            session_id=session_id or f"auth_{token_hex(16)}",
             is_authenticated=True,
             user_id=user_id,
             username=username,
-            email=email
+            email=email,
+            expires_at=expires_at,
         )
-        self._sessions[session_id] = session
-        logger.info(f"Created authenticated session for user: {username} (ID: {session_id})")
+        await self._store_session(session)
+        logger.info("Created authenticated session for user: %s (ID: %s)", username, session.session_id)
         return session
 
-    def get_session(self, session_id: str) -> Optional[UserSession]:
+    async def get_or_create_token_session(self, token: str, payload: Dict[str, Any]) -> UserSession:
+        """
+        Return the session bound to a bearer token, creating it on first use.
+
+        The session id is derived from the token (its ``jti`` claim, else a hash of
+        the token), so every request with the same token shares one session, and
+        the session expires together with the token.
+        """
+        token_key = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()[:32]
+        session_id = f"auth_{token_key}"
+        session = await self.get_session(session_id)
+        if session is not None:
+            return session
+        exp = payload.get("exp")
+        return await self.create_authenticated_session(
+            user_id=payload["sub"],
+            username="",
+            email="",
+            session_id=session_id,
+            expires_at=float(exp) if exp is not None else None,
+        )
+
+    async def get_session(self, session_id: str) -> Optional[UserSession]:
         """Get session by ID"""
         session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        elif self._cache.is_available:
+            body = await self._cache.get(f"{self.KEY_PREFIX}{session_id}")
+            if body:
+                try:
+                    session = UserSession.from_dict(orjson.loads(body))
+                except (orjson.JSONDecodeError, TypeError) as e:
+                    logger.warning("Failed to decode session %s: %s", session_id, e)
+                    return None
         if session and session.is_expired():
-            logger.debug(f"Session expired: {session_id}")
-            self.remove_session(session_id)
+            logger.debug("Session expired: %s", session_id)
+            await self.remove_session(session_id)
             return None
         return session
 
-    def remove_session(self, session_id: str):
+    async def remove_session(self, session_id: str):
         """Remove a session"""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            logger.info(f"Removed session: {session_id}")
-
-    def cleanup_expired_sessions(self):
-        """Remove all expired sessions"""
-        expired_sessions = [
-            sid for sid, session in self._sessions.items()
-            if session.is_expired()
-        ]
-        for sid in expired_sessions:
-            self.remove_session(sid)
-        if expired_sessions:
-            logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
-
-    def get_session_count(self) -> Dict[str, int]:
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._decrement_count(session)
+            logger.info("Removed session: %s", session_id)
+            return
+
+        if self._cache.is_available:
+            await self._cache.delete(f"{self.KEY_PREFIX}{session_id}")
+            await self._cache.zrem(self._index_key(session_id.startswith("auth_")), session_id)
+            logger.info("Removed session: %s", session_id)
+
+    async def cleanup_expired_sessions(self):
+        """
+        Remove all expired sessions.
+
+        Redis expires session keys on its own; this only trims the in-process
+        fallback store and the Redis expiry indexes.
+        """
+        now = time.time()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, sid = heapq.heappop(heap)
+            # Entries may be stale if the session was already removed
+            session = self._sessions.get(sid)
+            if session is not None and session.expires_at <= now:
+                await self.remove_session(sid)
+                removed += 1
+
+        if self._cache.is_available:
+            for index_key in (self.INDEX_AUTH, self.INDEX_ANON):
+                removed += await self._cache.zremrangebyscore(index_key, "-inf", now)
+
+        if removed:
+            logger.info("Cleaned up %d expired sessions", removed)
+
+    async def get_session_count(self) -> Dict[str, int]:
         """Get session statistics"""
-        authenticated = sum(1 for s in self._sessions.values() if s.is_authenticated)
-        anonymous = sum(1 for s in self._sessions.values() if not s.is_authenticated)
+        authenticated = self._auth_count
+        anonymous = self._anon_count
+        if self._cache.is_available:
+            now = time.time()
+            authenticated += await self._cache.zcount(self.INDEX_AUTH, now, "+inf")
+            anonymous += await self._cache.zcount(self.INDEX_ANON, now, "+inf")
         return {
-            "total": len(self._sessions),
+            "total": authenticated + anonymous,
             "authenticated": authenticated,
             "anonymous": anonymous
         }
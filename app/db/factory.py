@@ -5,6 +5,16 @@ from langchain_openai import OpenAIEmbeddings
 
 from app.db.vector_store import AsyncPgVector, ExtendedPgVector
 
+_MODES: dict[str, type[ExtendedPgVector]] = {
+    "sync": ExtendedPgVector,
+    "async": AsyncPgVector,
+}
+
+# One store per (connection, collection, mode, embeddings). OpenAIEmbeddings is
+# not hashable, so the cache is keyed on its identity; the cached store keeps
+# the embeddings object alive, which keeps that id stable.
+_stores: dict[tuple[str, str, str, int], ExtendedPgVector] = {}
+
 
 def get_vector_store(
     connection_string: str,
@@ -29,17 +39,20 @@ def get_vector_store(
     Returns:
         Vector store instance
     """
-    if mode == "sync":
-        return ExtendedPgVector(
-            connection_string=connection_string,
-            embedding_function=embeddings,
-            collection_name=collection_name,
-        )
-    elif mode == "async":
-        return AsyncPgVector(
-            connection_string=connection_string,
-            embedding_function=embeddings,
-            collection_name=collection_name,
-        )
-    else:
-        raise ValueError("Invalid mode specified. Choose 'sync' or 'async'.")
+    key = (connection_string, collection_name, mode, id(embeddings))
+    store = _stores.get(key)
+    if store is not None:
+        return store
+
+    try:
+        store_cls = _MODES[mode]
+    except KeyError:
+        raise ValueError("Invalid mode specified. Choose 'sync' or 'async'.") from None
+
+    store = store_cls(
+        connection_string=connection_string,
+        embedding_function=embeddings,
+        collection_name=collection_name,
+    )
+    _stores[key] = store
+    return store
@@ -1,20 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine, async_sessionmaker
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, AsyncIterator, Optional
+
+from app.core.config import get_settings
+
 
 class PostgreSQLConnection:
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+    ):
+        settings = get_settings()
         self.database_url = database_url
+        self.pool_size = pool_size if pool_size is not None else settings.DB_POOL_SIZE
+        self.max_overflow = max_overflow if max_overflow is not None else settings.DB_MAX_OVERFLOW
+        self.pool_recycle = settings.DB_POOL_RECYCLE
         self.engine: Optional[AsyncEngine] = None
         self.SessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
-        
+        # Guards lazy initialization so concurrent first requests build one engine
+        self._init_lock = asyncio.Lock()
+
     async def connect(self):
         """Initialize the database engine and session factory"""
+        async with self._init_lock:
+            if self.SessionLocal is None:
+                self._create_engine()
+
+    def _create_engine(self):
         self.engine = create_async_engine(
             self.database_url,
             echo=False,
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            # Reuse the most recently returned connection so its backend caches stay warm
+            pool_use_lifo=True,
+            # Rows per multi-row INSERT ... VALUES ... RETURNING batch for executemany
+            insertmanyvalues_page_size=1000,
+            # Compiled-SQL cache entries; sized above the default 500 so the many
+            # option/filter combinations built per request are not evicted
+            query_cache_size=1200,
+            connect_args={
+                "prepared_statement_cache_size": 256,
+                # JIT planning costs more than it saves on short OLTP queries
+                "server_settings": {"jit": "off"},
+            },
         )
         self.SessionLocal = async_sessionmaker(
             bind=self.engine,
@@ -23,11 +58,31 @@ class PostgreSQLConnection:
             autoflush=False,
         )
     
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provide a session that commits on success and rolls back on error.
+
+        A session runs one statement at a time and must not be shared between
+        concurrently running tasks; work fanned out with asyncio.gather opens
+        one session per task (see ChatService._run_in_session).
+        """
+        session_factory = self.SessionLocal
+        if session_factory is None:
+            await self.connect()
+            session_factory = self.SessionLocal
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                # Release the connection promptly instead of waiting for GC
+                await session.rollback()
+                raise
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Provide a session (FastAPI dependency-style)."""
-        if self.SessionLocal is None:
-            await self.connect()
-        async with self.SessionLocal() as session:
+        async with self.session() as session:
             yield session
     
     async def close(self):
@@ -39,5 +94,7 @@ class PostgreSQLConnection:
 db_connection: Optional[PostgreSQLConnection] = None
 
 def get_db_connection() -> PostgreSQLConnection:
-    assert db_connection is not None, "db_connection not initialized"
-    return db_connection
\ No newline at end of file
+    # Single global load on the per-request path
+    connection = db_connection
+    assert connection is not None, "db_connection not initialized"
+    return connection
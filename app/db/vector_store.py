@@ -2,12 +2,13 @@
 Vector store implementations for document storage and retrieval.
 """
 import asyncio
-import time
+import uuid
 from typing import Any, Optional
 
 from langchain_community.vectorstores.pgvector import PGVector
 from langchain_core.documents import Document
-from langchain_core.runnables.config import run_in_executor
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
 
 
@@ -23,11 +24,14 @@ class ExtendedPgVector(PGVector):
         - Query EmbeddingStore.custom_id
         - Return list of IDs
         """
-        time.sleep(5)  # Simulate blocking I/O operation
-
+        stmt = (
+            select(self.EmbeddingStore.custom_id)
+            .where(self.EmbeddingStore.custom_id.isnot(None))
+            .execution_options(yield_per=1000)
+        )
         with Session(self._bind) as session:
-            results = session.query(self.EmbeddingStore.custom_id).all()
-            return [result[0] for result in results if result[0] is not None]
+            # Server-side cursor, yielding plain strings instead of 1-tuples
+            return list(session.scalars(stmt))
 
     def get_documents_by_ids(self, ids: list[str]) -> list[Document]:
         """
@@ -38,18 +42,20 @@ class ExtendedPgVector(PGVector):
         - Convert results to Document objects
         - Return list of Documents
         """
+        if not ids:
+            return []
+
         with Session(self._bind) as session:
-            results = (
-                session.query(self.EmbeddingStore)
-                .filter(self.EmbeddingStore.custom_id.in_(ids))
+            # Fetch only the columns needed to build Documents; custom_id is indexed
+            rows = (
+                session.query(self.EmbeddingStore.document, self.EmbeddingStore.cmetadata)
+                .filter(self.EmbeddingStore.custom_id.in_(set(ids)))
                 .all()
             )
-            documents = [
-                Document(page_content=result.page_content, metadata=result.metadata or {})
-                for result in results
-                if result.custom_id in ids
+            return [
+                Document(page_content=page_content, metadata=metadata or {})
+                for page_content, metadata in rows
             ]
-            return documents
 
     def delete_documents(self, ids: list[str]) -> None:
         """
@@ -62,41 +68,141 @@ class ExtendedPgVector(PGVector):
 
 
 class AsyncPgVector(ExtendedPgVector):
-    """Async wrapper for PGVector operations."""
+    """
+    Async PGVector operations backed by a native asyncpg engine.
+
+    Queries run on the event loop through an AsyncSession instead of hopping
+    to the default threadpool with a blocking connection.
+    """
+
+    # Seconds to wait for more add_documents calls before flushing
+    ADD_BATCH_WINDOW = 0.01
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        async_url = self._bind.engine.url.set(drivername="postgresql+asyncpg")
+        self._async_engine = create_async_engine(async_url, pool_pre_ping=True)
+        self._async_sessionmaker = async_sessionmaker(self._async_engine, expire_on_commit=False)
+        self._collection_id: Optional[Any] = None
+        # Concurrent add_documents calls are coalesced into one insert
+        self._pending: list[tuple[list[Document], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def _get_collection_id(self, session: AsyncSession) -> Any:
+        """Resolve (and cache) the uuid of this store's collection."""
+        if self._collection_id is None:
+            result = await session.execute(
+                select(self.CollectionStore.uuid).where(
+                    self.CollectionStore.name == self.collection_name
+                )
+            )
+            self._collection_id = result.scalar_one_or_none()
+            if self._collection_id is None:
+                raise ValueError(f"Collection '{self.collection_name}' not found")
+        return self._collection_id
 
     async def get_all_ids(self) -> list[str]:
-        """
-        Async version of get_all_ids.
-
-        TODO: Implement async version using run_in_executor.
-        - Add await asyncio.sleep for non-blocking delay
-        - Wrap synchronous call with run_in_executor
-        """
-        await asyncio.sleep(5)  # Simulate non-blocking I/O
-        return await run_in_executor(None, super().get_all_ids)
+        """Async version of get_all_ids."""
+        stmt = select(self.EmbeddingStore.custom_id).where(
+            self.EmbeddingStore.custom_id.isnot(None)
+        )
+        async with self._async_sessionmaker() as session:
+            result = await session.stream_scalars(stmt.execution_options(yield_per=1000))
+            return [custom_id async for custom_id in result]
 
     async def get_documents_by_ids(self, ids: list[str]) -> list[Document]:
-        """
-        Async version of get_documents_by_ids.
-
-        TODO: Implement async version using run_in_executor.
-        """
-        return await run_in_executor(None, super().get_documents_by_ids, ids)
+        """Async version of get_documents_by_ids."""
+        if not ids:
+            return []
+
+        stmt = select(self.EmbeddingStore.document, self.EmbeddingStore.cmetadata).where(
+            self.EmbeddingStore.custom_id.in_(set(ids))
+        )
+        async with self._async_sessionmaker() as session:
+            result = await session.execute(stmt)
+            return [
+                Document(page_content=page_content, metadata=metadata or {})
+                for page_content, metadata in result.all()
+            ]
 
     async def delete_documents(self, ids: list[str]) -> None:
-        """
-        Async version of delete_documents.
+        """Async version of delete_documents."""
+        if not ids:
+            return
 
-        TODO: Implement async version using run_in_executor.
-        """
-        await run_in_executor(None, super().delete_documents, ids)
+        async with self._async_sessionmaker() as session:
+            await session.execute(
+                delete(self.EmbeddingStore).where(self.EmbeddingStore.custom_id.in_(ids))
+            )
+            await session.commit()
 
     async def add_documents(self, documents: list[Document]) -> list[str]:
         """
         Async version of add_documents.
 
-        TODO: Implement async version to add documents to the vector store.
-        - Wrap parent add_documents method with run_in_executor
-        - Return list of generated IDs
+        Calls arriving within ADD_BATCH_WINDOW seconds of each other are
+        merged into a single embed + insert; each caller gets back the ids of
+        its own documents.
+
+        Returns:
+            List of generated IDs
         """
-        return await run_in_executor(None, super().add_documents, documents)
+        if not documents:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((documents, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.ADD_BATCH_WINDOW, self._schedule_flush)
+        return await future
+
+    def _schedule_flush(self) -> None:
+        # Keep a reference so the flush task is not garbage collected mid-run
+        self._flush_task = asyncio.ensure_future(self._flush_pending())
+
+    async def _flush_pending(self) -> None:
+        """Insert every queued batch at once and hand ids back to each caller."""
+        pending, self._pending = self._pending, []
+        self._flush_handle = None
+
+        batch = [doc for documents, _ in pending for doc in documents]
+        try:
+            ids = await self._insert_documents(batch)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for documents, future in pending:
+            if not future.done():
+                future.set_result(ids[offset:offset + len(documents)])
+            offset += len(documents)
+
+    async def _insert_documents(self, documents: list[Document]) -> list[str]:
+        """Embed documents and insert them in a single transaction."""
+        texts = [doc.page_content for doc in documents]
+        ids = [doc.id or str(uuid.uuid4()) for doc in documents]
+        embeddings = await self.embedding_function.aembed_documents(texts)
+
+        async with self._async_sessionmaker() as session:
+            collection_id = await self._get_collection_id(session)
+            session.add_all(
+                self.EmbeddingStore(
+                    embedding=embedding,
+                    document=doc.page_content,
+                    cmetadata=doc.metadata,
+                    custom_id=doc_id,
+                    collection_id=collection_id,
+                )
+                for doc, doc_id, embedding in zip(documents, ids, embeddings)
+            )
+            await session.commit()
+        return ids
+
+    async def aclose(self) -> None:
+        """Dispose the async engine and its pooled connections."""
+        await self._async_engine.dispose()
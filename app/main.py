@@ -1,6 +1,7 @@
 """
 Main FastAPI application entry point.
 """
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -12,12 +13,44 @@ from app.core.config import get_settings
 from app.db import postgresql
 from app.core.model_registry import init_model_registry, get_model_registry
 from app.services.cache_service import get_cache_service
+from app.services.organization_service import organization_service
+from app.services.chat_service import get_chat_service
+from app.core.session_manager import get_session_manager
 from app.middleware import LoggingMiddleware
 from app.core.logger import get_logger
 
 # Initialize logger
 logger = get_logger("main")
 
+
+async def refresh_org_stats_periodically(interval: int):
+    """Keep the org_stats materialized view roughly current."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await organization_service.refresh_stats()
+        except Exception as exc:
+            logger.warning("Failed to refresh org_stats: %s", exc)
+
+
+async def cleanup_sessions_periodically(interval: int):
+    """Drop expired sessions from the in-process store and the Redis indexes."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await get_session_manager().cleanup_expired_sessions()
+        except Exception as exc:
+            logger.warning("Failed to clean up expired sessions: %s", exc)
+
+async def create_stream_chunk_partitions_periodically(interval: int, months_ahead: int):
+    """Keep message_stream_chunks partitions created ahead of the current month."""
+    while True:
+        try:
+            await get_chat_service().create_stream_chunk_partitions(months_ahead)
+        except Exception as exc:
+            logger.warning("Failed to create message_stream_chunks partitions: %s", exc)
+        await asyncio.sleep(interval)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -34,36 +67,45 @@ async def lifespan(app: FastAPI):
     logger.info("Application startup initiated")
     settings = get_settings()
 
-    # Initialize Redis cache
-    try:
-        cache_service = get_cache_service()
+    cache_service = get_cache_service()
+    registry = init_model_registry(settings)
+    postgresql.db_connection = postgresql.PostgreSQLConnection(settings.database_url)
+
+    async def init_cache():
         await cache_service.connect()
-        logger.info(f"Cache service initialized (enabled: {settings.ENABLE_RESPONSE_CACHE})")
-        print(f"✓ Cache service initialized (enabled: {settings.ENABLE_RESPONSE_CACHE})")
-    except Exception as e:
-        logger.error(f"Failed to initialize cache service: {e}", exc_info=True)
-        raise
-
-    # Initialize model registry
-    try:
-        registry = init_model_registry(settings)
+        logger.info(
+            "Cache service initialized (redis: %s, response cache: %s)",
+            cache_service.is_available, settings.ENABLE_RESPONSE_CACHE,
+        )
+        print(f"✓ Cache service initialized (redis: {cache_service.is_available})")
+        if not cache_service.is_available:
+            logger.warning("Redis unavailable: sessions are kept in-process and not shared across workers")
+
+    async def init_models():
         await registry.initialize()
         models = registry.list_chat_models()
-        logger.info(f"Loaded {len(models)} models: {[m['id'] for m in models]}")
-        logger.info(f"Model registry initialized with model: {settings.MODEL_NAME}")
+        logger.info("Loaded %d models: %s", len(models), [m['id'] for m in models])
+        logger.info("Model registry initialized with model: %s", settings.MODEL_NAME)
         print(f"✓ Model registry initialized with model: {settings.MODEL_NAME}")
-    except Exception as e:
-        logger.error(f"Failed to initialize model registry: {e}", exc_info=True)
-        raise
 
-    # Initialize database connection
-    try:
-        postgresql.db_connection = postgresql.PostgreSQLConnection(settings.database_url)
+    async def init_database():
         await postgresql.db_connection.connect()
         logger.info("Database connection established")
-    except Exception as e:
-        logger.error(f"Failed to connect to database: {e}", exc_info=True)
-        raise
+
+    # Redis, model warmup and Postgres are independent; connect to them concurrently
+    startup_steps = {
+        "initialize cache service": init_cache(),
+        "initialize model registry": init_models(),
+        "connect to database": init_database(),
+    }
+    results = await asyncio.gather(*startup_steps.values(), return_exceptions=True)
+    startup_error = None
+    for step, result in zip(startup_steps, results):
+        if isinstance(result, BaseException):
+            logger.error("Failed to %s: %s", step, result, exc_info=result)
+            startup_error = startup_error or result
+    if startup_error is not None:
+        raise startup_error
 
     # Initialize embeddings
     # embeddings = OpenAIEmbeddings()
@@ -84,7 +126,27 @@ async def lifespan(app: FastAPI):
     # Store services in app state
     # app.state.document_service = document_service
     # app.state.rag_service = rag_service
-    # app.state.db_connection = postgresql.db_connection
+    app.state.db_connection = postgresql.db_connection
+
+    org_stats_task = None
+    if settings.ORG_STATS_REFRESH_SECONDS > 0:
+        org_stats_task = asyncio.create_task(
+            refresh_org_stats_periodically(settings.ORG_STATS_REFRESH_SECONDS)
+        )
+    partition_task = None
+    if settings.STREAM_CHUNK_PARTITION_CHECK_SECONDS > 0:
+        # Runs once at startup, then on the interval
+        partition_task = asyncio.create_task(
+            create_stream_chunk_partitions_periodically(
+                settings.STREAM_CHUNK_PARTITION_CHECK_SECONDS,
+                settings.STREAM_CHUNK_PARTITION_MONTHS_AHEAD,
+            )
+        )
+    session_cleanup_task = None
+    if settings.SESSION_CLEANUP_SECONDS > 0:
+        session_cleanup_task = asyncio.create_task(
+            cleanup_sessions_periodically(settings.SESSION_CLEANUP_SECONDS)
+        )
 
     logger.info("Application startup completed")
 
@@ -92,26 +154,38 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutdown initiated")
-    try:
+
+    # Stop background jobs before their connections go away
+    background_tasks = [
+        task for task in (org_stats_task, partition_task, session_cleanup_task) if task is not None
+    ]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+    async def close_cache():
         await cache_service.disconnect()
         logger.info("Cache service disconnected")
         print("✓ Cache service disconnected")
-    except Exception as e:
-        logger.error(f"Error disconnecting cache service: {e}", exc_info=True)
 
-    try:
-        registry = get_model_registry()
-        await registry.shutdown()
+    async def close_model_registry():
+        await get_model_registry().shutdown()
         logger.info("Model registry shut down")
-    except Exception as e:
-        logger.error(f"Error shutting down model registry: {e}", exc_info=True)
 
-    try:
+    async def close_database():
         await postgresql.db_connection.close()
         logger.info("Database connection closed")
         print("✓ Database connection closed")
-    except Exception as e:
-        logger.error(f"Error closing database connection: {e}", exc_info=True)
+
+    shutdown_steps = {
+        "disconnecting cache service": close_cache(),
+        "shutting down model registry": close_model_registry(),
+        "closing database connection": close_database(),
+    }
+    results = await asyncio.gather(*shutdown_steps.values(), return_exceptions=True)
+    for step, result in zip(shutdown_steps, results):
+        if isinstance(result, BaseException):
+            logger.error("Error %s: %s", step, result, exc_info=result)
 
     logger.info("Application shutdown completed")
 
@@ -2,60 +2,142 @@
 Logging middleware for FastAPI application.
 Logs all incoming requests and outgoing responses with detailed information.
 """
+import itertools
+import logging
 import time
-import json
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+
+import orjson
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import get_settings
 from app.core.logger import get_logger
 
 logger = get_logger("middleware")
 
+# Documentation endpoints are fetched repeatedly and produce large, uninteresting log lines
+_SKIP_PATHS = frozenset({"/openapi.json", "/docs", "/redoc", "/docs/oauth2-redirect"})
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log HTTP requests and responses"""
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+_SENSITIVE_FIELDS = frozenset({
+    "password",
+    "confirm_password",
+    "token",
+    "access_token",
+    "refresh_token",
+    "secret",
+    "api_key",
+    "authorization",
+})
+_MASK = "***MASKED***"
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process the request and log details"""
+_RESPONSE_LEVELS = (logging.INFO, logging.WARNING, logging.ERROR)
 
-        # Generate request ID
-        request_id = request.headers.get("X-Request-ID", f"{int(time.time() * 1000)}")
+Headers = List[Tuple[bytes, bytes]]
 
-        # Start timer
-        start_time = time.time()
 
-        # Log incoming request
-        await self._log_request(request, request_id)
+def _decode_headers(headers: Headers) -> dict:
+    return {key.decode("latin-1"): value.decode("latin-1") for key, value in headers}
 
-        # Process request
-        try:
-            response = await call_next(request)
 
-            # Calculate duration
-            duration = time.time() - start_time
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware to log HTTP requests and responses.
+
+    Wraps only ``send`` to observe the response status and headers, avoiding the
+    extra task and Request/Response objects BaseHTTPMiddleware creates per call.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Bound once the logger is configured; matches _RESPONSE_LEVELS
+        self._log_fns = (logger.info, logger.warning, logger.error)
+        settings = get_settings()
+        # Request bodies are opt-in per path prefix and capped, so uploads are never buffered
+        self.body_path_prefixes = tuple(settings.LOG_BODY_PATH_PREFIXES)
+        self.body_max_bytes = settings.LOG_BODY_MAX_BYTES
+        # Per-path sampling; itertools.count is a cheap counter that needs no lock
+        self.sample_rates = {path: rate for path, rate in settings.LOG_SAMPLE_RATES.items() if rate > 1}
+        self._sample_counters = {path: itertools.count() for path in self.sample_rates}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-            # Log response
-            self._log_response(request, response, duration, request_id)
+        # Generate request ID
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None:
+            request_id = f"{int(time.time() * 1000)}"
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
+        # Start timer
+        start_ns = time.perf_counter_ns()
 
-            return response
+        # Sampled-out requests skip logging unless they fail
+        sampled_out = False
+        sample_rate = self.sample_rates.get(scope["path"])
+        if sample_rate:
+            sampled_out = next(self._sample_counters[scope["path"]]) % sample_rate != 0
 
+        # Log incoming request
+        if not sampled_out:
+            self._log_request(scope, request_id)
+
+        captured_body: Optional[bytearray] = None
+        if (
+            self.body_path_prefixes
+            and scope["method"] in _BODY_METHODS
+            and scope["path"].startswith(self.body_path_prefixes)
+        ):
+            captured_body = bytearray()
+            receive = self._tee_receive(receive, captured_body)
+
+        status_code = 500
+        response_headers: Headers = []
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Set the request ID header, replacing one the app may already have set
+                response_headers = [
+                    header for header in message.get("headers", [])
+                    if header[0].lower() != b"x-request-id"
+                ]
+                response_headers.append(request_id_header)
+                message["headers"] = response_headers
+            elif (
+                message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+                and not (sampled_out and status_code < 400)
+            ):
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                self._log_response(scope, status_code, response_headers, duration_ms, request_id, captured_body)
+            await send(message)
+
+        # Process request
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                "Request failed: %s %s",
+                scope["method"],
+                scope["path"],
                 extra={
                     "extra_data": {
                         "request_id": request_id,
-                        "method": request.method,
-                        "path": request.url.path,
-                        "duration": duration,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        # "duration" (seconds) is the original key; duration_ms was added alongside
+                        "duration": duration_ms / 1000,
+                        "duration_ms": duration_ms,
                         "error": str(e)
                     }
                 },
@@ -63,83 +145,96 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
 
-    async def _log_request(self, request: Request, request_id: str):
-        """Log incoming request details"""
+    def _tee_receive(self, receive: Receive, captured: bytearray) -> Receive:
+        """Wrap receive to copy up to body_max_bytes of the body as the app reads it"""
+        limit = self.body_max_bytes
+
+        async def tee() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(captured) < limit:
+                captured.extend(message.get("body", b"")[:limit - len(captured)])
+            return message
 
-        # Get request body if present
-        body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body_bytes = await request.body()
-                if body_bytes:
-                    body = body_bytes.decode("utf-8")
-                    # Try to parse as JSON for better logging
-                    try:
-                        body = json.loads(body)
-                        # Mask sensitive fields
-                        if isinstance(body, dict):
-                            body = self._mask_sensitive_data(body)
-                    except json.JSONDecodeError:
-                        pass
-            except Exception as e:
-                logger.warning(f"Could not read request body: {e}")
+        return tee
+
+    def _format_body(self, body_bytes: bytes):
+        """Decode a captured body for logging, masking sensitive JSON fields"""
+        # Try to parse as JSON for better logging; truncated bodies stay as text
+        try:
+            body = orjson.loads(body_bytes)
+        except orjson.JSONDecodeError:
+            return body_bytes.decode("utf-8", errors="replace")
+        # Mask sensitive fields
+        if isinstance(body, dict):
+            body = self._mask_sensitive_data(body)
+        return body
+
+    def _log_request(self, scope: Scope, request_id: str):
+        """Log incoming request details"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        client = scope.get("client")
+        extra_data = {
+            "request_id": request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_params": dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+            "client_host": client[0] if client else None,
+        }
+        # Headers include Authorization and bloat every line; only collect them for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            extra_data["headers"] = _decode_headers(scope["headers"])
 
         logger.info(
-            f"→ {request.method} {request.url.path}",
-            extra={
-                "extra_data": {
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "query_params": dict(request.query_params),
-                    "headers": dict(request.headers),
-                    "client_host": request.client.host if request.client else None,
-                    "body": body
-                }
-            }
+            "→ %s %s",
+            scope["method"],
+            scope["path"],
+            extra={"extra_data": extra_data}
         )
 
-    def _log_response(self, request: Request, response: Response, duration: float, request_id: str):
+    def _log_response(
+        self,
+        scope: Scope,
+        status_code: int,
+        headers: Headers,
+        duration_ms: int,
+        request_id: str,
+        body_bytes: Optional[bytearray] = None,
+    ):
         """Log outgoing response details"""
 
-        log_level = "info"
-        if response.status_code >= 500:
-            log_level = "error"
-        elif response.status_code >= 400:
-            log_level = "warning"
-
-        log_message = f"← {request.method} {request.url.path} - {response.status_code} ({duration:.3f}s)"
-
-        log_data = {
-            "extra_data": {
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration": duration,
-                "response_headers": dict(response.headers)
-            }
+        # Index into the per-level tables by status class: 0 = ok, 1 = 4xx, 2 = 5xx
+        idx = 2 if status_code >= 500 else 1 if status_code >= 400 else 0
+        if not logger.isEnabledFor(_RESPONSE_LEVELS[idx]):
+            return
+
+        extra_data = {
+            "request_id": request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "duration": duration_ms / 1000,
+            "duration_ms": duration_ms,
         }
+        if logger.isEnabledFor(logging.DEBUG):
+            extra_data["response_headers"] = _decode_headers(headers)
+        if body_bytes:
+            extra_data["request_body"] = self._format_body(bytes(body_bytes))
 
         # Log at appropriate level
-        getattr(logger, log_level)(log_message, extra=log_data)
+        self._log_fns[idx](
+            "← %s %s - %d (%dms)",
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration_ms,
+            extra={"extra_data": extra_data},
+        )
 
     def _mask_sensitive_data(self, data: dict) -> dict:
         """Mask sensitive fields in request/response data"""
-        sensitive_fields = [
-            "password",
-            "confirm_password",
-            "token",
-            "access_token",
-            "refresh_token",
-            "secret",
-            "api_key",
-            "authorization"
-        ]
-
-        masked_data = data.copy()
-        for field in sensitive_fields:
-            if field in masked_data:
-                masked_data[field] = "***MASKED***"
-
-        return masked_data
+        hits = _SENSITIVE_FIELDS & data.keys()
+        if not hits:
+            return data
+        return {key: (_MASK if key in hits else value) for key, value in data.items()}
@@ -2,9 +2,11 @@
 SQLAlchemy models package.
 Import all models here to ensure relationships are properly resolved.
 """
+from sqlalchemy.orm import configure_mappers
+
 from app.models.base import Base
 from app.models.user_model import User
-from app.models.organization_model import Organization
+from app.models.organization_model import Organization, OrgStats
 from app.models.organization_membership_model import OrganizationMembership
 from app.models.auth_model import AuthSession
 from app.models.project_model import Project
@@ -20,10 +22,14 @@ from app.models.message_model import (
 )
 from app.models.assistant_preset_model import AssistantPreset
 
+# Resolve relationships once at import time instead of on the first query
+configure_mappers()
+
 __all__ = [
     "Base",
     "User",
     "Organization",
+    "OrgStats",
     "OrganizationMembership",
     "AuthSession",
     "Project",
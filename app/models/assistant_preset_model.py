@@ -1,11 +1,12 @@
 """
 Assistant preset model for saved chat configurations.
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Float
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from typing import Any, Optional
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Float, LargeBinary, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+import orjson
 
 from app.models.base import Base
 
@@ -13,7 +14,7 @@ from app.models.base import Base
 class AssistantPreset(Base):
     __tablename__ = "assistant_presets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True)
     name = Column(String, nullable=False)
@@ -21,9 +22,11 @@ class AssistantPreset(Base):
     model_label = Column(String, nullable=False)
     temperature = Column(Float, nullable=True)
     top_p = Column(Float, nullable=True)
-    tools_json = Column(JSONB, nullable=True)
+    # Tool config is only ever read whole, so it is stored as orjson bytes rather
+    # than JSONB that Postgres would parse on write and the driver decode on read
+    tools_blob = Column(LargeBinary, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     organization = relationship("Organization", back_populates="assistant_presets")
     project = relationship("Project", back_populates="assistant_presets")
@@ -33,3 +36,11 @@ class AssistantPreset(Base):
     __table_args__ = (
         UniqueConstraint("project_id", "name", name="uq_project_preset_name"),
     )
+
+    @property
+    def tools(self) -> Optional[Any]:
+        return orjson.loads(self.tools_blob) if self.tools_blob is not None else None
+
+    @tools.setter
+    def tools(self, value: Optional[Any]) -> None:
+        self.tools_blob = orjson.dumps(value) if value is not None else None
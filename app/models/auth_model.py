@@ -8,7 +8,7 @@ class AuthSession(Base):
     """Authentication session model"""
     __tablename__ = "auth_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     refresh_token = Column(String, unique=True, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,6 +1,24 @@
 """
 Shared declarative base for all SQLAlchemy models.
 """
+import os
+import time
+import uuid
+
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so keys generated
+    close together land on the same B-tree pages instead of random ones.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Set version (0111) and variant (10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
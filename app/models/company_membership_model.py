@@ -1,22 +0,0 @@
-"""
-Organization membership model to associate users with organizations at any level.
-Replaces CompanyMembership to support hierarchical organizations.
-"""
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-
-from app.models.base import Base
-
-
-class OrganizationMembership(Base):
-    __tablename__ = "organization_memberships"
-
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    role = Column(String, nullable=False, default="member")  # owner/admin/member/viewer
-    joined_at = Column(DateTime(timezone=True), server_default=func.now())
-
-    organization = relationship("Organization", back_populates="memberships")
-    user = relationship("User", back_populates="organization_memberships")
@@ -8,27 +8,29 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     UniqueConstraint,
+    Index,
+    FetchedValue,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship, synonym
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 
 class Conversation(Base):
     __tablename__ = "conversations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=True)
     model_label = Column(String, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     preset_id = Column(UUID(as_uuid=True), ForeignKey("assistant_presets.id", ondelete="SET NULL"), nullable=True)
     is_archived = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
+    updated_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), server_onupdate=FetchedValue())
 
     project = relationship("Project", back_populates="conversations")
     creator = relationship("User", foreign_keys=[created_by])
@@ -42,12 +44,19 @@ class Conversation(Base):
         "Message",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
-    # Backwards compatibility for legacy code referencing conversation_id.
-    conversation_id = synonym("id")
-    name = synonym("title")
-    model = synonym("model_label")
+    # Fetch server-generated timestamps with RETURNING on flush instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Listing a project's conversations almost always excludes archived ones
+        Index("ix_conversations_active", "project_id", postgresql_where=text("NOT is_archived")),
+        # Matches the listing sort key, so keyset pages are index range seeks
+        Index("ix_conversations_recency", func.coalesce(updated_at, created_at).desc(), id.desc()),
+    )
 
 
 class ConversationParticipant(Base):
@@ -64,7 +73,7 @@ class ConversationParticipant(Base):
         primary_key=True,
     )
     role = Column(String, nullable=False, default="member")
-    added_at = Column(DateTime(timezone=True), server_default=func.now())
+    added_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     conversation = relationship("Conversation", back_populates="participants")
     user = relationship("User", back_populates="conversation_memberships")
@@ -1,15 +1,17 @@
-from sqlalchemy import Column, ForeignKey, String, DateTime, Text, Integer, Float
+from sqlalchemy import Column, ForeignKey, String, DateTime, Text, Integer, Index, FetchedValue, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy.dialects.postgresql import UUID
+from pgvector.sqlalchemy import HALFVEC
 from app.models.base import Base
 
+# Dimension of the stored embeddings; changing it requires a migration
+EMBEDDING_DIM = 1536
+
 
 class Document(Base):
     __tablename__ = 'documents'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id', ondelete="CASCADE"), nullable=False, index=True)
     
     filename = Column(String, nullable=False)
@@ -18,19 +20,36 @@ class Document(Base):
     title = Column(String, nullable=True)
     content = Column(Text, nullable=True)  # Extracted text content
     
-    # Vector embedding for RAG search (stored as array of floats)
-    vector_embedding = Column(ARRAY(Float), nullable=True)  # For semantic search
+    # Vector embedding for RAG search (pgvector halfvec: fp16 halves storage and index size)
+    vector_embedding = Column(HALFVEC(EMBEDDING_DIM), nullable=True)  # For semantic search
     
     # Metadata
     file_size_bytes = Column(Integer, nullable=True)
     uploaded_by = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
+    updated_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), server_onupdate=FetchedValue())
     
     # Relationships
     project = relationship("Project", back_populates="documents")
     uploader = relationship("User", foreign_keys=[uploaded_by])
     citations = relationship("MessageCitation", back_populates="document", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            "ix_documents_embedding_hnsw",
+            "vector_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"vector_embedding": "halfvec_cosine_ops"},
+        ),
+        # Keyword search matches ILIKE '%kw%' against title and content joined into
+        # one string; DocumentRepository.search_documents uses this exact expression
+        Index(
+            "ix_documents_search_trgm",
+            text("(coalesce(title, '') || ' ' || coalesce(content, '')) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
     def __repr__(self):
         return f"<Document(filename={self.filename}, project_id={self.project_id})>"
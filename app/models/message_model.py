@@ -8,23 +8,25 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     Integer,
+    BigInteger,
     Float,
     JSON,
     CheckConstraint,
     UniqueConstraint,
+    Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 
 class Message(Base):
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Time-ordered ids keep message inserts at the tail of the primary key index
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     conversation_id = Column(
         UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
@@ -51,18 +53,54 @@ class Message(Base):
     # Tool calls stored as JSON (replaces separate ToolCall model for simplicity)
     tool_calls_json = Column(JSON, nullable=True)
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     conversation = relationship("Conversation", back_populates="messages")
     parent = relationship("Message", remote_side="Message.id", back_populates="children")
     children = relationship("Message", back_populates="parent", cascade="all, delete-orphan")
     author = relationship("User", back_populates="authored_messages")
 
-    revisions = relationship("MessageRevision", back_populates="message", cascade="all, delete-orphan")
-    stream_chunks = relationship("MessageStreamChunk", back_populates="message", cascade="all, delete-orphan")
-    citations = relationship("MessageCitation", back_populates="message", cascade="all, delete-orphan")
-    attachments = relationship("MessageAttachment", back_populates="message", cascade="all, delete-orphan")
-    usage = relationship("MessageUsage", back_populates="message", uselist=False, cascade="all, delete-orphan")
+    # Collections must be loaded explicitly with selectinload(); an accidental lazy
+    # load per message raises instead of silently issuing N extra queries.
+    # passive_deletes lets the ON DELETE CASCADE foreign keys remove the rows.
+    revisions = relationship(
+        "MessageRevision",
+        back_populates="message",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    stream_chunks = relationship(
+        "MessageStreamChunk",
+        back_populates="message",
+        cascade="all, delete-orphan",
+        order_by="MessageStreamChunk.seq_start",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    citations = relationship(
+        "MessageCitation",
+        back_populates="message",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    attachments = relationship(
+        "MessageAttachment",
+        back_populates="message",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    # One-to-one and small, so it rides along on the message query
+    usage = relationship(
+        "MessageUsage",
+        back_populates="message",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="joined",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -73,33 +111,62 @@ class Message(Base):
             "state IN ('draft','streaming','final','error')",
             name="ck_message_state",
         ),
+        # "Latest N messages of a conversation" and "children of a parent in order"
+        # become ordered index scans instead of scan + sort; id breaks timestamp
+        # ties so keyset pages over (created_at, id) follow the index exactly
+        Index("ix_messages_conv_created", "conversation_id", "created_at", "id"),
+        Index("ix_messages_parent_created", "parent_message_id", "created_at"),
+        # Failed generations are a small fraction of rows; index only those
+        Index("ix_messages_errors", "created_at", postgresql_where=text("state = 'error'")),
     )
 
 
 class MessageStreamChunk(Base):
+    """
+    A batch of consecutive stream deltas for a message.
+
+    Deltas are buffered and written several per row, so a streamed reply costs a
+    handful of inserts instead of one per token. Row ``n`` holds the deltas with
+    sequence numbers ``seq_start .. seq_start + len(deltas) - 1``.
+
+    The table is range-partitioned by month on ``created_at_ms`` so expired
+    chunks are removed by dropping a partition rather than a bulk DELETE.
+    Partitioned tables require the partition key in every unique constraint,
+    so ``(message_id, seq_start)`` is indexed but no longer enforced as unique.
+    """
     __tablename__ = "message_stream_chunks"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False)
-    seq = Column(Integer, nullable=False)
-    delta = Column(Text, nullable=False)
+    seq_start = Column(Integer, nullable=False)
+    deltas = Column(ARRAY(Text), nullable=False)
+    # Epoch milliseconds: internal-only and serialized as a plain int
+    created_at_ms = Column(
+        BigInteger,
+        primary_key=True,
+        server_default=text("(extract(epoch from CURRENT_TIMESTAMP) * 1000)::bigint"),
+    )
 
     message = relationship("Message", back_populates="stream_chunks")
 
     __table_args__ = (
-        UniqueConstraint("message_id", "seq", name="uq_message_stream_chunk"),
+        Index("ix_message_stream_chunks_message_seq", "message_id", "seq_start"),
+        {"postgresql_partition_by": "RANGE (created_at_ms)"},
     )
 
 
 class MessageRevision(Base):
     __tablename__ = "message_revisions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Sequential key keeps inserts append-only in the primary key index;
+    # public_id is the identifier to hand out externally
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    public_id = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid7, server_default=text("gen_random_uuid()"))
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False)
     rev_no = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     model_label = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     message = relationship("Message", back_populates="revisions")
 
@@ -111,13 +178,13 @@ class MessageRevision(Base):
 class MessageAttachment(Base):
     __tablename__ = "message_attachments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), nullable=False)
     file_uri = Column(String, nullable=False)
     file_name = Column(String, nullable=True)
     mime_type = Column(String, nullable=True)
     size_bytes = Column(Integer, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     message = relationship("Message", back_populates="attachments")
 
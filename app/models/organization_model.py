@@ -2,21 +2,24 @@
 Organization model: Hierarchical structure for country/company/department.
 Supports nested organizations with shared RAG stores.
 """
-from sqlalchemy import Column, String, ForeignKey, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, ForeignKey, DateTime, Enum, Integer, FetchedValue, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 
 class Organization(Base):
     __tablename__ = "organizations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    name = Column(String, nullable=False, index=True)
-    type = Column(String, nullable=False, default="company")  # country/company/department
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
+    name = Column(String, nullable=False)
+    type = Column(
+        Enum("country", "company", "department", name="org_type"),
+        nullable=False,
+        default="company",
+    )
     description = Column(String, nullable=True)
     
     # Hierarchical structure: self-referencing for parent organizations
@@ -29,13 +32,13 @@ class Organization(Base):
     
     # RAG configuration for this organization level
     rag_vector_store_id = Column(String, nullable=True)
-    rag_config = Column(JSON, nullable=True)  # Store RAG settings as JSON
+    rag_config = Column(JSONB, nullable=True)  # Store RAG settings as JSONB
     
     # Metadata
     country = Column(String, nullable=True)
     location = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), server_onupdate=FetchedValue())
 
     # Relationships
     parent = relationship(
@@ -43,20 +46,26 @@ class Organization(Base):
         remote_side="Organization.id",
         back_populates="children"
     )
+    # Left as lazy "select": eagerly loading a self-referential tree would recurse
     children = relationship(
         "Organization",
         back_populates="parent",
         cascade="all, delete-orphan"
     )
+    # Small, read-heavy collection: one batched IN (...) query for all loaded orgs
     memberships = relationship(
         "OrganizationMembership",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
+    # Opt in with selectinload(); deletes rely on the ON DELETE CASCADE key
     projects = relationship(
         "Project",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     assistant_presets = relationship(
         "AssistantPreset",
@@ -64,5 +73,26 @@ class Organization(Base):
         cascade="all, delete-orphan"
     )
 
+    # Trigram GIN serves both exact and ILIKE '%...%' lookups on name
+    __table_args__ = (
+        Index("ix_org_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
     def __repr__(self):
         return f"<Organization(name={self.name}, type={self.type}, parent_id={self.parent_organization_id})>"
+
+
+class OrgStats(Base):
+    """
+    Read-only mapping of the ``org_stats`` materialized view.
+
+    Per-organization project and member counts, refreshed periodically with
+    ``REFRESH MATERIALIZED VIEW CONCURRENTLY`` instead of aggregating on read.
+    """
+    __tablename__ = "org_stats"
+    __table_args__ = {"info": {"is_view": True}}
+
+    organization_id = Column(UUID(as_uuid=True), primary_key=True)
+    project_count = Column(Integer, nullable=False)
+    rag_project_count = Column(Integer, nullable=False)
+    member_count = Column(Integer, nullable=False)
@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, JSON, Integer, Float, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Float, Boolean, FetchedValue, Index, text
+from sqlalchemy.orm import query_expression, relationship
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import UUID
-from app.models.base import Base
-import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.models.base import Base, uuid7
 
 class Project(Base):
     __tablename__ = 'projects'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     name = Column(String, unique=True, index=True, nullable=False)
     description = Column(String, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
@@ -19,24 +18,46 @@ class Project(Base):
     rag_vector_store_id = Column(String, nullable=True)
     rag_chunk_size = Column(Integer, default=1000)
     rag_chunk_overlap = Column(Integer, default=200)
-    rag_config = Column(JSON, nullable=True)  # Additional RAG settings
+    rag_config = Column(JSONB, nullable=True)  # Additional RAG settings
     
     # Project Rules and Settings
-    rules = Column(JSON, nullable=True)  # Department-specific rules/guidelines
+    rules = Column(JSONB, nullable=True)  # Department-specific rules/guidelines
     default_model = Column(String, default="gpt-4")  # Default AI model
     system_prompt = Column(String, nullable=True)  # Project-level instructions
 
-    start_date = Column(DateTime(timezone=True), server_default=func.now())
+    start_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), server_onupdate=FetchedValue())
 
     # Relationships
     organization = relationship("Organization", back_populates="projects")
-    conversations = relationship("Conversation", back_populates="project", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="project", cascade="all, delete-orphan")
+    # Large collections (documents carry their text and embedding): load them only
+    # through an explicit selectinload(); the ON DELETE CASCADE keys remove the rows
+    conversations = relationship(
+        "Conversation", back_populates="project", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True,
+    )
+    documents = relationship(
+        "Document", back_populates="project", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True,
+    )
     assistant_presets = relationship("AssistantPreset", back_populates="project", cascade="all, delete-orphan")
 
+    # Filled per query with with_expression() (see ProjectRepository); None otherwise
+    conversation_count = query_expression()
+    document_count = query_expression()
+
+    # GIN indexes serve containment lookups such as rules @> '{"dept": "..."}'
+    __table_args__ = (
+        # Ids are time-ordered (uuid7), so created_at follows heap order and a tiny BRIN suffices
+        Index("brin_projects_created_at", "created_at", postgresql_using="brin"),
+        # The unique btree on name stays for the constraint; substring search uses the trigram index
+        Index("ix_projects_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_projects_rag_config", "rag_config", postgresql_using="gin", postgresql_ops={"rag_config": "jsonb_path_ops"}),
+        Index("ix_projects_rules", "rules", postgresql_using="gin", postgresql_ops={"rules": "jsonb_path_ops"}),
+    )
+
     def __repr__(self):
         return f"<Project(name={self.name}, organization_id={self.organization_id})>"
     
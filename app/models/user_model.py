@@ -1,17 +1,15 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from passlib.context import CryptContext
-import uuid
+from app.core.jwt import get_password_hash, verify_password as verify_password_hash
 from app.models.base import Base
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 class User(Base):
     __tablename__ = 'users'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     full_name = Column(String, nullable=True)
@@ -29,12 +27,12 @@ class User(Base):
     
     def verify_password(self, password: str) -> bool:
         """Verify a plain password against the hashed password"""
-        return pwd_context.verify(password, self.hashed_password)
+        return verify_password_hash(password, self.hashed_password)
     
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a plain password"""
-        return pwd_context.hash(password)
+        return get_password_hash(password)
 
     def __repr__(self):
         return f"<User(username={self.username}, email={self.email}, full_name={self.full_name})>"
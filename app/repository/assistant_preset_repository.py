@@ -1,5 +1,6 @@
 from typing import Optional, List, Dict, Any
 
+import orjson
 from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -27,13 +28,13 @@ class AssistantPresetRepository:
             "model_label": preset.model_label,
             "temperature": preset.temperature,
             "top_p": preset.top_p,
-            "tools": preset.tools_json,
+            "tools": preset.tools,
             "created_by": str(preset.created_by) if preset.created_by else None,
             "created_at": preset.created_at,
         }
         if include_usage:
             payload["conversation_ids"] = [
-                str(conv.conversation_id) for conv in preset.conversations
+                str(conv.id) for conv in preset.conversations
             ]
         return payload
 
@@ -58,7 +59,7 @@ class AssistantPresetRepository:
             model_label=model_label,
             temperature=temperature,
             top_p=top_p,
-            tools_json=tools_json,
+            tools=tools_json,
             created_by=created_by,
         )
         self.db.add(preset)
@@ -114,7 +115,7 @@ class AssistantPresetRepository:
         if top_p is not None:
             changes["top_p"] = top_p
         if tools_json is not None:
-            changes["tools_json"] = tools_json
+            changes["tools_blob"] = orjson.dumps(tools_json)
         if project_id is not None:
             changes["project_id"] = project_id
 
@@ -126,13 +127,18 @@ class AssistantPresetRepository:
             .where(AssistantPreset.id == preset_id)
             .values(**changes)
             .returning(AssistantPreset)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
         return result.scalar_one_or_none()
 
     async def delete_preset(self, preset_id: str) -> bool:
-        stmt = delete(AssistantPreset).where(AssistantPreset.id == preset_id)
+        stmt = (
+            delete(AssistantPreset)
+            .where(AssistantPreset.id == preset_id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.db.execute(stmt)
         await self.db.commit()
         return result.rowcount > 0
@@ -1,12 +1,16 @@
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
-
-from sqlalchemy import select, update
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Text, cast, insert, literal, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import func
 
 from app.core.response_status import *
-from app.db.postgresql import get_db_connection
+from app.models.base import uuid7
 from app.models.conversation_model import Conversation, ConversationParticipant
 from app.models.message_model import (
     Message,
@@ -18,63 +22,112 @@ from app.models.message_model import (
 )
 
 
+# Columns read by _serialize_conversation; selecting them directly returns plain
+# rows and skips ORM instance hydration and identity-map bookkeeping. UUID columns
+# are cast to text in SQL so rows arrive with ready-to-serialize strings.
+_CONVERSATION_COLUMNS = (
+    cast(Conversation.id, Text).label("id"),
+    Conversation.title,
+    Conversation.model_label,
+    cast(Conversation.created_by, Text).label("created_by"),
+    cast(Conversation.project_id, Text).label("project_id"),
+    cast(Conversation.preset_id, Text).label("preset_id"),
+    Conversation.is_archived,
+    Conversation.created_at,
+    Conversation.updated_at,
+)
+
+# Columns read by _serialize_message when no relationships are requested
+_MESSAGE_COLUMNS = (
+    Message.id,
+    Message.conversation_id,
+    Message.parent_message_id,
+    Message.author_user_id,
+    Message.role,
+    Message.content,
+    Message.state,
+    Message.model_label,
+    Message.temperature,
+    Message.top_p,
+    Message.created_at,
+)
+
+# Result sets at least this large are serialized in a worker thread
+_SERIALIZE_IN_THREAD_MIN = 50
+
+# Reply chains deeper than this are cut off when loading a thread
+_THREAD_MAX_DEPTH = 200
+
+
 class ChatRepository:
     """
     Repository responsible for working with conversation data (formerly chats).
     """
 
-    def __init__(self):
-        self.db_connection = None
-
-    def _get_db_connection(self):
-        """Get database connection instance"""
-        if self.db_connection is None:
-            self.db_connection = get_db_connection()
-        return self.db_connection
+    def __init__(self, db: AsyncSession):
+        # One session per request/operation, shared by every call on this repository
+        self.db = db
+        # Stream deltas waiting to be written, one buffer per message
+        self._stream_buffers: Dict[str, "StreamChunkBuffer"] = {}
 
     # ------------------------------------------------------------------
     # Conversation helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _serialize_conversation(conversation: Conversation) -> Dict[str, Any]:
+    def _serialize_conversation(conversation) -> Dict[str, Any]:
+        """Serialize a row of _CONVERSATION_COLUMNS."""
         return {
-            "conversation_id": str(conversation.conversation_id),
+            "conversation_id": conversation.id,
             "title": conversation.title,
-            "model": conversation.model,
-            "created_by": str(conversation.created_by) if conversation.created_by else None,
-            "project_id": str(conversation.project_id) if conversation.project_id else None,
-            "preset_id": str(conversation.preset_id) if conversation.preset_id else None,
+            "model": conversation.model_label,
+            "created_by": conversation.created_by,
+            "project_id": conversation.project_id,
+            "preset_id": conversation.preset_id,
             "is_archived": conversation.is_archived,
             "created_at": conversation.created_at,
             "updated_at": conversation.updated_at,
         }
 
+    @staticmethod
+    def _recency_page(stmt, limit: int, after: Optional[Tuple[datetime, UUID]]):
+        """Order newest first and seek past ``after`` instead of using OFFSET."""
+        recency = func.coalesce(Conversation.updated_at, Conversation.created_at)
+        if after is not None:
+            # Typed binds: untyped ones go out as VARCHAR / naive TIMESTAMP, which
+            # Postgres cannot compare with uuid and asyncpg rejects for aware datetimes
+            cursor = tuple_(
+                literal(after[0], Conversation.updated_at.type),
+                literal(UUID(str(after[1])), Conversation.id.type),
+            )
+            stmt = stmt.where(tuple_(recency, Conversation.id) < cursor)
+        return stmt.order_by(recency.desc(), Conversation.id.desc()).limit(limit)
+
     # ------------------------------------------------------------------
     # Conversation CRUD
     # ------------------------------------------------------------------
     async def user_has_access(self, conversation_id: str, user_id: str) -> bool:
         """Check if a user has access to a conversation (creator or participant)."""
         try:
-            async for session in self._get_db_connection().get_session():
-                # Check creator
-                result = await session.execute(
-                    select(Conversation).where(
-                        Conversation.conversation_id == conversation_id,
-                        Conversation.created_by == user_id,
-                    )
+            # Creator or participant, resolved in one round trip
+            stmt = (
+                select(literal(1))
+                .select_from(Conversation)
+                .outerjoin(
+                    ConversationParticipant,
+                    (ConversationParticipant.conversation_id == Conversation.id)
+                    & (ConversationParticipant.user_id == user_id),
                 )
-                if result.scalar_one_or_none() is not None:
-                    return True
-
-                # Check participant
-                result = await session.execute(
-                    select(ConversationParticipant).where(
-                        ConversationParticipant.conversation_id == conversation_id,
-                        ConversationParticipant.user_id == user_id,
-                    )
+                .where(
+                    Conversation.id == conversation_id,
+                    (Conversation.created_by == user_id)
+                    | (ConversationParticipant.user_id.is_not(None)),
                 )
-                return result.scalar_one_or_none() is not None
+                .limit(1)
+            )
+            result = await self.db.execute(stmt)
+            return result.first() is not None
         except Exception:
+            await self.db.rollback()
             return False
 
     async def create_chat(
@@ -96,8 +149,10 @@ class ChatRepository:
             return ValidationError(message="project_id is required to create a chat", error_code="4002")
 
         try:
-            async for session in self._get_db_connection().get_session():
-                new_chat = Conversation(
+            # RETURNING brings back the server defaults; no refresh SELECT needed
+            result = await self.db.execute(
+                insert(Conversation)
+                .values(
                     project_id=project_id,
                     title=title,
                     model_label=model,
@@ -105,53 +160,114 @@ class ChatRepository:
                     preset_id=preset_id,
                     is_archived=False,
                 )
-                session.add(new_chat)
-                await session.commit()
-                await session.refresh(new_chat)
-                return OK(
-                    message="Chat created successfully",
-                    data=self._serialize_conversation(new_chat),
-                )
+                .returning(*_CONVERSATION_COLUMNS)
+            )
+            new_chat = result.one()
+            await self.db.commit()
+            return OK(
+                message="Chat created successfully",
+                data=self._serialize_conversation(new_chat),
+            )
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to create chat: {str(e)}", error_code="5000")
 
+    async def create_chats_bulk(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many conversations in one batched INSERT ... RETURNING.
+
+        Each row takes the ``create_chat`` fields: project_id (required), title,
+        model, created_by and preset_id. Ids are generated here so no per-row
+        default fires during the insert.
+        """
+        if not rows:
+            return OK(message="No chats to create", data=[])
+        if any(not row.get("project_id") for row in rows):
+            return ValidationError(message="project_id is required to create a chat", error_code="4002")
+
+        params = [
+            {
+                "id": uuid7(),
+                "project_id": row["project_id"],
+                "title": row.get("title"),
+                "model_label": row.get("model"),
+                "created_by": row.get("created_by"),
+                "preset_id": row.get("preset_id"),
+                "is_archived": False,
+            }
+            for row in rows
+        ]
+        try:
+            result = await self.db.execute(insert(Conversation).returning(*_CONVERSATION_COLUMNS), params)
+            chats = result.all()
+            await self.db.commit()
+            return OK(
+                message="Chats created successfully",
+                data=[self._serialize_conversation(chat) for chat in chats],
+            )
+        except Exception as e:
+            await self.db.rollback()
+            return InternalError(message=f"Failed to create chats: {str(e)}", error_code="5000")
+
     async def get_chat_by_id(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a conversation by identifier."""
         try:
-            async for session in self._get_db_connection().get_session():
-                result = await session.execute(
-                    select(Conversation).filter(Conversation.conversation_id == conversation_id)
-                )
-                chat = result.scalar_one_or_none()
-                return (
-                    self._serialize_conversation(chat)
-                    if chat
-                    else ChatNotFound(message="Chat not found", error_code="4004")
-                )
+            result = await self.db.execute(
+                select(*_CONVERSATION_COLUMNS).where(Conversation.id == conversation_id)
+            )
+            chat = result.one_or_none()
+            return (
+                self._serialize_conversation(chat)
+                if chat
+                else ChatNotFound(message="Chat not found", error_code="4004")
+            )
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to get chat by ID: {str(e)}", error_code="5000")
 
+    async def get_chats_by_ids(self, conversation_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch many conversations in one query.
+
+        Returns one entry per requested id, in the same order, with None for
+        ids that do not exist. Use instead of calling get_chat_by_id in a loop.
+        """
+        if not conversation_ids:
+            return []
+        try:
+            result = await self.db.execute(
+                select(*_CONVERSATION_COLUMNS).where(Conversation.id.in_(set(conversation_ids)))
+            )
+            by_id = {chat.id: self._serialize_conversation(chat) for chat in result}
+            return [by_id.get(str(conversation_id)) for conversation_id in conversation_ids]
+        except Exception as e:
+            await self.db.rollback()
+            return InternalError(message=f"Failed to get chats by ID: {str(e)}", error_code="5000")
+
     async def list_chats(
         self,
         *,
         project_id: Optional[str] = None,
         company_id: Optional[str] = None,
         limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Dict[str, Any]]:
-        """List conversations filtered by project or company, newest first."""
+        """
+        List conversations filtered by project or company, newest first.
+        Pass the (updated_at, conversation_id) of the last row seen as ``after``
+        to fetch the next page.
+        """
         try:
-            async for session in self._get_db_connection().get_session():
-                order_expr = func.coalesce(Conversation.updated_at, Conversation.created_at)
-                stmt = select(Conversation).order_by(order_expr.desc()).limit(limit)
-                if project_id:
-                    stmt = stmt.where(Conversation.project_id == project_id)
-                if company_id:
-                    stmt = stmt.where(Conversation.company_id == company_id)
-
-                result = await session.execute(stmt)
-                chats = result.scalars().all()
-                return [self._serialize_conversation(chat) for chat in chats]
+            stmt = self._recency_page(select(*_CONVERSATION_COLUMNS), limit, after)
+            if project_id:
+                stmt = stmt.where(Conversation.project_id == project_id)
+            if company_id:
+                stmt = stmt.where(Conversation.company_id == company_id)
+
+            result = await self.db.execute(stmt)
+            return [self._serialize_conversation(chat) for chat in result]
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to list chats: {str(e)}", error_code="5000")
 
     async def list_chats_for_user(
@@ -161,37 +277,36 @@ class ChatRepository:
         project_id: Optional[str] = None,
         company_id: Optional[str] = None,
         limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Dict[str, Any]]:
         """List conversations visible to a user (creator or participant), newest first."""
         try:
-            async for session in self._get_db_connection().get_session():
-                order_expr = func.coalesce(Conversation.updated_at, Conversation.created_at)
-
-                # Base query: conversations created by user OR where user participates
-                stmt = (
-                    select(Conversation)
-                    .outerjoin(
-                        ConversationParticipant,
-                        (ConversationParticipant.conversation_id == Conversation.conversation_id)
-                        & (ConversationParticipant.user_id == user_id),
-                    )
-                    .where(
-                        (Conversation.created_by == user_id)
-                        | (ConversationParticipant.user_id == user_id)
-                    )
-                    .order_by(order_expr.desc())
-                    .limit(limit)
-                )
-
-                if project_id:
-                    stmt = stmt.where(Conversation.project_id == project_id)
-                if company_id:
-                    stmt = stmt.where(Conversation.company_id == company_id)
 
-                result = await session.execute(stmt)
-                chats = result.scalars().unique().all()
-                return [self._serialize_conversation(chat) for chat in chats]
+            # Conversations created by user OR where user participates; EXISTS is a
+            # semi-join, so it can never multiply rows and needs no participant columns
+            is_participant = (
+                select(literal(1))
+                .where(
+                    ConversationParticipant.conversation_id == Conversation.id,
+                    ConversationParticipant.user_id == user_id,
+                )
+                .exists()
+            )
+            stmt = self._recency_page(
+                select(*_CONVERSATION_COLUMNS).where((Conversation.created_by == user_id) | is_participant),
+                limit,
+                after,
+            )
+
+            if project_id:
+                stmt = stmt.where(Conversation.project_id == project_id)
+            if company_id:
+                stmt = stmt.where(Conversation.company_id == company_id)
+
+            result = await self.db.execute(stmt)
+            return [self._serialize_conversation(chat) for chat in result]
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to list user chats: {str(e)}", error_code="5000")
 
     async def update_chat(
@@ -205,62 +320,66 @@ class ChatRepository:
     ) -> Dict[str, Any]:
         """Update conversation metadata."""
         try:
-            async for session in self._get_db_connection().get_session():
-                result = await session.execute(
-                    select(Conversation).filter(Conversation.conversation_id == conversation_id)
+            changes: Dict[str, Any] = {}
+            if title is not None:
+                changes["title"] = title
+            if model is not None:
+                changes["model_label"] = model
+            if preset_id is not None:
+                changes["preset_id"] = preset_id
+            if is_archived is not None:
+                changes["is_archived"] = is_archived
+
+            if changes:
+                # Single UPDATE ... RETURNING; the trigger-maintained updated_at comes back with it.
+                # Returning plain columns keeps the result out of the identity map.
+                result = await self.db.execute(
+                    update(Conversation)
+                    .where(Conversation.id == conversation_id)
+                    .values(**changes)
+                    .returning(*_CONVERSATION_COLUMNS)
+                    .execution_options(synchronize_session=False)
                 )
-                chat = result.scalar_one_or_none()
-                if not chat:
-                    return ChatNotFound(message="Chat not found", error_code="4004")
-
-                if title is not None:
-                    chat.title = title
-                if model is not None:
-                    chat.model_label = model
-                if preset_id is not None:
-                    chat.preset_id = preset_id
-                if is_archived is not None:
-                    chat.is_archived = is_archived
-
-                chat.updated_at = datetime.now(tz=timezone.utc)
-
-                session.add(chat)
-                await session.commit()
-                await session.refresh(chat)
-
-                return OK(
-                    message="Chat updated successfully",
-                    data=self._serialize_conversation(chat),
+                chat = result.first()
+                await self.db.commit()
+            else:
+                result = await self.db.execute(
+                    select(*_CONVERSATION_COLUMNS).where(Conversation.id == conversation_id)
                 )
+                chat = result.first()
+            if not chat:
+                return ChatNotFound(message="Chat not found", error_code="4004")
+
+            return OK(
+                message="Chat updated successfully",
+                data=self._serialize_conversation(chat),
+            )
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to update chat: {str(e)}", error_code="5000")
 
     async def delete_chat(self, conversation_id: str) -> Dict[str, Any]:
         """Soft-delete a conversation by marking it archived."""
         try:
-            async for session in self._get_db_connection().get_session():
-                result = await session.execute(
-                    select(Conversation).filter(Conversation.conversation_id == conversation_id)
-                )
-                chat = result.scalar_one_or_none()
-                if not chat:
-                    return ChatNotFound(message="Chat not found", error_code="4004")
-
-                await session.execute(
-                    update(Conversation)
-                    .where(Conversation.conversation_id == conversation_id)
-                    .values(
-                        is_archived=True,
-                        updated_at=datetime.now(tz=timezone.utc),
-                    )
-                )
-                await session.commit()
-
-                return OK(
-                    message="Chat archived successfully",
-                    data={"conversation_id": conversation_id, "deleted": True},
-                )
+            # No existence pre-check: an empty RETURNING means the chat does not exist
+            result = await self.db.execute(
+                update(Conversation)
+                .where(Conversation.id == conversation_id)
+                .values(is_archived=True)
+                .returning(Conversation.id)
+                .execution_options(synchronize_session=False)
+            )
+            if result.first() is None:
+                await self.db.rollback()
+                return ChatNotFound(message="Chat not found", error_code="4004")
+            await self.db.commit()
+
+            return OK(
+                message="Chat archived successfully",
+                data={"conversation_id": conversation_id, "deleted": True},
+            )
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to delete chat: {str(e)}", error_code="5000")
 
     # ------------------------------------------------------------------
@@ -274,63 +393,86 @@ class ChatRepository:
     ) -> Dict[str, Any]:
         """Ensure a participant entry exists for the conversation."""
         try:
-            async for session in self._get_db_connection().get_session():
-                # Check existing
-                existing = await session.get(
-                    ConversationParticipant,
-                    (conversation_id, user_id),
-                )
-                if existing:
-                    existing.role = role
-                    session.add(existing)
-                else:
-                    participant = ConversationParticipant(
-                        conversation_id=conversation_id,
-                        user_id=user_id,
-                        role=role,
-                    )
-                    session.add(participant)
-                await session.commit()
-                return OK(message="Participant added")
+            # Single upsert instead of a lookup followed by insert or update
+            stmt = pg_insert(ConversationParticipant).values(
+                conversation_id=conversation_id,
+                user_id=user_id,
+                role=role,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["conversation_id", "user_id"],
+                set_={"role": stmt.excluded.role},
+            )
+            await self.db.execute(stmt)
+            await self.db.commit()
+            return OK(message="Participant added")
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to add participant: {str(e)}", error_code="5000")
 
+    async def ensure_participants(
+        self,
+        conversation_id: str,
+        user_ids: List[str],
+        role: str = "member",
+    ) -> Dict[str, Any]:
+        """Link users to the conversation, leaving existing participants untouched."""
+        if not user_ids:
+            return OK(message="No participants to add")
+        try:
+            stmt = (
+                pg_insert(ConversationParticipant)
+                .values(
+                    [
+                        {"conversation_id": conversation_id, "user_id": user_id, "role": role}
+                        for user_id in user_ids
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["conversation_id", "user_id"])
+            )
+            await self.db.execute(stmt)
+            await self.db.commit()
+            return OK(message="Participants added")
+        except Exception as e:
+            await self.db.rollback()
+            return InternalError(message=f"Failed to add participants: {str(e)}", error_code="5000")
+
     async def remove_participant(self, conversation_id: str, user_id: str) -> Dict[str, Any]:
         """Remove a participant from the conversation."""
         try:
-            async for session in self._get_db_connection().get_session():
-                participant = await session.get(
-                    ConversationParticipant,
-                    (conversation_id, user_id),
-                )
-                if not participant:
-                    return NotFound(message="Participant not found", error_code="4004")
-                await session.delete(participant)
-                await session.commit()
-                return OK(message="Participant removed")
+            participant = await self.db.get(
+                ConversationParticipant,
+                (conversation_id, user_id),
+            )
+            if not participant:
+                return NotFound(message="Participant not found", error_code="4004")
+            await self.db.delete(participant)
+            await self.db.commit()
+            return OK(message="Participant removed")
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to remove participant: {str(e)}", error_code="5000")
 
     async def list_participants(self, conversation_id: str) -> List[Dict[str, Any]]:
         """List all participants for a conversation."""
         try:
-            async for session in self._get_db_connection().get_session():
-                result = await session.execute(
-                    select(ConversationParticipant).where(
-                        ConversationParticipant.conversation_id == conversation_id
-                    )
+            result = await self.db.execute(
+                select(ConversationParticipant).where(
+                    ConversationParticipant.conversation_id == conversation_id
                 )
-                participants = result.scalars().all()
-                return [
-                    {
-                        "conversation_id": str(p.conversation_id),
-                        "user_id": str(p.user_id),
-                        "role": p.role,
-                        "added_at": p.added_at,
-                    }
-                    for p in participants
-                ]
+            )
+            participants = result.scalars().all()
+            return [
+                {
+                    "conversation_id": str(p.conversation_id),
+                    "user_id": str(p.user_id),
+                    "role": p.role,
+                    "added_at": p.added_at,
+                }
+                for p in participants
+            ]
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to list participants: {str(e)}", error_code="5000")
 
     # ------------------------------------------------------------------
@@ -350,8 +492,10 @@ class ChatRepository:
         top_p: Optional[float] = None,
     ) -> Message:
         try:
-            async for session in self._get_db_connection().get_session():
-                message = Message(
+            # INSERT ... RETURNING hands back id and created_at; no refresh SELECT
+            message = await self.db.scalar(
+                insert(Message)
+                .values(
                     conversation_id=conversation_id,
                     parent_message_id=parent_message_id,
                     author_user_id=author_user_id,
@@ -362,13 +506,33 @@ class ChatRepository:
                     temperature=temperature,
                     top_p=top_p,
                 )
-                session.add(message)
-                await session.commit()
-                await session.refresh(message)
-                return message
+                .returning(Message)
+            )
+            await self.db.commit()
+            return message
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to create message: {str(e)}", error_code="5000")
 
+    async def finish_message(self, message_id: str, content: str, *, state: str = "final") -> Dict[str, Any]:
+        """Store the final content of a streamed message and move it out of the streaming state."""
+        try:
+            result = await self.db.execute(
+                update(Message)
+                .where(Message.id == message_id)
+                .values(content=content, state=state)
+                .returning(Message.id)
+                .execution_options(synchronize_session=False)
+            )
+            if result.first() is None:
+                await self.db.rollback()
+                return NotFound(message="Message not found", error_code="4004")
+            await self.db.commit()
+            return OK(message="Message finished", data={"message_id": message_id, "state": state})
+        except Exception as e:
+            await self.db.rollback()
+            return InternalError(message=f"Failed to finish message: {str(e)}", error_code="5000")
+
     async def list_messages(
         self,
         conversation_id: str,
@@ -377,43 +541,144 @@ class ChatRepository:
         include_children: bool = False,
         include_artifacts: bool = False,
         include_usage: bool = False,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Return recent messages for a conversation.
         By default fetches latest N messages on the main branch (parentless chain).
+        Pass the (created_at, message_id) of the oldest message seen as ``before``
+        to page further back.
         """
         try:
-            async for session in self._get_db_connection().get_session():
-                stmt = (
-                    select(Message)
-                    .where(Message.conversation_id == conversation_id)
-                    .order_by(Message.created_at.desc())
-                    .limit(limit)
+            plain = not (include_children or include_artifacts or include_usage)
+            # Plain pages need only the message's own columns: no entity hydration
+            # and no join to message_usage from the joined-eager relationship
+            stmt = (
+                select(*_MESSAGE_COLUMNS) if plain else select(Message)
+            ).where(Message.conversation_id == conversation_id)
+            if before is not None:
+                # Typed like the columns; see _recency_page
+                cursor = tuple_(
+                    literal(before[0], Message.created_at.type),
+                    literal(UUID(str(before[1])), Message.id.type),
                 )
-                if include_children:
-                    stmt = stmt.options(selectinload(Message.children))
+                stmt = stmt.where(tuple_(Message.created_at, Message.id) < cursor)
+            # Newest first along ix_messages_conv_created, so no sort step
+            stmt = stmt.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
+            # One batched IN (...) query per collection; usage is joined by default
+            artifacts = (Message.attachments, Message.citations, Message.stream_chunks)
+            if include_children:
+                children = selectinload(Message.children)
+                stmt = stmt.options(children)
                 if include_artifacts:
-                    stmt = stmt.options(
-                        selectinload(Message.attachments),
-                        selectinload(Message.citations),
-                        selectinload(Message.stream_chunks),
-                    )
-                if include_usage:
-                    stmt = stmt.options(selectinload(Message.usage))
-                result = await session.execute(stmt)
-                messages = result.scalars().all()
-                return [
-                    self._serialize_message(
-                        msg,
-                        include_children=include_children,
-                        include_artifacts=include_artifacts,
-                        include_usage=include_usage,
-                    )
-                    for msg in messages
-                ]
+                    stmt = stmt.options(*(children.selectinload(attr) for attr in artifacts))
+            if include_artifacts:
+                stmt = stmt.options(*(selectinload(attr) for attr in artifacts))
+            result = await self.db.execute(stmt)
+            messages = result.all() if plain else result.scalars().all()
+            options = dict(
+                include_children=include_children,
+                include_artifacts=include_artifacts,
+                include_usage=include_usage,
+            )
+            # Everything serialized is loaded above, so the worker thread never touches
+            # the connection; small pages are cheaper to build inline than to hand off
+            if len(messages) >= _SERIALIZE_IN_THREAD_MIN:
+                return await asyncio.to_thread(self._serialize_messages, messages, **options)
+            return self._serialize_messages(messages, **options)
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to list messages: {str(e)}", error_code="5000")
 
+    async def stream_messages(
+        self,
+        conversation_id: str,
+        *,
+        include_artifacts: bool = False,
+        include_usage: bool = False,
+        batch_size: int = 200,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every message of a conversation, oldest first, as it is read.
+        Rows come from a server-side cursor in batches of ``batch_size``, so
+        memory stays flat however long the conversation is.
+        """
+        plain = not (include_artifacts or include_usage)
+        stmt = (
+            select(*_MESSAGE_COLUMNS) if plain else select(Message)
+        ).where(Message.conversation_id == conversation_id)
+        stmt = stmt.order_by(Message.created_at, Message.id).execution_options(yield_per=batch_size)
+        if include_artifacts:
+            # selectin loaders run once per yielded batch
+            stmt = stmt.options(
+                *(selectinload(attr) for attr in (Message.attachments, Message.citations, Message.stream_chunks))
+            )
+        try:
+            result = await self.db.stream(stmt)
+            rows = result if plain else result.scalars()
+            async for msg in rows:
+                yield self._serialize_message(
+                    msg, include_artifacts=include_artifacts, include_usage=include_usage
+                )
+        except Exception:
+            await self.db.rollback()
+            raise
+
+    async def get_message_thread(
+        self,
+        conversation_id: str,
+        root_message_id: str,
+        *,
+        include_artifacts: bool = False,
+        include_usage: bool = False,
+        max_depth: int = _THREAD_MAX_DEPTH,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a message and its full reply subtree as nested payloads.
+        The subtree is collected with one recursive CTE and assembled in Python,
+        so the query count does not grow with thread depth.
+        """
+        try:
+            thread = (
+                select(Message.id, literal(0).label("depth"))
+                .where(Message.id == root_message_id, Message.conversation_id == conversation_id)
+                .cte("thread", recursive=True)
+            )
+            thread = thread.union_all(
+                select(Message.id, thread.c.depth + 1)
+                .join(thread, Message.parent_message_id == thread.c.id)
+                .where(thread.c.depth < max_depth)
+            )
+            stmt = select(Message).join(thread, Message.id == thread.c.id).order_by(Message.created_at)
+            if include_artifacts:
+                stmt = stmt.options(
+                    *(selectinload(attr) for attr in (Message.attachments, Message.citations, Message.stream_chunks))
+                )
+            result = await self.db.execute(stmt)
+            messages = result.scalars().all()
+
+            root = None
+            children_of: Dict[Any, List[Message]] = {}
+            for msg in messages:
+                if str(msg.id) == str(root_message_id):
+                    root = msg
+                else:
+                    children_of.setdefault(msg.parent_message_id, []).append(msg)
+            if root is None:
+                return None
+
+            def build(msg: Message) -> Dict[str, Any]:
+                payload = self._serialize_message(
+                    msg, include_artifacts=include_artifacts, include_usage=include_usage
+                )
+                payload["children"] = [build(child) for child in children_of.get(msg.id, [])]
+                return payload
+
+            return build(root)
+        except Exception as e:
+            await self.db.rollback()
+            return InternalError(message=f"Failed to load message thread: {str(e)}", error_code="5000")
+
     async def add_message_revision(
         self,
         message_id: str,
@@ -423,39 +688,92 @@ class ChatRepository:
         rev_no: Optional[int] = None,
     ) -> MessageRevision:
         try:
-            async for session in self._get_db_connection().get_session():
-                next_rev = rev_no
-                if next_rev is None:
-                    result = await session.execute(
-                        select(func.max(MessageRevision.rev_no)).where(MessageRevision.message_id == message_id)
+            if rev_no is None:
+                # Under READ COMMITTED two INSERT ... SELECTs can read the same
+                # max(rev_no), so writers first serialize on the parent message row;
+                # the next statement then sees the previous writer's committed revision
+                await self.db.execute(
+                    select(Message.id).where(Message.id == message_id).with_for_update()
+                )
+                # Literals carry the column types: a bare str would be bound as
+                # VARCHAR, which Postgres will not assign to the uuid column
+                next_rev = (
+                    select(
+                        literal(message_id, MessageRevision.message_id.type),
+                        func.coalesce(func.max(MessageRevision.rev_no), 0) + 1,
+                        literal(content, MessageRevision.content.type),
+                        literal(model_label, MessageRevision.model_label.type),
                     )
-                    current_max = result.scalar()
-                    next_rev = 1 if current_max is None else current_max + 1
-
-                revision = MessageRevision(
+                    .where(MessageRevision.message_id == message_id)
+                )
+                stmt = insert(MessageRevision).from_select(
+                    ["message_id", "rev_no", "content", "model_label"],
+                    next_rev,
+                )
+            else:
+                stmt = insert(MessageRevision).values(
                     message_id=message_id,
-                    rev_no=next_rev,
+                    rev_no=rev_no,
                     content=content,
                     model_label=model_label,
                 )
-                session.add(revision)
-                await session.commit()
-                await session.refresh(revision)
-                return revision
+            revision = await self.db.scalar(stmt.returning(MessageRevision))
+            await self.db.commit()
+            return revision
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to add message revision: {str(e)}", error_code="5000")
 
-    async def append_stream_chunk(self, message_id: str, seq: int, delta: str) -> MessageStreamChunk:
+    async def create_stream_chunk_partitions(self, months_ahead: int) -> None:
+        """
+        Create the monthly message_stream_chunks partitions from the current month
+        through ``months_ahead`` months out; existing partitions are left alone.
+        The table has no default partition, so a chunk for a month without one fails.
+        """
+        await self.db.execute(
+            text(
+                "SELECT create_message_stream_chunk_partition("
+                "(date_trunc('month', CURRENT_DATE) + make_interval(months => n))::date) "
+                "FROM generate_series(0, :months_ahead) AS n"
+            ),
+            {"months_ahead": months_ahead},
+        )
+        await self.db.commit()
+
+    async def append_stream_chunks(self, message_id: str, seq_start: int, deltas: List[str]) -> MessageStreamChunk:
+        """Persist a batch of consecutive stream deltas as a single row."""
         try:
-            async for session in self._get_db_connection().get_session():
-                chunk = MessageStreamChunk(message_id=message_id, seq=seq, delta=delta)
-                session.add(chunk)
-                await session.commit()
-                await session.refresh(chunk)
-                return chunk
+            chunk = await self.db.scalar(
+                insert(MessageStreamChunk)
+                .values(message_id=message_id, seq_start=seq_start, deltas=deltas)
+                .returning(MessageStreamChunk)
+            )
+            await self.db.commit()
+            return chunk
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to append stream chunk: {str(e)}", error_code="5000")
 
+    async def append_stream_chunk(self, message_id: str, seq: int, delta: str) -> None:
+        """
+        Queue one stream delta for ``message_id``; its StreamChunkBuffer writes
+        the deltas in batches. The first ``seq`` for a message starts the
+        numbering and later deltas follow it consecutively. Call ``flush()``
+        when the stream ends.
+        """
+        buffer = self._stream_buffers.get(message_id)
+        if buffer is None:
+            buffer = self._stream_buffers[message_id] = StreamChunkBuffer(self, message_id, seq_start=seq)
+        await buffer.add(delta)
+
+    async def flush(self, message_id: Optional[str] = None) -> None:
+        """Write the queued stream deltas of ``message_id`` (or of every message) and drop their buffers."""
+        message_ids = [message_id] if message_id is not None else list(self._stream_buffers)
+        for key in message_ids:
+            buffer = self._stream_buffers.pop(key, None)
+            if buffer is not None:
+                await buffer.close()
+
     async def add_attachment(
         self,
         message_id: str,
@@ -466,19 +784,21 @@ class ChatRepository:
         size_bytes: Optional[int] = None,
     ) -> MessageAttachment:
         try:
-            async for session in self._get_db_connection().get_session():
-                attachment = MessageAttachment(
+            attachment = await self.db.scalar(
+                insert(MessageAttachment)
+                .values(
                     message_id=message_id,
                     file_uri=file_uri,
                     file_name=file_name,
                     mime_type=mime_type,
                     size_bytes=size_bytes,
                 )
-                session.add(attachment)
-                await session.commit()
-                await session.refresh(attachment)
-                return attachment
+                .returning(MessageAttachment)
+            )
+            await self.db.commit()
+            return attachment
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to add attachment: {str(e)}", error_code="5000")
 
     async def add_citation(
@@ -490,23 +810,25 @@ class ChatRepository:
         rationale: Optional[str] = None,
     ) -> MessageCitation:
         try:
-            async for session in self._get_db_connection().get_session():
-                citation = await session.get(MessageCitation, (message_id, document_id))
-                if citation:
-                    citation.score = score
-                    citation.rationale = rationale
-                else:
-                    citation = MessageCitation(
-                        message_id=message_id,
-                        document_id=document_id,
-                        score=score,
-                        rationale=rationale,
-                    )
-                    session.add(citation)
-                await session.commit()
-                await session.refresh(citation)
-                return citation
+            stmt = pg_insert(MessageCitation).values(
+                message_id=message_id,
+                document_id=document_id,
+                score=score,
+                rationale=rationale,
+            )
+            stmt = (
+                stmt.on_conflict_do_update(
+                    index_elements=["message_id", "document_id"],
+                    set_={"score": stmt.excluded.score, "rationale": stmt.excluded.rationale},
+                )
+                .returning(MessageCitation)
+                .execution_options(populate_existing=True)
+            )
+            citation = await self.db.scalar(stmt)
+            await self.db.commit()
+            return citation
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to add citation: {str(e)}", error_code="5000")
 
     async def save_message_usage(
@@ -519,33 +841,39 @@ class ChatRepository:
         cost_usd: Optional[float] = None,
     ) -> MessageUsage:
         try:
-            async for session in self._get_db_connection().get_session():
-                usage = await session.get(MessageUsage, message_id)
-                total = prompt_tokens + completion_tokens
-                if usage:
-                    usage.prompt_tokens = prompt_tokens
-                    usage.completion_tokens = completion_tokens
-                    usage.total_tokens = total
-                    usage.latency_ms = latency_ms
-                    usage.cost_usd = cost_usd
-                    session.add(usage)
-                    target = usage
-                else:
-                    target = MessageUsage(
-                        message_id=message_id,
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        total_tokens=total,
-                        latency_ms=latency_ms,
-                        cost_usd=cost_usd,
-                    )
-                    session.add(target)
-                await session.commit()
-                await session.refresh(target)
-                return target
+            stmt = pg_insert(MessageUsage).values(
+                message_id=message_id,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+                latency_ms=latency_ms,
+                cost_usd=cost_usd,
+            )
+            stmt = (
+                stmt.on_conflict_do_update(
+                    index_elements=["message_id"],
+                    set_={
+                        "prompt_tokens": stmt.excluded.prompt_tokens,
+                        "completion_tokens": stmt.excluded.completion_tokens,
+                        "total_tokens": stmt.excluded.total_tokens,
+                        "latency_ms": stmt.excluded.latency_ms,
+                        "cost_usd": stmt.excluded.cost_usd,
+                    },
+                )
+                .returning(MessageUsage)
+                .execution_options(populate_existing=True)
+            )
+            usage = await self.db.scalar(stmt)
+            await self.db.commit()
+            return usage
         except Exception as e:
+            await self.db.rollback()
             return InternalError(message=f"Failed to save message usage: {str(e)}", error_code="5000")
 
+    @staticmethod
+    def _serialize_messages(messages: List[Any], **options: bool) -> List[Dict[str, Any]]:
+        return [ChatRepository._serialize_message(msg, **options) for msg in messages]
+
     @staticmethod
     def _serialize_message(
         msg: Message,
@@ -568,8 +896,9 @@ class ChatRepository:
             "created_at": msg.created_at,
         }
         if include_children:
+            serialize = ChatRepository._serialize_message
             payload["children"] = [
-                ChatRepository._serialize_message(child, include_children=False, include_artifacts=include_artifacts, include_usage=include_usage)
+                serialize(child, include_artifacts=include_artifacts, include_usage=include_usage)
                 for child in msg.children
             ]
         if include_artifacts:
@@ -582,7 +911,7 @@ class ChatRepository:
                     "size_bytes": attachment.size_bytes,
                     "created_at": attachment.created_at,
                 }
-                for attachment in getattr(msg, "attachments", [])
+                for attachment in msg.attachments
             ]
             payload["citations"] = [
                 {
@@ -590,32 +919,80 @@ class ChatRepository:
                     "score": citation.score,
                     "rationale": citation.rationale,
                 }
-                for citation in getattr(msg, "citations", [])
-            ]
-            payload["tool_calls"] = [
-                {
-                    "id": str(call.id),
-                    "tool_name": call.tool_name,
-                    "arguments": call.arguments_json,
-                    "result": call.result.result_json if call.result else None,
-                    "error": call.result.error_text if call.result else None,
-                    "created_at": call.created_at,
-                }
-                for call in getattr(msg, "tool_calls", [])
+                for citation in msg.citations
             ]
+            # Tool calls live inline on the message row, so no extra query is needed
+            payload["tool_calls"] = msg.tool_calls_json or []
             payload["stream_chunks"] = [
-                {
-                    "seq": chunk.seq,
-                    "delta": chunk.delta,
-                }
-                for chunk in getattr(msg, "stream_chunks", [])
+                {"seq": seq, "delta": delta}
+                for chunk in msg.stream_chunks
+                for seq, delta in enumerate(chunk.deltas, chunk.seq_start)
             ]
-        if include_usage and getattr(msg, "usage", None):
+        # Read each instrumented relationship once rather than once per field
+        usage = msg.usage if include_usage else None
+        if usage is not None:
             payload["usage"] = {
-                "prompt_tokens": msg.usage.prompt_tokens,
-                "completion_tokens": msg.usage.completion_tokens,
-                "total_tokens": msg.usage.total_tokens,
-                "latency_ms": msg.usage.latency_ms,
-                "cost_usd": msg.usage.cost_usd,
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
+                "latency_ms": usage.latency_ms,
+                "cost_usd": usage.cost_usd,
             }
         return payload
+
+
+class StreamChunkBuffer:
+    """
+    Buffers stream deltas for one message and writes them in batches.
+
+    A batch is flushed once it holds ``max_deltas`` deltas or ``max_delay``
+    seconds after its first delta, whichever comes first. Call ``close()``
+    when the stream ends to write the remainder.
+    """
+
+    def __init__(
+        self,
+        repository: ChatRepository,
+        message_id: str,
+        *,
+        max_deltas: int = 64,
+        max_delay: float = 0.05,
+        seq_start: int = 0,
+    ):
+        self.repository = repository
+        self.message_id = message_id
+        self.max_deltas = max_deltas
+        self.max_delay = max_delay
+        self._deltas: List[str] = []
+        self._next_seq = seq_start
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def add(self, delta: str) -> None:
+        self._deltas.append(delta)
+        if len(self._deltas) >= self.max_deltas:
+            await self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.max_delay, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self.flush())
+
+    async def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._lock:
+            if not self._deltas:
+                return
+            deltas, self._deltas = self._deltas, []
+            seq_start = self._next_seq
+            self._next_seq += len(deltas)
+            await self.repository.append_stream_chunks(self.message_id, seq_start, deltas)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._flush_task is not None:
+            await self._flush_task
@@ -1,14 +1,39 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_, or_
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy import bindparam, func, insert, literal_column, select, update, delete, exists, and_, or_
+from sqlalchemy.orm import identity_key, load_only, selectinload
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
 from app.models.document_model import Document
 
+# Columns a listing renders. content and vector_embedding are the bulk of each
+# row and are only read through get_document_by_id / similarity search; touching
+# them on a listed document raises instead of lazy-loading per row
+_SUMMARY_ONLY = load_only(
+    Document.id,
+    Document.title,
+    Document.uploaded_by,
+    Document.project_id,
+    Document.filename,
+    Document.file_type,
+    Document.file_size_bytes,
+    Document.created_at,
+    raiseload=True,
+)
+
+# Must match the ix_documents_search_trgm expression for the planner to use it;
+# the separators are inlined so the SQL text is identical, not bound parameters
+_SEARCH_TEXT = (
+    func.coalesce(Document.title, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Document.content, literal_column("''"))
+)
+
 
 class DocumentRepository:
     """
     Repository for managing Document CRUD operations and ownership checks.
     Supports both individual and company documents.
+    Writes are flushed, not committed; the caller's session owns the transaction.
     """
 
     def __init__(self, db: AsyncSession):
@@ -32,20 +57,21 @@ class DocumentRepository:
         """
         Create and save a new document linked to a project.
         """
-        document = Document(
-            title=title,
-            content=content,
-            uploaded_by=uploaded_by,
-            project_id=project_id,
-            filename=filename,
-            file_path=file_path,
-            file_type=file_type,
-            file_size_bytes=file_size_bytes,
+        stmt = (
+            insert(Document)
+            .values(
+                title=title,
+                content=content,
+                uploaded_by=uploaded_by,
+                project_id=project_id,
+                filename=filename,
+                file_path=file_path,
+                file_type=file_type,
+                file_size_bytes=file_size_bytes,
+            )
+            .returning(Document)
         )
-        self.db.add(document)
-        await self.db.commit()
-        await self.db.refresh(document)
-        return document
+        return await self.db.scalar(stmt)
 
     # ------------------------------------------------------------
     # ✅ READ
@@ -54,17 +80,15 @@ class DocumentRepository:
         """
         Retrieve a document by ID.
         """
-        result = await self.db.execute(
-            select(Document).where(Document.id == document_id)
-        )
-        return result.scalar_one_or_none()
+        # A document already loaded in this session comes from the identity map, without SQL
+        return await self.db.get(Document, UUID(str(document_id)))
 
     async def list_documents_by_user(self, user_id: str) -> List[Document]:
         """
         Return all documents uploaded by a specific user (personal or company).
         """
         result = await self.db.execute(
-            select(Document).where(Document.uploaded_by == user_id)
+            select(Document).where(Document.uploaded_by == user_id).options(_SUMMARY_ONLY)
         )
         return result.scalars().all()
 
@@ -74,10 +98,36 @@ class DocumentRepository:
         Documents now have direct FK to project.
         """
         result = await self.db.execute(
-            select(Document).where(Document.project_id == project_id)
+            select(Document).where(Document.project_id == project_id).options(_SUMMARY_ONLY)
         )
         return result.scalars().all()
 
+    async def stream_documents_by_user(
+        self, user_id: str, batch_size: int = 500
+    ) -> AsyncIterator[Document]:
+        """
+        Yield a user's documents as they are read from a server-side cursor.
+        At most ``batch_size`` rows are buffered, however many the user has.
+        """
+        stmt = select(Document).where(Document.uploaded_by == user_id).options(_SUMMARY_ONLY)
+        async for document in self._stream(stmt, batch_size):
+            yield document
+
+    async def stream_documents_by_project(
+        self, project_id: str, batch_size: int = 500
+    ) -> AsyncIterator[Document]:
+        """
+        Yield a project's documents as they are read from a server-side cursor.
+        """
+        stmt = select(Document).where(Document.project_id == project_id).options(_SUMMARY_ONLY)
+        async for document in self._stream(stmt, batch_size):
+            yield document
+
+    async def _stream(self, stmt, batch_size: int) -> AsyncIterator[Document]:
+        result = await self.db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for document in result:
+            yield document
+
     async def search_documents(
         self, keyword: str, user_id: Optional[str] = None, company_id: Optional[str] = None
     ) -> List[Document]:
@@ -85,12 +135,10 @@ class DocumentRepository:
         Search documents by title/content (case-insensitive).
         Supports combined filtering by user or company.
         """
-        stmt = select(Document).where(
-            or_(
-                Document.title.ilike(f"%{keyword}%"),
-                Document.content.ilike(f"%{keyword}%"),
-            )
-        )
+        # A single ILIKE over title and content answered by the trigram GIN index,
+        # instead of two predicates that forced a sequential scan
+        pattern = bindparam("keyword_pattern", f"%{keyword}%")
+        stmt = select(Document).options(_SUMMARY_ONLY).where(_SEARCH_TEXT.ilike(pattern))
         if company_id:
             stmt = stmt.where(Document.company_id == company_id)
         elif user_id:
@@ -105,6 +153,28 @@ class DocumentRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def search_similar_documents(
+        self, project_id: str, query_embedding: List[float], limit: int = 5
+    ) -> List[Tuple[Document, float]]:
+        """
+        Return the project's documents closest to the query embedding.
+        Distance is computed in Postgres (cosine, ``<=>``) so the HNSW index is used.
+        """
+        distance = Document.vector_embedding.cosine_distance(query_embedding)
+        stmt = (
+            select(Document, distance.label("distance"))
+            .where(
+                and_(
+                    Document.project_id == project_id,
+                    Document.vector_embedding.is_not(None),
+                )
+            )
+            .order_by(distance)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return [(row.Document, row.distance) for row in result]
+
     # ------------------------------------------------------------
     # ✅ UPDATE
     # ------------------------------------------------------------
@@ -119,9 +189,10 @@ class DocumentRepository:
             .where(Document.id == document_id)
             .values(content=new_content)
             .returning(Document)
+            # Skip the identity-map scan; the RETURNING row overwrites any loaded copy
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         result = await self.db.execute(stmt)
-        await self.db.commit()
         return result.scalar_one_or_none()
 
     async def rename_document(
@@ -135,9 +206,9 @@ class DocumentRepository:
             .where(Document.id == document_id)
             .values(title=new_title)
             .returning(Document)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         result = await self.db.execute(stmt)
-        await self.db.commit()
         return result.scalar_one_or_none()
 
     # ------------------------------------------------------------
@@ -150,52 +221,51 @@ class DocumentRepository:
         Delete a document by ID.
         Optionally verify the uploader (user_id) before deleting.
         """
-        stmt = delete(Document).where(Document.id == document_id)
+        stmt = (
+            delete(Document)
+            .where(Document.id == document_id)
+            .execution_options(synchronize_session=False)
+        )
         if user_id:
             stmt = stmt.where(Document.uploaded_by == user_id)
 
         result = await self.db.execute(stmt)
-        await self.db.commit()
-        return result.rowcount > 0
+        deleted = result.rowcount > 0
+        if deleted:
+            # synchronize_session=False leaves a loaded copy in the identity map,
+            # where get_document_by_id would still find it
+            stale = self.db.identity_map.get(identity_key(Document, UUID(str(document_id))))
+            if stale is not None:
+                self.db.expunge(stale)
+        return deleted
 
     # ------------------------------------------------------------
     # ✅ VALIDATION / HELPERS
+    # EXISTS returns one boolean; no Document row (or its content) is fetched
     # ------------------------------------------------------------
     async def document_exists(self, title: str, user_id: str) -> bool:
         """
         Check if a document with the same title already exists for this user.
         """
-        query = await self.db.execute(
-            select(Document).where(
-                and_(Document.title == title, Document.uploaded_by == user_id)
-            )
+        stmt = select(
+            exists().where(and_(Document.title == title, Document.uploaded_by == user_id))
         )
-        return query.scalar_one_or_none() is not None
+        return await self.db.scalar(stmt)
 
     async def verify_user_access(self, document_id: str, user_id: str) -> bool:
         """
         Check if the document belongs to the given user.
         """
-        query = await self.db.execute(
-            select(Document).where(
-                and_(
-                    Document.id == document_id,
-                    Document.uploaded_by == user_id,
-                )
-            )
+        stmt = select(
+            exists().where(and_(Document.id == document_id, Document.uploaded_by == user_id))
         )
-        return query.scalar_one_or_none() is not None
+        return await self.db.scalar(stmt)
 
     async def verify_company_scope(self, document_id: str, company_id: str) -> bool:
         """
         Check if the document belongs to a specific company.
         """
-        query = await self.db.execute(
-            select(Document).where(
-                and_(
-                    Document.id == document_id,
-                    Document.company_id == company_id,
-                )
-            )
+        stmt = select(
+            exists().where(and_(Document.id == document_id, Document.company_id == company_id))
         )
-        return query.scalar_one_or_none() is not None
+        return await self.db.scalar(stmt)
@@ -1,17 +1,127 @@
-from typing import List, Union
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from app.utils.tokenizer import Tokenizer
+
+try:
+    from langchain_openai import OpenAIEmbeddings  # type: ignore
+except Exception:  # pragma: no cover - optional
+    OpenAIEmbeddings = None  # type: ignore
+
+# (model, texts, future receiving that caller's vectors)
+_Pending = Tuple[Optional[str], List[str], "asyncio.Future[List[List[float]]]"]
 
 
 class EmbeddingRepository:
-    
-    def __init__(self, api_key: str = None, model_name: str = None):
+    """
+    Embedding provider access with request coalescing.
+
+    Concurrent create_embeddings calls are queued and merged: the first waiting
+    call opens a ``max_delay_ms`` window, and everything that arrives before it
+    closes (up to ``max_batch`` texts) goes to the provider as one request. Each
+    caller gets back only the vectors for its own texts, in order.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        model_name: str = None,
+        base_url: str = None,
+        max_batch: int = 64,
+        max_delay_ms: int = 20,
+    ):
         self.api_key = api_key
         self.model_name = model_name
-    
+        self.base_url = base_url
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay_ms / 1000
+        self._clients: Dict[Optional[str], "OpenAIEmbeddings"] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Strong references so in-flight provider calls are not garbage collected
+        self._inflight: Set[asyncio.Task] = set()
+        self._tokenizer = Tokenizer(model_name) if model_name else Tokenizer()
+
     async def create_embeddings(self, texts: Union[str, List[str]], model: str = None, **kwargs) -> List[List[float]]:
-        pass
-    
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker()
+        await self._queue.put((model or self.model_name, list(texts), future))
+        return await future
+
     async def count_tokens(self, text: str) -> int:
-        pass
+        # Tokenizer memoises counts of longer texts by content hash
+        return self._tokenizer.count_text(text)
+
+    def _ensure_worker(self) -> None:
+        # The module-level instance can outlive an event loop (tests, reloads);
+        # a queue and worker belong to the loop that created them
+        if (
+            self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_Pending] = [await self._queue.get()]
+            size = len(batch[0][1])
+            deadline = loop.time() + self.max_delay
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item[1])
+
+            # Only calls for the same model can share a provider request
+            by_model: Dict[Optional[str], List[_Pending]] = {}
+            for item in batch:
+                by_model.setdefault(item[0], []).append(item)
+            for model, items in by_model.items():
+                task = asyncio.create_task(self._embed_batch(model, items))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _embed_batch(self, model: Optional[str], items: List[_Pending]) -> None:
+        merged = [text for _, texts, _ in items for text in texts]
+        try:
+            vectors = await self._get_client(model).aembed_documents(merged)
+        except Exception as exc:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        offset = 0
+        for _, texts, future in items:
+            # A caller that was cancelled while waiting no longer wants its slice
+            if not future.done():
+                future.set_result(vectors[offset:offset + len(texts)])
+            offset += len(texts)
+
+    def _get_client(self, model: Optional[str]) -> "OpenAIEmbeddings":
+        client = self._clients.get(model)
+        if client is None:
+            if OpenAIEmbeddings is None:
+                raise RuntimeError("langchain-openai is required to create embeddings")
+            if not model:
+                raise ValueError("No embedding model configured")
+            kwargs = {"model": model, "api_key": self.api_key}
+            if self.base_url:
+                kwargs["base_url"] = self.base_url
+            client = self._clients[model] = OpenAIEmbeddings(**kwargs)  # type: ignore[arg-type]
+        return client
 
 
 embedding_repository = EmbeddingRepository()
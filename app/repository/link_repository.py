@@ -1,3 +1,5 @@
+from typing import List, Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from app.models.project_model import Project
@@ -9,6 +11,7 @@ class LinkRepository:
     """
     Repository to manage direct relationships between Projects, Conversations, and Documents.
     Since we now use direct foreign keys instead of join tables, this simplifies to basic queries.
+    Updates run inside the caller's transaction and are not committed here.
     """
 
     def __init__(self, db: AsyncSession):
@@ -31,10 +34,32 @@ class LinkRepository:
         Update a conversation's project_id (move to different project).
         """
         stmt = update(Conversation).where(
-            Conversation.conversation_id == conversation_id
-        ).values(project_id=project_id)
+            Conversation.id == conversation_id
+        ).values(project_id=project_id).execution_options(synchronize_session=False)
         await self.db.execute(stmt)
-        await self.db.commit()
+
+    async def link_conversations_to_project(self, project_id: str, conversation_ids: Sequence[str]) -> List[str]:
+        """
+        Attach many conversations to a project in a single UPDATE ... RETURNING.
+        Returns the ids that were actually found and moved.
+        """
+        if not conversation_ids:
+            return []
+        stmt = (
+            update(Conversation)
+            .where(Conversation.id.in_(conversation_ids))
+            .values(project_id=project_id)
+            .returning(Conversation.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return [str(row_id) for row_id in result.scalars().all()]
+
+    async def link_conversation_to_project(self, conversation_id: str, project_id: str) -> bool:
+        """
+        Attach one conversation to a project. Returns False if it does not exist.
+        """
+        return bool(await self.link_conversations_to_project(project_id, [conversation_id]))
 
     # ------------------------------------------------------------
     # ✅ DOCUMENT ↔ PROJECT (Direct FK)
@@ -54,6 +79,28 @@ class LinkRepository:
         """
         stmt = update(Document).where(
             Document.id == document_id
-        ).values(project_id=project_id)
+        ).values(project_id=project_id).execution_options(synchronize_session=False)
         await self.db.execute(stmt)
-        await self.db.commit()
+
+    async def link_documents_to_project(self, project_id: str, document_ids: Sequence[str]) -> List[str]:
+        """
+        Attach many documents to a project in a single UPDATE ... RETURNING.
+        Returns the ids that were actually found and moved.
+        """
+        if not document_ids:
+            return []
+        stmt = (
+            update(Document)
+            .where(Document.id.in_(document_ids))
+            .values(project_id=project_id)
+            .returning(Document.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return [str(row_id) for row_id in result.scalars().all()]
+
+    async def link_document_to_project(self, document_id: str, project_id: str) -> bool:
+        """
+        Attach one document to a project. Returns False if it does not exist.
+        """
+        return bool(await self.link_documents_to_project(project_id, [document_id]))
@@ -1,18 +1,25 @@
 """
 Repository for Organization CRUD operations and hierarchy management.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
-from app.models.organization_model import Organization
+from app.models.organization_model import Organization, OrgStats
 from app.models.organization_membership_model import OrganizationMembership
 
 
 class OrganizationRepository:
-    """Repository for managing organizations and hierarchical structures."""
+    """
+    Repository for managing organizations and hierarchical structures.
+
+    Methods flush but never commit: they take part in the caller's transaction,
+    which PostgreSQLConnection.session() commits once when the request's work is done.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -29,24 +36,41 @@ class OrganizationRepository:
         rag_config: Optional[dict] = None,
     ) -> Organization:
         """Create a new organization."""
-        organization = Organization(
-            name=name,
-            type=type,
-            description=description,
-            parent_organization_id=parent_organization_id,
-            country=country,
-            location=location,
-            rag_vector_store_id=rag_vector_store_id,
-            rag_config=rag_config,
+        # RETURNING brings back id and timestamps; no refresh SELECT
+        stmt = (
+            insert(Organization)
+            .values(
+                name=name,
+                type=type,
+                description=description,
+                parent_organization_id=parent_organization_id,
+                country=country,
+                location=location,
+                rag_vector_store_id=rag_vector_store_id,
+                rag_config=rag_config,
+            )
+            .returning(Organization)
         )
-        self.db.add(organization)
-        await self.db.commit()
-        await self.db.refresh(organization)
-        return organization
+        return await self.db.scalar(stmt)
 
     async def get_by_id(self, organization_id: UUID) -> Optional[Organization]:
-        """Get organization by ID."""
-        return await self.db.get(Organization, organization_id)
+        """Get organization by ID (columns only; touching a relationship raises)."""
+        return await self.db.get(Organization, organization_id, options=[raiseload("*")])
+
+    async def get_with_relations(
+        self,
+        organization_id: UUID,
+        *,
+        include: Sequence[str] = ("memberships", "projects"),
+    ) -> Optional[Organization]:
+        """Get organization by ID with only the named relationships loaded."""
+        stmt = (
+            select(Organization)
+            .where(Organization.id == organization_id)
+            .options(*(selectinload(getattr(Organization, name)) for name in include), raiseload("*"))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_by_name(self, name: str) -> Optional[Organization]:
         """Get organization by name."""
@@ -56,13 +80,18 @@ class OrganizationRepository:
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Organization]:
         """Get all organizations with pagination."""
-        stmt = select(Organization).offset(skip).limit(limit)
+        # Listings only read columns; skip the eager relationship loads
+        stmt = select(Organization).options(raiseload("*")).offset(skip).limit(limit)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
     async def get_children(self, parent_id: UUID) -> List[Organization]:
         """Get all direct children of an organization."""
-        stmt = select(Organization).where(Organization.parent_organization_id == parent_id)
+        stmt = (
+            select(Organization)
+            .where(Organization.parent_organization_id == parent_id)
+            .options(raiseload("*"))
+        )
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
@@ -71,28 +100,54 @@ class OrganizationRepository:
         Get the full hierarchy path from root to this organization.
         Returns list from root → ... → current organization.
         """
-        hierarchy: List[Organization] = []
-        current = await self.get_by_id(organization_id)
-
-        while current:
-            hierarchy.insert(0, current)
-            if current.parent_organization_id:
-                current = await self.get_by_id(current.parent_organization_id)
-            else:
-                break
+        # Walk up the parent chain in a single recursive query
+        ancestors = (
+            select(
+                Organization.id,
+                Organization.parent_organization_id,
+                literal(0).label("depth"),
+            )
+            .where(Organization.id == organization_id)
+            .cte("ancestors", recursive=True)
+        )
+        parent = aliased(Organization)
+        ancestors = ancestors.union_all(
+            select(parent.id, parent.parent_organization_id, ancestors.c.depth + 1)
+            .join(ancestors, parent.id == ancestors.c.parent_organization_id)
+        )
 
-        return hierarchy
+        stmt = (
+            select(Organization)
+            .join(ancestors, Organization.id == ancestors.c.id)
+            .options(raiseload("*"))
+            .order_by(ancestors.c.depth.desc())
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
 
     async def get_all_descendants(self, organization_id: UUID) -> List[Organization]:
         """Get all descendants recursively (children, grandchildren, etc.)."""
-        descendants: List[Organization] = []
-        children = await self.get_children(organization_id)
-
-        for child in children:
-            descendants.append(child)
-            descendants.extend(await self.get_all_descendants(child.id))
+        # One recursive query instead of a SELECT per node; ordering by path keeps
+        # each subtree together, parents before their children
+        descendants = (
+            select(Organization.id, array([Organization.id]).label("path"))
+            .where(Organization.parent_organization_id == organization_id)
+            .cte("descendants", recursive=True)
+        )
+        child = aliased(Organization)
+        descendants = descendants.union_all(
+            select(child.id, func.array_append(descendants.c.path, child.id))
+            .join(descendants, child.parent_organization_id == descendants.c.id)
+        )
 
-        return descendants
+        stmt = (
+            select(Organization)
+            .join(descendants, Organization.id == descendants.c.id)
+            .options(raiseload("*"))
+            .order_by(descendants.c.path)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
 
     async def update(self, organization_id: UUID, **kwargs) -> Optional[Organization]:
         """Update organization fields."""
@@ -104,18 +159,19 @@ class OrganizationRepository:
             if hasattr(organization, key):
                 setattr(organization, key, value)
 
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(organization)
         return organization
 
     async def delete(self, organization_id: UUID) -> bool:
         """Delete an organization (cascades to children)."""
-        organization = await self.get_by_id(organization_id)
+        # The ORM cascade walks the related collections, so load them normally
+        organization = await self.db.get(Organization, organization_id)
         if not organization:
             return False
 
         await self.db.delete(organization)
-        await self.db.commit()
+        await self.db.flush()
         return True
 
     async def add_member(
@@ -124,16 +180,21 @@ class OrganizationRepository:
         user_id: UUID,
         role: str = "member"
     ) -> OrganizationMembership:
-        """Add a user to an organization."""
-        membership = OrganizationMembership(
+        """Add a user to an organization, or update the role of an existing member."""
+        stmt = pg_insert(OrganizationMembership).values(
             organization_id=organization_id,
             user_id=user_id,
-            role=role
+            role=role,
         )
-        self.db.add(membership)
-        await self.db.commit()
-        await self.db.refresh(membership)
-        return membership
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=["organization_id", "user_id"],
+                set_={"role": stmt.excluded.role},
+            )
+            .returning(OrganizationMembership)
+            .execution_options(populate_existing=True)
+        )
+        return await self.db.scalar(stmt)
 
     async def remove_member(self, organization_id: UUID, user_id: UUID) -> bool:
         """Remove a user from an organization."""
@@ -148,7 +209,7 @@ class OrganizationRepository:
             return False
 
         await self.db.delete(membership)
-        await self.db.commit()
+        await self.db.flush()
         return True
 
     async def get_members(self, organization_id: UUID) -> List[OrganizationMembership]:
@@ -171,3 +232,11 @@ class OrganizationRepository:
             rag_vector_store_id=rag_vector_store_id,
             rag_config=rag_config
         )
+
+    async def get_stats(self, organization_id: UUID) -> Optional[OrgStats]:
+        """Get precomputed project/member counts for an organization."""
+        return await self.db.get(OrgStats, organization_id)
+
+    async def refresh_stats(self) -> None:
+        """Recompute the org_stats materialized view without blocking readers."""
+        await self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY org_stats"))
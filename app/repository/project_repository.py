@@ -1,14 +1,32 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import func, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, with_expression
 
 from app.models.project_model import Project
 from app.models.conversation_model import Conversation
 from app.models.document_model import Document
 
+# Correlated counts: one index lookup per project instead of loading the rows
+_WITH_COUNTS = (
+    with_expression(
+        Project.conversation_count,
+        select(func.count(Conversation.id))
+        .where(Conversation.project_id == Project.id)
+        .correlate(Project)
+        .scalar_subquery(),
+    ),
+    with_expression(
+        Project.document_count,
+        select(func.count(Document.id))
+        .where(Document.project_id == Project.id)
+        .correlate(Project)
+        .scalar_subquery(),
+    ),
+)
+
 
 class ProjectRepository:
     """
@@ -39,8 +57,8 @@ class ProjectRepository:
             "updated_at": project.updated_at,
         }
         if include_relations:
-            payload["conversation_count"] = len(project.conversations) if project.conversations else 0
-            payload["document_count"] = len(project.documents) if project.documents else 0
+            payload["conversation_count"] = project.conversation_count or 0
+            payload["document_count"] = project.document_count or 0
         return payload
 
     # ------------------------------------------------------------------
@@ -77,9 +95,11 @@ class ProjectRepository:
             rules=rules,
             default_model=default_model,
             system_prompt=system_prompt,
-            start_date=start_date or datetime.utcnow(),
             end_date=end_date,
         )
+        # Left unset, start_date is filled in by the column's server default
+        if start_date is not None:
+            project.start_date = start_date
         self.db.add(project)
         await self.db.commit()
         await self.db.refresh(project)
@@ -88,10 +108,8 @@ class ProjectRepository:
     async def get_project(self, project_id: str, *, with_relations: bool = False) -> Optional[Project]:
         stmt = select(Project).where(Project.id == project_id)
         if with_relations:
-            stmt = stmt.options(
-                selectinload(Project.conversations),
-                selectinload(Project.documents),
-            )
+            # populate_existing so counts are filled in on an already-loaded project
+            stmt = stmt.options(*_WITH_COUNTS).execution_options(populate_existing=True)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -110,10 +128,8 @@ class ProjectRepository:
         if organization_id:
             stmt = stmt.where(Project.organization_id == organization_id)
         if with_relations:
-            stmt = stmt.options(
-                selectinload(Project.conversations),
-                selectinload(Project.documents),
-            )
+            stmt = stmt.options(*_WITH_COUNTS)
+        stmt = stmt.options(raiseload("*"))
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
@@ -151,23 +167,28 @@ class ProjectRepository:
         if end_date is not None:
             changes["end_date"] = end_date
 
-        if not changes:
-            return await self.get_project(project_id, with_relations=False)
+        if changes:
+            stmt = (
+                update(Project)
+                .where(Project.id == project_id)
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.db.execute(stmt)
+            await self.db.commit()
+            if result.rowcount == 0:
+                return None
+        # Reloaded with the counts serialize_project reports
+        return await self.get_project(project_id, with_relations=True)
 
+    async def delete_project(self, project_id: str) -> bool:
         stmt = (
-            update(Project)
+            delete(Project)
             .where(Project.id == project_id)
-            .values(**changes)
-            .returning(Project)
+            .execution_options(synchronize_session=False)
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
-        return result.scalar_one_or_none()
-
-    async def delete_project(self, project_id: str) -> bool:
-        stmt = delete(Project).where(Project.id == project_id)
-        result = await self.db.execute(stmt)
-        await self.db.commit()
         return result.rowcount > 0
 
     # ------------------------------------------------------------------
@@ -183,6 +204,16 @@ class ProjectRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_project_document_ids(self, project_id: str) -> List[str]:
+        """Get the ids of a project's documents, newest first."""
+        stmt = (
+            select(Document.id)
+            .where(Document.project_id == project_id)
+            .order_by(Document.created_at.desc())
+        )
+        result = await self.db.execute(stmt)
+        return [str(document_id) for document_id in result.scalars().all()]
+
     async def get_project_documents(self, project_id: str) -> List[Document]:
         """Get all documents for a project (direct relationship)."""
         stmt = (
@@ -21,7 +21,7 @@ class SessionRepository:
     async def create_session(self, user_id: str, refresh_token: str, refresh_token_expires_at: datetime) -> Dict[str, Any]:
         """Create a new session in the database"""
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 new_session = AuthSession(
                     user_id=user_id,
                     refresh_token=refresh_token,
@@ -42,7 +42,7 @@ class SessionRepository:
             return InternalError(message=f"Failed to create session: {str(e)}", error_code="5000")
     async def get_session_by_refresh_token(self, refresh_token: str) -> Optional[Dict[str, Any]]:
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(AuthSession).filter(AuthSession.refresh_token == refresh_token))
                 auth_session = result.scalar_one_or_none()
                 return {
@@ -60,7 +60,7 @@ class SessionRepository:
     async def revoke_session(self, refresh_token: str) -> bool:
         """Revoke a session by its refresh token"""
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(AuthSession).filter(AuthSession.refresh_token == refresh_token))
                 auth_session = result.scalar_one_or_none()
                 if auth_session:
@@ -74,7 +74,7 @@ class SessionRepository:
     async def revoke_sessions_by_user_id(self, user_id: str) -> int:
         """Revoke all sessions for a given user ID"""
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(AuthSession).filter(AuthSession.user_id == user_id, AuthSession.revoked == False))
                 auth_sessions = result.scalars().all()
                 count = 0
@@ -89,7 +89,7 @@ class SessionRepository:
     async def delete_expired_sessions(self) -> int:
         """Delete all expired sessions"""
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 current_time = datetime.datetime.utcnow()
                 result = await session.execute(select(AuthSession).filter(AuthSession.expires_at < current_time))
                 expired_sessions = result.scalars().all()
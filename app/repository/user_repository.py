@@ -1,9 +1,11 @@
+import asyncio
 import datetime
 import time
 from typing import Optional, Dict, Any, Union
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import exists
 from sqlalchemy.future import select
 
 from app.db.postgresql import get_db_connection
@@ -50,13 +52,15 @@ class UserRepository:
         """Create a new user in the database"""
         logger.debug(f"Attempting to create user: {username} ({email})")
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
 
                 # Check if username or email already exists
                 logger.debug(f"Checking if user already exists: {username} or {email}")
-                result = await session.execute(select(User).filter((User.username == username) | (User.email == email)))
-                existing_user = result.scalar_one_or_none()
-                if existing_user:
+                # EXISTS answers from the unique indexes and cannot trip over two matching rows
+                taken = await session.scalar(
+                    select(exists().where((User.username == username) | (User.email == email)))
+                )
+                if taken:
                     logger.warning(f"User creation failed: Username or email already exists ({username}/{email})")
                     return BadRequest(message="Username or email already exists", error_code="4009")
                 
@@ -89,7 +93,7 @@ class UserRepository:
     
     async def get_user_by_username(self, username: str) -> Union[Dict[str, Any], ResponseStatus]:
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.username == username))
                 user = result.scalar_one_or_none()
                 if not user:
@@ -102,7 +106,7 @@ class UserRepository:
     async def get_user_by_email(self, email: str) -> Union[Dict[str, Any], ResponseStatus]:
         logger.debug(f"Looking up user by email: {email}")
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.email == email))
                 user = result.scalar_one_or_none()
                 if user:
@@ -121,7 +125,7 @@ class UserRepository:
             return normalized_id
 
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.id == normalized_id))
                 user = result.scalar_one_or_none()
                 if not user:
@@ -136,7 +140,7 @@ class UserRepository:
             return normalized_id
 
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 # Check if user exists
                 result = await session.execute(select(User).filter(User.id == normalized_id))
                 user = result.scalar_one_or_none()
@@ -159,7 +163,7 @@ class UserRepository:
             return normalized_id
 
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.id == normalized_id))
                 user = result.scalar_one_or_none()
                 if user:
@@ -172,10 +176,10 @@ class UserRepository:
 
     async def verify_password(self, username: str, password: str) -> Union[ResponseStatus, None, InternalError]:
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.username == username))
                 user = result.scalar_one_or_none()
-                if user and user.verify_password(password):
+                if user and await asyncio.to_thread(user.verify_password, password):
                     return OK(message="Password is valid")
                 return None
         except Exception as e:
@@ -187,7 +191,7 @@ class UserRepository:
             return normalized_id
 
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.id == normalized_id))
                 user = result.scalar_one_or_none()
                 if user:
@@ -201,7 +205,7 @@ class UserRepository:
 
     async def verify_refresh_token(self, refresh_token: str) -> ResponseStatus:
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.refresh_token == refresh_token))
                 user = result.scalar_one_or_none()
                 if user and user.refresh_token_expires_at and user.refresh_token_expires_at > int(time.time()):
@@ -215,7 +219,7 @@ class UserRepository:
 
     async def invalidate_token(self, token: str) -> bool:
         try:
-            async for session in self._get_db_connection().get_session():
+            async with self._get_db_connection().session() as session:
                 result = await session.execute(select(User).filter(User.refresh_token == token))
                 user = result.scalar_one_or_none()
                 if user:
@@ -32,7 +32,7 @@ class AssistantPresetService:
         created_by: Optional[str] = None,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = AssistantPresetRepository(session)
 
                 # Ensure uniqueness within project scope
@@ -66,7 +66,7 @@ class AssistantPresetService:
         include_usage: bool = False,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = AssistantPresetRepository(session)
                 presets = await repo.list_presets(
                     company_id=company_id,
@@ -80,7 +80,7 @@ class AssistantPresetService:
 
     async def get_preset(self, preset_id: str, *, include_usage: bool = False) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = AssistantPresetRepository(session)
                 preset = await repo.get_preset(preset_id, with_usage=include_usage)
                 if not preset:
@@ -102,7 +102,7 @@ class AssistantPresetService:
         project_id: Optional[str] = None,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = AssistantPresetRepository(session)
 
                 updated = await repo.update_preset(
@@ -123,7 +123,7 @@ class AssistantPresetService:
 
     async def delete_preset(self, preset_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = AssistantPresetRepository(session)
                 removed = await repo.delete_preset(preset_id)
                 if not removed:
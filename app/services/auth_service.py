@@ -1,3 +1,4 @@
+import asyncio
 from app.repository.user_repository import UserRepository
 from app.core.response_status import *
 from app.core.jwt import *
@@ -52,7 +53,8 @@ class AuthService:
                 return UserNotFound(message="User not found", error_code="4004")
 
             # Verify password
-            if not verify_password(password, checked_user['hashed_password']):
+            # bcrypt is deliberately slow; keep it off the event loop
+            if not await asyncio.to_thread(verify_password, password, checked_user['hashed_password']):
                 logger.warning(f"Login failed for {email}: Invalid password")
                 return InvalidCredentials(message="Invalid credentials", error_code="4001")
 
@@ -163,7 +165,7 @@ class AuthService:
 
             # Hash password
             logger.debug(f"Hashing password for user: {username}")
-            hashed_password = get_password_hash(password)
+            hashed_password = await asyncio.to_thread(get_password_hash, password)
 
             # Generate tokens
             from datetime import datetime, timedelta
@@ -5,11 +5,14 @@ Optimizes performance by caching repeated/similar queries.
 import json
 import hashlib
 import logging
-from typing import Optional, Any, Dict
+import msgspec
+import orjson
+from typing import Optional, Any, Dict, Union
 from redis import asyncio as aioredis
 from redis.exceptions import RedisError
 
 from app.core.config import get_settings
+from app.core.response_status import encode_json
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +23,9 @@ class CacheService:
     def __init__(self):
         self.settings = get_settings()
         self._redis: Optional[aioredis.Redis] = None
-        self._enabled = self.settings.ENABLE_RESPONSE_CACHE
+        # Sessions are stored here too, so this follows REDIS_ENABLED; response
+        # caching is switched separately by ENABLE_RESPONSE_CACHE at its call sites
+        self._enabled = self.settings.REDIS_ENABLED
 
     async def connect(self):
         """Initialize Redis connection pool."""
@@ -53,6 +58,11 @@ class CacheService:
             await self._redis.close()
             logger.info("Redis cache disconnected")
 
+    @property
+    def is_available(self) -> bool:
+        """Whether a live Redis connection is configured."""
+        return self._enabled and self._redis is not None
+
     def _generate_cache_key(self, prefix: str, data: Dict[str, Any]) -> str:
         """Generate a cache key from request data."""
         # Sort keys for consistent hashing
@@ -101,6 +111,85 @@ class CacheService:
             logger.warning(f"Cache delete error: {e}")
             return False
 
+    async def delete_many(self, *keys: str) -> int:
+        """Delete several cached values in one round trip."""
+        if not self._enabled or not self._redis or not keys:
+            return 0
+
+        try:
+            return await self._redis.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache delete error: {e}")
+            return 0
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Retrieve and decode a JSON value stored with set_json."""
+        cached_value = await self.get(key)
+        if cached_value is None:
+            return None
+        try:
+            return orjson.loads(cached_value)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to decode cached value: {e}")
+            return None
+
+    async def set_json(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Encode a value with the response encoder and cache it, so a cached value
+        serializes (datetimes included) exactly like a freshly loaded one.
+        """
+        try:
+            encoded = encode_json(value)
+        except (TypeError, msgspec.EncodeError) as e:
+            logger.warning(f"Failed to serialize value: {e}")
+            return False
+        return await self.set(key, encoded, ttl)
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> bool:
+        """Add members with scores to a sorted set."""
+        if not self._enabled or not self._redis:
+            return False
+
+        try:
+            await self._redis.zadd(key, mapping)
+            return True
+        except RedisError as e:
+            logger.warning(f"Cache zadd error: {e}")
+            return False
+
+    async def zrem(self, key: str, *members: str) -> int:
+        """Remove members from a sorted set."""
+        if not self._enabled or not self._redis:
+            return 0
+
+        try:
+            return await self._redis.zrem(key, *members)
+        except RedisError as e:
+            logger.warning(f"Cache zrem error: {e}")
+            return 0
+
+    async def zcount(self, key: str, min_score: Union[float, str], max_score: Union[float, str]) -> int:
+        """Count sorted set members with a score in [min_score, max_score]."""
+        if not self._enabled or not self._redis:
+            return 0
+
+        try:
+            return await self._redis.zcount(key, min_score, max_score)
+        except RedisError as e:
+            logger.warning(f"Cache zcount error: {e}")
+            return 0
+
+    async def zremrangebyscore(self, key: str, min_score: Union[float, str], max_score: Union[float, str]) -> int:
+        """Remove sorted set members with a score in [min_score, max_score]."""
+        if not self._enabled or not self._redis:
+            return 0
+
+        try:
+            return await self._redis.zremrangebyscore(key, min_score, max_score)
+        except RedisError as e:
+            logger.warning(f"Cache zremrangebyscore error: {e}")
+            return 0
+
     async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching a pattern."""
         if not self._enabled or not self._redis:
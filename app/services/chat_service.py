@@ -1,9 +1,13 @@
-from typing import AsyncGenerator, Optional, Dict, Any, List
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import AsyncGenerator, Optional, Dict, Any, List, Tuple
 from uuid import uuid4, UUID
+import asyncio
 import logging
 import time
 
 import httpx
+import orjson
 from openai import AsyncOpenAI
 
 from app.schemas.chat_response import (
@@ -25,6 +29,7 @@ from app.services.retrieval_service import build_default_retriever
 from app.services.cache_service import get_cache_service
 from app.repository.llm_repository import llm_repository as default_llm_repo
 from app.utils.tokenizer import Tokenizer
+from app.db.postgresql import get_db_connection
 from app.repository.chat_repository import ChatRepository
 from app.core.response_status import ResponseStatus
 from app.models.message_model import Message
@@ -39,7 +44,7 @@ class ChatService:
         self.history_store = getattr(self.llm_repository, "history_store", InMemoryHistoryStore())
         self.tokenizer = Tokenizer(self.settings.MODEL_NAME)
         self.cache_service = get_cache_service()
-        self.chat_repository = ChatRepository()
+        self._db_connection = None
         self.context_engine = ContextEngine(
             history=self.history_store,
             retriever=build_default_retriever(),
@@ -68,6 +73,58 @@ class ChatService:
             http_client=http_client
         )
     
+    def _get_db(self):
+        if self._db_connection is None:
+            self._db_connection = get_db_connection()
+        return self._db_connection
+
+    # ------------------------------------------------------------------
+    # Conversation read cache (Redis, short TTL, dropped on every write)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _conversation_cache_keys(conversation_id: str) -> Tuple[str, str, str]:
+        return (
+            f"conv:{conversation_id}",
+            f"conv:{conversation_id}:parts",
+            f"conv:{conversation_id}:msgs",
+        )
+
+    async def _invalidate_conversation_cache(self, conversation_id: str) -> None:
+        await self.cache_service.delete_many(*self._conversation_cache_keys(conversation_id))
+
+    async def _load_chat(self, repo: ChatRepository, conversation_id: str):
+        key = self._conversation_cache_keys(conversation_id)[0]
+        cached = await self.cache_service.get_json(key)
+        if cached is not None:
+            return cached
+        result = await repo.get_chat_by_id(conversation_id)
+        if isinstance(result, dict):
+            await self.cache_service.set_json(key, result, self.settings.CONVERSATION_CACHE_TTL)
+        return result
+
+    async def _load_participants(self, repo: ChatRepository, conversation_id: str):
+        key = self._conversation_cache_keys(conversation_id)[1]
+        cached = await self.cache_service.get_json(key)
+        if cached is not None:
+            return cached
+        result = await repo.list_participants(conversation_id)
+        if isinstance(result, list):
+            await self.cache_service.set_json(key, result, self.settings.CONVERSATION_CACHE_TTL)
+        return result
+
+    async def _load_recent_messages(self, repo: ChatRepository, conversation_id: str, limit: int):
+        """Latest plain message page; a cached page serves any smaller limit too."""
+        key = self._conversation_cache_keys(conversation_id)[2]
+        cached = await self.cache_service.get_json(key)
+        if cached is not None and cached["limit"] >= limit:
+            return cached["messages"][:limit]
+        result = await repo.list_messages(conversation_id, limit=limit)
+        if isinstance(result, list):
+            await self.cache_service.set_json(
+                key, {"limit": limit, "messages": result}, self.settings.CONVERSATION_CACHE_TTL
+            )
+        return result
+
     # Helper function for a proper model when client call it.
     
     async def _get_client_for_model(self, model_id: str) -> AsyncOpenAI:
@@ -173,7 +230,9 @@ class ChatService:
         if candidate_id:
             try:
                 conversation_uuid = str(UUID(str(candidate_id)))
-                existing = await self.chat_repository.get_chat_by_id(conversation_uuid)
+                existing = None
+                async with self._get_db().session() as session:
+                    existing = await ChatRepository(session).get_chat_by_id(conversation_uuid)
                 if isinstance(existing, ResponseStatus):
                     if existing.success:
                         data = getattr(existing, "data", None) or {}
@@ -199,14 +258,16 @@ class ChatService:
             title = metadata.get("conversation_title") or metadata.get("title")
             preset_id = metadata.get("preset_id")
 
-            creation = await self.chat_repository.create_chat(
-                company_id=company_id,
-                project_id=project_uuid,
-                title=title,
-                created_by=request.user,
-                model=request.model,
-                preset_id=preset_id,
-            )
+            creation = None
+            async with self._get_db().session() as session:
+                creation = await ChatRepository(session).create_chat(
+                    company_id=company_id,
+                    project_id=project_uuid,
+                    title=title,
+                    created_by=request.user,
+                    model=request.model,
+                    preset_id=preset_id,
+                )
 
             if isinstance(creation, ResponseStatus):
                 if not creation.success:
@@ -234,16 +295,88 @@ class ChatService:
         request.metadata = metadata
         return conversation_id
 
-    async def _register_participant(self, conversation_id: str, user_id: Optional[str]) -> None:
+    async def _register_participant(
+        self, repo: ChatRepository, conversation_id: str, user_id: Optional[str]
+    ) -> None:
         if not user_id:
             return
         try:
-            result = await self.chat_repository.add_participant(conversation_id, user_id)
+            result = await repo.ensure_participants(conversation_id, [user_id])
             if isinstance(result, ResponseStatus) and not result.success:
                 logger.debug(f"Failed to register participant: {result.message}")
         except Exception as exc:
             logger.debug(f"Participant registration failed: {exc}")
 
+    @staticmethod
+    def _should_persist(request: ChatCompletionRequest) -> bool:
+        metadata = request.metadata or {}
+        persist_flag = metadata.get("persist_conversation")
+        if isinstance(persist_flag, str):
+            return persist_flag.lower() in {"1", "true", "yes", "on"}
+        if persist_flag is None:
+            return bool(metadata.get("project_id"))
+        return bool(persist_flag)
+
+    async def _create_exchange_messages(
+        self,
+        repo: ChatRepository,
+        *,
+        conversation_id: str,
+        request: ChatCompletionRequest,
+        user_message: Optional[ResponseChatMessage],
+        assistant_content: str,
+        assistant_state: str = "final",
+    ) -> Optional[str]:
+        """Store the participant, the user turn and the assistant turn; returns the assistant message id."""
+        await self._register_participant(repo, conversation_id, request.user)
+
+        user_record = None
+        if user_message and user_message.content:
+            created = await repo.create_message(
+                conversation_id=conversation_id,
+                role="user",
+                content=user_message.content,
+                author_user_id=request.user,
+                model_label=request.model,
+                temperature=request.temperature,
+                top_p=request.top_p,
+            )
+            if isinstance(created, Message):
+                user_record = created
+            elif isinstance(created, ResponseStatus) and not created.success:
+                logger.debug(f"Failed to persist user message: {created.message}")
+
+        assistant_record = await repo.create_message(
+            conversation_id=conversation_id,
+            role="assistant",
+            content=assistant_content,
+            author_user_id=None,
+            parent_message_id=str(user_record.id) if user_record else None,
+            state=assistant_state,
+            model_label=request.model,
+            temperature=request.temperature,
+            top_p=request.top_p,
+        )
+
+        if isinstance(assistant_record, Message):
+            return str(assistant_record.id)
+        if isinstance(assistant_record, ResponseStatus):
+            if assistant_record.success and assistant_record.data:
+                return assistant_record.data.get("message_id")
+            logger.debug(f"Failed to persist assistant message: {assistant_record.message}")
+        return None
+
+    async def _save_usage(self, repo: ChatRepository, message_id: str, usage: Usage) -> None:
+        usage_result = await repo.save_message_usage(
+            message_id,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            latency_ms=None,
+            cost_usd=None,
+        )
+        if isinstance(usage_result, ResponseStatus) and not usage_result.success:
+            logger.debug(f"Failed to persist usage: {usage_result.message}")
+
     async def _persist_exchange(
         self,
         *,
@@ -253,70 +386,27 @@ class ChatService:
         assistant_message: ResponseChatMessage,
         usage: Usage,
     ) -> None:
-        metadata = request.metadata or {}
-        persist_flag = metadata.get("persist_conversation")
-        if isinstance(persist_flag, str):
-            persist_conversation = persist_flag.lower() in {"1", "true", "yes", "on"}
-        elif persist_flag is None:
-            persist_conversation = bool(metadata.get("project_id"))
-        else:
-            persist_conversation = bool(persist_flag)
-
-        if not persist_conversation:
+        if not self._should_persist(request):
             logger.debug("Skipping persistence for conversation %s (ephemeral session)", conversation_id)
             return
 
         try:
-            await self._register_participant(conversation_id, request.user)
-
-            user_record = None
-            if user_message and user_message.content:
-                created = await self.chat_repository.create_message(
+            # One session for the whole exchange: participant, both messages and usage
+            async with self._get_db().session() as session:
+                repo = ChatRepository(session)
+                assistant_message_id = await self._create_exchange_messages(
+                    repo,
                     conversation_id=conversation_id,
-                    role="user",
-                    content=user_message.content,
-                    author_user_id=request.user,
-                    model_label=request.model,
-                    temperature=request.temperature,
-                    top_p=request.top_p,
-                )
-                if isinstance(created, Message):
-                    user_record = created
-                elif isinstance(created, ResponseStatus) and not created.success:
-                    logger.debug(f"Failed to persist user message: {created.message}")
-
-            assistant_record = await self.chat_repository.create_message(
-                conversation_id=conversation_id,
-                role="assistant",
-                content=assistant_message.content or "",
-                author_user_id=None,
-                parent_message_id=str(user_record.id) if user_record else None,
-                model_label=request.model,
-                temperature=request.temperature,
-                top_p=request.top_p,
-            )
-
-            assistant_message_id: Optional[str] = None
-            if isinstance(assistant_record, Message):
-                assistant_message_id = str(assistant_record.id)
-            elif isinstance(assistant_record, ResponseStatus):
-                if assistant_record.success and assistant_record.data:
-                    assistant_message_id = assistant_record.data.get("message_id")
-                else:
-                    logger.debug(f"Failed to persist assistant message: {assistant_record.message}")
-
-            if assistant_message_id:
-                usage_result = await self.chat_repository.save_message_usage(
-                    assistant_message_id,
-                    prompt_tokens=usage.prompt_tokens,
-                    completion_tokens=usage.completion_tokens,
-                    latency_ms=None,
-                    cost_usd=None,
+                    request=request,
+                    user_message=user_message,
+                    assistant_content=assistant_message.content or "",
                 )
-                if isinstance(usage_result, ResponseStatus) and not usage_result.success:
-                    logger.debug(f"Failed to persist usage: {usage_result.message}")
+                if assistant_message_id:
+                    await self._save_usage(repo, assistant_message_id, usage)
         except Exception as exc:
             logger.error(f"Message persistence failed: {exc}", exc_info=True)
+        finally:
+            await self._invalidate_conversation_cache(conversation_id)
 
     async def create_completion(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
         """Create a non-streaming chat completion using LM Studio."""
@@ -586,60 +676,95 @@ class ChatService:
         # Accumulate full response for history
         full_content = ""
 
-        try:
-            # Stream from LM Studio using OpenAI client
-            client = await self._get_client_for_model(request.model)
-            stream = await client.chat.completions.create(
-                model=request.model,
-                messages=openai_messages,
-                temperature=request.temperature or self.settings.MODEL_TEMPERATURE,
-                max_tokens=request.max_tokens or self.settings.MODEL_MAX_OUTPUT_TOKENS,
-                top_p=request.top_p,
-                frequency_penalty=request.frequency_penalty,
-                presence_penalty=request.presence_penalty,
-                stop=request.stop,
-                stream=True
-            )
-
-            # Process the stream
-            async for chunk in stream:
-                # Extract content from the chunk
-                if chunk.choices and len(chunk.choices) > 0:
-                    choice = chunk.choices[0]
-                    delta_content = choice.delta.content if choice.delta and choice.delta.content else None
-                    finish_reason = choice.finish_reason
-
-                    # Build our response chunk
-                    response_chunk = ChatCompletionChunk(
-                        id=chunk.id if hasattr(chunk, 'id') else request_id,
-                        created=chunk.created if hasattr(chunk, 'created') else int(time.time()),
-                        model=request.model,
-                        choices=[
-                            ChatCompletionChunkChoice(
-                                index=0,
-                                delta=ChatCompletionChunkDelta(
-                                    role=ChatRole.ASSISTANT if delta_content else None,
-                                    content=delta_content
-                                ),
-                                finish_reason=finish_reason
-                            )
-                        ]
+        last_user = None
+        for m in reversed(provided_messages):
+            if m.role == ChatRole.USER and (m.content or "").strip():
+                last_user = m
+                break
+
+        async with AsyncExitStack() as stack:
+            # A persisted stream gets its assistant row up front so deltas can be
+            # written to message_stream_chunks in batches while the reply arrives
+            stream_repo: Optional[ChatRepository] = None
+            stream_message_id: Optional[str] = None
+            if self._should_persist(request):
+                try:
+                    session = await stack.enter_async_context(self._get_db().session())
+                    stream_repo = ChatRepository(session)
+                    stream_message_id = await self._create_exchange_messages(
+                        stream_repo,
+                        conversation_id=conversation_id,
+                        request=request,
+                        user_message=last_user,
+                        assistant_content="",
+                        assistant_state="streaming",
                     )
+                except Exception as exc:
+                    logger.error(f"[{request_id}] Failed to open streamed message: {exc}", exc_info=True)
+
+            stream_state = "error"
+            delta_seq = 0
+            try:
+                # Stream from LM Studio using OpenAI client
+                client = await self._get_client_for_model(request.model)
+                stream = await client.chat.completions.create(
+                    model=request.model,
+                    messages=openai_messages,
+                    temperature=request.temperature or self.settings.MODEL_TEMPERATURE,
+                    max_tokens=request.max_tokens or self.settings.MODEL_MAX_OUTPUT_TOKENS,
+                    top_p=request.top_p,
+                    frequency_penalty=request.frequency_penalty,
+                    presence_penalty=request.presence_penalty,
+                    stop=request.stop,
+                    stream=True
+                )
 
-                    # Accumulate content for history
-                    if delta_content:
-                        full_content += delta_content
+                # Process the stream
+                async for chunk in stream:
+                    # Extract content from the chunk
+                    if chunk.choices and len(chunk.choices) > 0:
+                        choice = chunk.choices[0]
+                        delta_content = choice.delta.content if choice.delta and choice.delta.content else None
+                        finish_reason = choice.finish_reason
+
+                        # Build our response chunk
+                        response_chunk = ChatCompletionChunk(
+                            id=chunk.id if hasattr(chunk, 'id') else request_id,
+                            created=chunk.created if hasattr(chunk, 'created') else int(time.time()),
+                            model=request.model,
+                            choices=[
+                                ChatCompletionChunkChoice(
+                                    index=0,
+                                    delta=ChatCompletionChunkDelta(
+                                        role=ChatRole.ASSISTANT if delta_content else None,
+                                        content=delta_content
+                                    ),
+                                    finish_reason=finish_reason
+                                )
+                            ]
+                        )
+
+                        # Accumulate content for history
+                        if delta_content:
+                            full_content += delta_content
+                            if stream_message_id:
+                                await stream_repo.append_stream_chunk(stream_message_id, delta_seq, delta_content)
+                                delta_seq += 1
+
+                        yield response_chunk
+                stream_state = "final"
+
+            except Exception as e:
+                logger.exception(f"[{request_id}] Streaming error from LM Studio")
+                raise ValueError(f"LM Studio streaming error: {str(e)}")
 
-                    yield response_chunk
+            finally:
+                # Also runs when the client disconnects mid-stream
+                if stream_message_id:
+                    await self._finish_streamed_message(stream_repo, stream_message_id, full_content, stream_state)
 
             # After streaming completes, persist to history and repository
             try:
-                last_user = None
-                for m in reversed(provided_messages):
-                    if m.role == ChatRole.USER and (m.content or "").strip():
-                        last_user = m
-                        break
-
                 assistant_msg = ResponseChatMessage(role=ChatRole.ASSISTANT, content=full_content)
                 to_save = []
                 if last_user is not None:
@@ -652,20 +777,34 @@ class ChatService:
                     completion_tokens=self.tokenizer.count_text(full_content),
                     total_tokens=self.tokenizer.count_messages(final_messages) + self.tokenizer.count_text(full_content),
                 )
-                await self._persist_exchange(
-                    conversation_id=conversation_id,
-                    request=request,
-                    user_message=last_user,
-                    assistant_message=assistant_msg,
-                    usage=usage,
-                )
+                if stream_message_id:
+                    await self._save_usage(stream_repo, stream_message_id, usage)
+                else:
+                    await self._persist_exchange(
+                        conversation_id=conversation_id,
+                        request=request,
+                        user_message=last_user,
+                        assistant_message=assistant_msg,
+                        usage=usage,
+                    )
 
             except Exception as ex:
                 logger.debug(f"History persistence failed during streaming: {ex}")
 
-        except Exception as e:
-            logger.exception(f"[{request_id}] Streaming error from LM Studio")
-            raise ValueError(f"LM Studio streaming error: {str(e)}")
+    async def _finish_streamed_message(
+        self,
+        repo: ChatRepository,
+        message_id: str,
+        content: str,
+        state: str,
+    ) -> None:
+        try:
+            await repo.flush(message_id)
+            result = await repo.finish_message(message_id, content, state=state)
+            if isinstance(result, ResponseStatus) and not result.success:
+                logger.debug(f"Failed to finish streamed message: {result.message}")
+        except Exception as exc:
+            logger.error(f"Finishing streamed message {message_id} failed: {exc}", exc_info=True)
     
     async def count_tokens(self, text: str, model: str) -> int:
         """
@@ -681,7 +820,9 @@ class ChatService:
 
     async def get_chat_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve chat conversation details by ID."""
-        result = await self.chat_repository.get_chat_by_id(conversation_id)
+        result = None
+        async with self._get_db().session() as session:
+            result = await ChatRepository(session).get_chat_by_id(conversation_id)
         if isinstance(result, ResponseStatus):
             if result.success:
                 return result.data
@@ -698,14 +839,18 @@ class ChatService:
         project_id: Optional[str] = None,
         company_id: Optional[str] = None,
         limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> ResponseStatus:
         try:
-            result = await self.chat_repository.list_chats_for_user(
-                user_id,
-                project_id=project_id,
-                company_id=company_id,
-                limit=limit,
-            )
+            result = None
+            async with self._get_db().session() as session:
+                result = await ChatRepository(session).list_chats_for_user(
+                    user_id,
+                    project_id=project_id,
+                    company_id=company_id,
+                    limit=limit,
+                    after=after,
+                )
             if isinstance(result, ResponseStatus):
                 return result
             return ResponseStatus(message="OK", data=result)
@@ -716,12 +861,15 @@ class ChatService:
         self, conversation_id: str, user_id: Optional[str] = None
     ) -> ResponseStatus:
         try:
-            if user_id:
-                has_access = await self.chat_repository.user_has_access(conversation_id, user_id)
-                if not has_access:
-                    return ResponseStatus(message="Forbidden", status_code=403)
-
-            result = await self.chat_repository.get_chat_by_id(conversation_id)
+            result = None
+            async with self._get_db().session() as session:
+                repo = ChatRepository(session)
+                if user_id:
+                    has_access = await repo.user_has_access(conversation_id, user_id)
+                    if not has_access:
+                        return ResponseStatus(message="Forbidden", status_code=403)
+
+                result = await self._load_chat(repo, conversation_id)
             if isinstance(result, ResponseStatus):
                 return result
             if result is None:
@@ -730,6 +878,51 @@ class ChatService:
         except Exception as e:
             return ResponseStatus(message=f"Failed to get conversation: {e}", status_code=500)
 
+    async def _run_in_session(self, operation):
+        """Run ``operation(repo)`` on a session of its own and return its result."""
+        async with self._get_db().session() as session:
+            return await operation(ChatRepository(session))
+
+    async def get_conversation_bundle(
+        self,
+        conversation_id: str,
+        *,
+        user_id: Optional[str] = None,
+        message_limit: int = 100,
+    ) -> ResponseStatus:
+        """
+        Load a conversation with its participants and recent messages.
+        A single AsyncSession runs one statement at a time, so each lookup gets
+        its own pooled session and all of them run concurrently.
+        """
+        try:
+            lookups = [
+                self._run_in_session(lambda repo: self._load_chat(repo, conversation_id)),
+                self._run_in_session(lambda repo: self._load_participants(repo, conversation_id)),
+                self._run_in_session(
+                    lambda repo: self._load_recent_messages(repo, conversation_id, message_limit)
+                ),
+            ]
+            if user_id:
+                lookups.append(
+                    self._run_in_session(lambda repo: repo.user_has_access(conversation_id, user_id))
+                )
+            chat, participants, messages, *access = await asyncio.gather(*lookups)
+
+            if access and not access[0]:
+                return ResponseStatus(message="Forbidden", status_code=403)
+            for result in (chat, participants, messages):
+                if isinstance(result, ResponseStatus):
+                    return result
+            if chat is None:
+                return ResponseStatus(message="Not Found", status_code=404)
+            return ResponseStatus(
+                message="OK",
+                data={**chat, "participants": participants, "messages": messages},
+            )
+        except Exception as e:
+            return ResponseStatus(message=f"Failed to load conversation: {e}", status_code=500)
+
     async def get_conversation_messages(
         self,
         conversation_id: str,
@@ -739,25 +932,94 @@ class ChatService:
         include_children: bool = False,
         include_artifacts: bool = False,
         include_usage: bool = False,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> ResponseStatus:
         try:
-            if user_id:
-                has_access = await self.chat_repository.user_has_access(conversation_id, user_id)
-                if not has_access:
-                    return ResponseStatus(message="Forbidden", status_code=403)
+            result = None
+            async with self._get_db().session() as session:
+                repo = ChatRepository(session)
+                if user_id:
+                    has_access = await repo.user_has_access(conversation_id, user_id)
+                    if not has_access:
+                        return ResponseStatus(message="Forbidden", status_code=403)
+
+                if before is None and not (include_children or include_artifacts or include_usage):
+                    result = await self._load_recent_messages(repo, conversation_id, limit)
+                else:
+                    result = await repo.list_messages(
+                        conversation_id,
+                        limit=limit,
+                        include_children=include_children,
+                        include_artifacts=include_artifacts,
+                        include_usage=include_usage,
+                        before=before,
+                    )
+            if isinstance(result, ResponseStatus):
+                return result
+            return ResponseStatus(message="OK", data=result)
+        except Exception as e:
+            return ResponseStatus(message=f"Failed to list messages: {e}", status_code=500)
+
+    async def check_conversation_access(self, conversation_id: str, user_id: str) -> Optional[ResponseStatus]:
+        """Return a Forbidden status when the user may not read the conversation."""
+        async with self._get_db().session() as session:
+            has_access = await ChatRepository(session).user_has_access(conversation_id, user_id)
+        if not has_access:
+            return ResponseStatus(message="Forbidden", status_code=403)
+        return None
+
+    async def create_stream_chunk_partitions(self, months_ahead: int) -> None:
+        async with self._get_db().session() as session:
+            await ChatRepository(session).create_stream_chunk_partitions(months_ahead)
 
-            result = await self.chat_repository.list_messages(
+    async def stream_conversation_messages(
+        self,
+        conversation_id: str,
+        *,
+        include_artifacts: bool = False,
+        include_usage: bool = False,
+    ) -> AsyncGenerator[bytes, None]:
+        """Encode a conversation's messages as NDJSON lines while they are read."""
+        async with self._get_db().session() as session:
+            messages = ChatRepository(session).stream_messages(
                 conversation_id,
-                limit=limit,
-                include_children=include_children,
                 include_artifacts=include_artifacts,
                 include_usage=include_usage,
             )
+            async for payload in messages:
+                yield orjson.dumps(payload) + b"\n"
+
+    async def get_message_thread(
+        self,
+        conversation_id: str,
+        message_id: str,
+        *,
+        user_id: Optional[str] = None,
+        include_artifacts: bool = False,
+        include_usage: bool = False,
+    ) -> ResponseStatus:
+        try:
+            result = None
+            async with self._get_db().session() as session:
+                repo = ChatRepository(session)
+                if user_id:
+                    has_access = await repo.user_has_access(conversation_id, user_id)
+                    if not has_access:
+                        return ResponseStatus(message="Forbidden", status_code=403)
+
+                result = await repo.get_message_thread(
+                    conversation_id,
+                    message_id,
+                    include_artifacts=include_artifacts,
+                    include_usage=include_usage,
+                )
             if isinstance(result, ResponseStatus):
                 return result
+            if result is None:
+                return ResponseStatus(message="Not Found", status_code=404)
             return ResponseStatus(message="OK", data=result)
         except Exception as e:
-            return ResponseStatus(message=f"Failed to list messages: {e}", status_code=500)
+            return ResponseStatus(message=f"Failed to load message thread: {e}", status_code=500)
 
 _chat_service: Optional[ChatService] = None
 
@@ -121,7 +121,7 @@ class DocumentService:
         project_ids: Optional[List[str]] = None,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = DocumentRepository(session)
                 link_repo = LinkRepository(session)
 
@@ -149,9 +149,9 @@ class DocumentService:
 
     async def list_documents_by_project(self, project_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = DocumentRepository(session)
-                records = await repo.list_documents_by_project(project_id)
+                # Rows arrive in bounded batches; only the summaries are kept
                 data = [
                     {
                         "id": str(doc.id),
@@ -160,7 +160,7 @@ class DocumentService:
                         "uploaded_by": str(doc.uploaded_by) if doc.uploaded_by else None,
                         "created_at": doc.created_at,
                     }
-                    for doc in records
+                    async for doc in repo.stream_documents_by_project(project_id)
                 ]
                 return OK(data=data)
         except Exception as exc:
@@ -168,7 +168,7 @@ class DocumentService:
 
     async def list_documents_by_company(self, company_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = DocumentRepository(session)
                 records = await repo.list_documents_by_company(company_id)
                 data = [
@@ -186,7 +186,7 @@ class DocumentService:
 
     async def delete_document_record(self, document_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = DocumentRepository(session)
                 removed = await repo.delete_document(document_id)
                 if not removed:
@@ -32,7 +32,7 @@ class OrganizationService:
         rag_config: Optional[dict] = None,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 
                 # Check if parent exists
@@ -69,7 +69,7 @@ class OrganizationService:
 
     async def get_organization(self, organization_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 org = await repo.get_by_id(UUID(organization_id))
                 if not org:
@@ -94,7 +94,7 @@ class OrganizationService:
 
     async def list_organizations(self, skip: int = 0, limit: int = 100) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 organizations = await repo.get_all(skip=skip, limit=limit)
                 
@@ -120,7 +120,7 @@ class OrganizationService:
         **kwargs
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 updated = await repo.update(UUID(organization_id), **kwargs)
                 if not updated:
@@ -143,7 +143,7 @@ class OrganizationService:
 
     async def delete_organization(self, organization_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 success = await repo.delete(UUID(organization_id))
                 if not success:
@@ -154,7 +154,7 @@ class OrganizationService:
 
     async def get_hierarchy(self, organization_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 hierarchy = await repo.get_hierarchy(UUID(organization_id))
                 
@@ -173,7 +173,7 @@ class OrganizationService:
 
     async def get_children(self, organization_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 children = await repo.get_children(UUID(organization_id))
                 
@@ -190,6 +190,28 @@ class OrganizationService:
         except Exception as exc:
             return InternalError(message=f"Failed to get children: {exc}")
 
+    async def get_stats(self, organization_id: str) -> ResponseStatus:
+        try:
+            async with self._get_db().session() as session:
+                repo = OrganizationRepository(session)
+                stats = await repo.get_stats(UUID(organization_id))
+                if not stats:
+                    return NotFound(message="Organization stats not found", error_code="4004")
+
+                data = {
+                    "organization_id": str(stats.organization_id),
+                    "project_count": stats.project_count,
+                    "rag_project_count": stats.rag_project_count,
+                    "member_count": stats.member_count,
+                }
+                return OK(data=data)
+        except Exception as exc:
+            return InternalError(message=f"Failed to get organization stats: {exc}")
+
+    async def refresh_stats(self) -> None:
+        async with self._get_db().session() as session:
+            await OrganizationRepository(session).refresh_stats()
+
     async def add_member(
         self,
         organization_id: str,
@@ -197,7 +219,7 @@ class OrganizationService:
         role: str = "member"
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 membership = await repo.add_member(
                     UUID(organization_id),
@@ -221,7 +243,7 @@ class OrganizationService:
         user_id: str
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 success = await repo.remove_member(UUID(organization_id), UUID(user_id))
                 if not success:
@@ -232,7 +254,7 @@ class OrganizationService:
 
     async def list_members(self, organization_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 members = await repo.get_members(UUID(organization_id))
                 
@@ -255,7 +277,7 @@ class OrganizationService:
         rag_config: Optional[dict] = None
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = OrganizationRepository(session)
                 updated = await repo.update_rag_store(
                     UUID(organization_id),
@@ -3,7 +3,6 @@ from datetime import datetime
 
 from app.db.postgresql import get_db_connection
 from app.repository.project_repository import ProjectRepository
-from app.repository.document_repository import DocumentRepository
 from app.core.response_status import ResponseStatus, OK, NotFound, InternalError
 
 
@@ -41,9 +40,8 @@ class ProjectService:
     ) -> ResponseStatus:
         """Create a new project with RAG configuration."""
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = ProjectRepository(session)
-                doc_repo = DocumentRepository(session)
 
                 project = await repo.create_project(
                     name=name,
@@ -62,17 +60,16 @@ class ProjectService:
                     system_prompt=system_prompt,
                 )
 
+                # A new project has no conversations or documents yet
                 payload = repo.serialize_project(project, include_relations=True)
-                payload["documents"] = [
-                    str(doc.id) for doc in await doc_repo.list_documents_by_project(str(project.id))
-                ]
+                payload["documents"] = []
                 return OK(message="Project created", data=payload)
         except Exception as exc:
             return InternalError(message=f"Failed to create project: {exc}")
 
     async def get_project(self, project_id: str, *, include_relations: bool = True) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = ProjectRepository(session)
                 project = await repo.get_project(project_id, with_relations=include_relations)
                 if not project:
@@ -80,9 +77,7 @@ class ProjectService:
 
                 payload = repo.serialize_project(project, include_relations=include_relations)
                 if include_relations:
-                    payload["documents"] = [
-                        str(doc.id) for doc in await repo.get_project_documents(project_id)
-                    ]
+                    payload["documents"] = await repo.get_project_document_ids(project_id)
                 return OK(data=payload)
         except Exception as exc:
             return InternalError(message=f"Failed to fetch project: {exc}")
@@ -95,7 +90,7 @@ class ProjectService:
         include_relations: bool = False,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = ProjectRepository(session)
                 projects = await repo.list_projects(
                     organization_id=organization_id,
@@ -128,7 +123,7 @@ class ProjectService:
         system_prompt: Optional[str] = None,
     ) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = ProjectRepository(session)
                 updated = await repo.update_project(
                     project_id,
@@ -153,7 +148,7 @@ class ProjectService:
 
     async def delete_project(self, project_id: str) -> ResponseStatus:
         try:
-            async for session in self._get_db().get_session():
+            async with self._get_db().session() as session:
                 repo = ProjectRepository(session)
                 deleted = await repo.delete_project(project_id)
                 if not deleted: